@@ -15,6 +15,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from enum import StrEnum
+import hashlib
 import importlib
 import pkgutil
 import sys
@@ -34,6 +35,7 @@ vtk = lazy.load("vtk")
 
 __all__ = [
     "BASE",
+    "CELL_ARRAY_TYPES",
     "CENTRAL_MERIDIAN",
     "COASTLINES_RESOLUTION",
     "GV_CELL_IDS",
@@ -65,6 +67,7 @@ __all__ = [
     "active_kernel",
     "cast_UnstructuredGrid_to_PolyData",
     "distance",
+    "fingerprint",
     "from_cartesian",
     "get_modules",
     "nan_mask",
@@ -99,6 +102,9 @@ BASE: float = -180.0
 CENTRAL_MERIDIAN: float = 0.0
 """Default central meridian."""
 
+CELL_ARRAY_TYPES: tuple[str, ...] = ("verts", "lines", "polys", "strips")
+"""The names of the :class:`~pyvista.PolyData` cell array types."""
+
 COASTLINES_RESOLUTION: str = "10m"
 """Default Natural Earth coastline resolution."""
 
@@ -400,12 +406,74 @@ def distance(
     return result
 
 
+def fingerprint(
+    mesh: pv.PolyData,
+    /,
+    *,
+    point_data: bool | None = False,
+) -> str:
+    """Compute a digest that uniquely identifies the geometry of the `mesh`.
+
+    The digest is computed from the mesh points and the connectivity of each of
+    its vertex, line, polygon and triangle strip cell arrays. Meshes with the
+    same geometry and topology share the same fingerprint, regardless of their
+    cell data.
+
+    Parameters
+    ----------
+    mesh : :class:`~pyvista.PolyData`
+        The mesh to fingerprint.
+    point_data : bool, default=False
+        Whether the point data arrays of the `mesh` also contribute to the digest.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest of the `mesh`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    def update(name: str, data: ArrayLike) -> None:
+        """Update the digest with the named array.
+
+        Parameters
+        ----------
+        name : str
+            The name of the array.
+        data : ArrayLike
+            The array to be digested.
+
+        """
+        data = np.ascontiguousarray(data)
+        digest.update(f"{name}:{data.dtype.str}:{data.shape}".encode())
+        digest.update(memoryview(data).cast("B"))
+
+    update("points", mesh.points)
+
+    for kind in CELL_ARRAY_TYPES:
+        cells = getattr(mesh, f"Get{kind.capitalize()}")()
+        update(f"{kind}.offsets", pv.convert_array(cells.GetOffsetsArray()))
+        update(f"{kind}.connectivity", pv.convert_array(cells.GetConnectivityArray()))
+
+    if point_data:
+        for name in sorted(mesh.point_data.keys()):
+            update(f"point_data.{name}", mesh.point_data[name])
+
+    return digest.hexdigest()
+
+
 def from_cartesian(
     mesh: pv.PolyData,
     /,
     *,
     stacked: bool | None = True,
     closed_interval: bool | None = False,
+    meridian: float | None = None,
     rtol: float | None = None,
     atol: float | None = None,
 ) -> np.ndarray:
@@ -423,6 +491,12 @@ def from_cartesian(
         Longitude values will be in the half-closed interval [-180, 180). However,
         if the mesh has a seam at the 180th meridian and `closed_interval`
         is ``True``, then longitudes will be in the closed interval [-180, 180].
+    meridian : float, optional
+        The meridian (degrees longitude) that the resultant longitudes are
+        relative to. A mesh with a seam along the anti-meridian of `meridian`
+        will have that seam at the 180th meridian of the relative longitudes.
+        The `mesh` is not modified. Defaults to
+        :data:`CENTRAL_MERIDIAN`.
     rtol : float, optional
         The relative tolerance for longitudes close to the 'wrap meridian' -
         see :func:`geovista.common.wrap` for more.
@@ -444,7 +518,12 @@ def from_cartesian(
     radius = distance(mesh, mean=not cloud)
 
     lons, lats = to_lonlats(
-        mesh.points, radius=radius, stacked=False, rtol=rtol, atol=atol
+        mesh.points,
+        radius=radius,
+        stacked=False,
+        meridian=meridian,
+        rtol=rtol,
+        atol=atol,
     )
 
     zlevel = np.zeros_like(lons)
@@ -479,6 +558,9 @@ def from_cartesian(
         ):
             # unfold polar end-points of a meridian i.e., a line of constant longitude
             lons[0] = lons[-1] = lons[1]
+        elif mesh.n_lines and mesh.n_lines == mesh.n_cells:
+            # unfold polar end-points of many lines e.g., a graticule of meridians
+            _unfold_polar_lines(mesh, lons, pole_pids)
         else:
             pole_submesh = mesh.extract_points(pole_pids)
             if pole_submesh.n_cells:
@@ -986,6 +1068,7 @@ def to_lonlats(
     radians: bool | None = False,
     radius: float | ArrayLike | None = None,
     stacked: bool | None = True,
+    meridian: float | None = None,
     rtol: float | None = None,
     atol: float | None = None,
 ) -> np.ndarray:
@@ -1004,6 +1087,10 @@ def to_lonlats(
         points with shape ``(N, 3)``. Defaults to :data:`RADIUS`.
     stacked : bool, default=True
         Default the resultant shape to be ``(N, 2)``, otherwise ``(2, N)``.
+    meridian : float, optional
+        The meridian (degrees longitude) that the resultant longitudes are
+        relative to i.e., longitudes are offset by ``-meridian`` before being
+        wrapped. Defaults to :data:`CENTRAL_MERIDIAN`.
     rtol : float, optional
         The relative tolerance for longitudes close to the 'wrap meridian' -
         see :func:`geovista.common.wrap` for more.
@@ -1049,6 +1136,10 @@ def to_lonlats(
     lons = np.arctan2(points[:, 1], points[:, 0])
     if not radians:
         lons = np.degrees(lons)
+    if meridian:
+        # offset the longitudes rather than rotating the points, which
+        # avoids mutating or copying the caller's points
+        lons -= np.radians(meridian) if radians else meridian
     lons = wrap(lons, base=base, period=period, rtol=rtol, atol=atol)
 
     z_radius = points[:, 2] / radius_array
@@ -1067,6 +1158,53 @@ def to_lonlats(
     return np.vstack(data).T if stacked else np.array(data)
 
 
+def _unfold_polar_lines(
+    mesh: pv.PolyData, lons: np.ndarray, pole_pids: np.ndarray
+) -> None:
+    """Unfold the longitudes of the polar points of a line mesh in-place.
+
+    A polar point only connected to non-polar points of the same longitude
+    adopts that longitude, otherwise its longitude is unaltered.
+
+    Parameters
+    ----------
+    mesh : :class:`~pyvista.PolyData`
+        The line mesh.
+    lons : :class:`~numpy.ndarray`
+        The longitudes (degrees) of the mesh points, which are updated in-place.
+    pole_pids : :class:`~numpy.ndarray`
+        The indices of the mesh points at the poles.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    lines = mesh.GetLines()
+    offsets = pv.convert_array(lines.GetOffsetsArray())
+    connectivity = pv.convert_array(lines.GetConnectivityArray())
+
+    # the segments between consecutive points of each line
+    valid = np.ones(max(connectivity.size - 1, 0), dtype=bool)
+    valid[offsets[1:-1] - 1] = False
+    starts, ends = connectivity[:-1][valid], connectivity[1:][valid]
+    pids = np.concatenate([starts, ends])
+    neighbours = np.concatenate([ends, starts])
+
+    pole = np.zeros(mesh.n_points, dtype=bool)
+    pole[pole_pids] = True
+    mask = pole[pids] & ~pole[neighbours]
+
+    if np.any(mask):
+        pids, neighbours = pids[mask], lons[neighbours[mask]]
+        lower = np.full(mesh.n_points, np.inf)
+        upper = np.full(mesh.n_points, -np.inf)
+        np.minimum.at(lower, pids, neighbours)
+        np.maximum.at(upper, pids, neighbours)
+        (unfold,) = np.nonzero(np.isfinite(lower) & np.isclose(lower, upper))
+        lons[unfold] = lower[unfold]
+
+
 def _face_offsets(surface: pv.PolyData) -> np.ndarray:
     """Determine the face offsets of the provided mesh.
 
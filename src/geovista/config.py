@@ -41,10 +41,17 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+import warnings
 
 from platformdirs import user_cache_dir
 
-__all__ = ["GEOVISTA_DISABLE_PLOT_THEME", "GEOVISTA_IMAGE_TESTING", "resources"]
+__all__ = [
+    "GEOVISTA_DISABLE_PLOT_THEME",
+    "GEOVISTA_IMAGE_TESTING",
+    "GEOVISTA_TRANSFORM_CHUNK_SIZE",
+    "GEOVISTA_TRANSFORM_WORKERS",
+    "resources",
+]
 
 # see https://specifications.freedesktop.org/basedir/latest/
 
@@ -80,3 +87,56 @@ GEOVISTA_IMAGE_TESTING: bool = (
     os.environ.get("GEOVISTA_IMAGE_TESTING", "false").lower() != "false"
 )
 """Developer environment variable to control image testing render and theme."""
+
+
+def _positive_int(name: str, default: int) -> int:
+    """Get the positive integer value of an environment variable.
+
+    A missing value, or a value that is not a positive integer, results in
+    the `default`. A warning is issued for an invalid value, rather than
+    preventing :mod:`geovista` from being imported.
+
+    Parameters
+    ----------
+    name : str
+        The name of the environment variable.
+    default : int
+        The default value of the environment variable.
+
+    Returns
+    -------
+    int
+        The value of the environment variable.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    value = os.environ.get(name, str(default))
+
+    try:
+        result = int(value)
+    except ValueError:
+        result = 0
+
+    if result < 1:
+        wmsg = (
+            f"geovista ignoring invalid environment variable {name}={value!r}, "
+            f"expected a positive integer. Defaulting to {default}."
+        )
+        warnings.warn(wmsg, stacklevel=2)
+        result = default
+
+    return result
+
+
+GEOVISTA_TRANSFORM_CHUNK_SIZE: int = _positive_int(
+    "GEOVISTA_TRANSFORM_CHUNK_SIZE", 2**20
+)
+"""Environment variable to control the number of points per projection chunk."""
+
+GEOVISTA_TRANSFORM_WORKERS: int = _positive_int(
+    "GEOVISTA_TRANSFORM_WORKERS", os.cpu_count() or 1
+)
+"""Environment variable to control the number of projection worker threads."""
@@ -131,6 +131,9 @@ class MeridianSlice:  # numpydoc ignore=PR01
             emsg = "Cannot slice a mesh that has been projected."
             raise ValueError(emsg)
 
+        # attach the tracking arrays to a shallow copy, leaving the caller's
+        # mesh untouched
+        mesh = mesh.copy(deep=False)
         self._info = mesh.active_scalars_info
         mesh[GV_CELL_IDS] = np.arange(mesh.n_cells)
         mesh[GV_POINT_IDS] = np.arange(mesh.n_points)
@@ -281,6 +284,8 @@ def add_texture_coords(
 
     Note that the mesh will be sliced along the `meridian` to ensure that
     cell connectivity is appropriately disconnected prior to texture mapping.
+    The texture coordinates are relative to the anti-meridian of the slice,
+    such that the slice is coincident with the edge of the texture.
 
     Parameters
     ----------
@@ -319,8 +324,9 @@ def add_texture_coords(
     else:
         mesh = mesh.copy(deep=True)
 
-    # convert from cartesian xyz to spherical lat/lons
-    lonlat = from_cartesian(mesh, closed_interval=True)
+    # convert from cartesian xyz to spherical lat/lons, relative to the
+    # anti-meridian of the slice
+    lonlat = from_cartesian(mesh, closed_interval=True, meridian=meridian + 180)
     lons, lats = lonlat[:, 0], lonlat[:, 1]
     # convert to normalised UV space
     u_coord = (lons + 180) / 360
@@ -645,7 +651,7 @@ def slice_cells(
     slicer = MeridianSlice(mesh, meridian=meridian)
     mesh_whole = slicer.extract(split_cells=False)
     mesh_split = slicer.extract(split_cells=True)
-    result: pv.PolyData = mesh.copy(deep=True)
+    result: pv.PolyData = slicer.mesh.copy(deep=True)
 
     meshes = []
     remeshed_ids = np.array([], dtype=int)
@@ -717,6 +723,7 @@ def slice_lines(
     *,
     n_points: int | None = None,
     copy: bool | None = False,
+    meridian: float | None = None,
 ) -> pv.PolyData:
     """Cut a line-based mesh along the Antimeridian, breaking line connectivity.
 
@@ -745,6 +752,10 @@ def slice_lines(
     copy : bool, default=False
         Return a deepcopy of the ``mesh`` when there are no points of intersection with
         the Antimeridian. Otherwise, the original ``mesh`` is returned.
+    meridian : float, optional
+        The meridian (degrees longitude) whose anti-meridian is the slice i.e.,
+        the central meridian of a target projection. The ``mesh`` is not
+        rotated. Defaults to :data:`geovista.common.CENTRAL_MERIDIAN`.
 
     Returns
     -------
@@ -771,9 +782,14 @@ def slice_lines(
         wmsg = f"geovista ignoring 'n_points={n_points}', defaulting to 'n_points=1'."
         warnings.warn(wmsg, stacklevel=2)
 
+    if meridian is None:
+        meridian = CENTRAL_MERIDIAN
+
+    meridian = wrap(meridian)[0]
+
     # check whether the line is completely aligned with the slice plane
     # that passes through the anti-meridian
-    lonlat = from_cartesian(mesh)
+    lonlat = from_cartesian(mesh, meridian=meridian)
     antimeridian = np.isclose(np.abs(lonlat[:, 0]), 180)
 
     # nop - all points intersect
@@ -784,9 +800,11 @@ def slice_lines(
 
     radius = distance(mesh)
     line = pv.Line(pointa=(radius, 0, 0), pointb=(-radius, 0, 0))
+    if meridian:
+        line.rotate_z(meridian, inplace=True)
     spline = pv.Spline(line.points, n_points=n_points + 2)
     intersection = mesh.slice_along_line(spline)
-    lonlat = from_cartesian(intersection)
+    lonlat = from_cartesian(intersection, meridian=meridian)
     antimeridian = np.isclose(np.abs(lonlat[:, 0]), 180)
 
     # nop - there are no points of intersection
@@ -898,6 +916,7 @@ def slice_mesh(
     mesh: pv.PolyData,
     /,
     *,
+    meridian: float | None = None,
     rtol: float | None = None,
     atol: float | None = None,
 ) -> pv.PolyData:
@@ -914,6 +933,10 @@ def slice_mesh(
     ----------
     mesh : :class:`~pyvista.PolyData`
         The mesh that requires to be sliced.
+    meridian : float, optional
+        The meridian (degrees longitude) whose anti-meridian is the slice i.e.,
+        the central meridian of a target projection. The `mesh` is not
+        rotated. Defaults to :data:`geovista.common.CENTRAL_MERIDIAN`.
     rtol : float, optional
         The relative tolerance for longitudes close to the 'wrap meridian' -
         see :func:`geovista.common.wrap` for more.
@@ -936,8 +959,10 @@ def slice_mesh(
         raise ValueError(emsg)
 
     if mesh.n_lines:
-        result = slice_lines(mesh, copy=True)
+        result = slice_lines(mesh, copy=True, meridian=meridian)
     else:
-        result = slice_cells(mesh, antimeridian=True, rtol=rtol, atol=atol)
+        result = slice_cells(
+            mesh, meridian=meridian, antimeridian=True, rtol=rtol, atol=atol
+        )
 
     return result
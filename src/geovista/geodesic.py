@@ -13,11 +13,13 @@ Notes
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 import warnings
 
 import lazy_loader as lazy
 
+import geovista.config as gvc
+
 from .common import (
     GV_FIELD_RADIUS,
     GV_MANIFOLD_CELL_IDS,
@@ -25,28 +27,31 @@ from .common import (
     ZLEVEL_SCALE,
     StrEnumPlus,
     distance,
+    fingerprint,
     to_cartesian,
     wrap,
 )
 from .common import cast_UnstructuredGrid_to_PolyData as cast
 from .crs import WGS84, CRSLike, from_wkt, to_wkt
-from .transform import transform_mesh, transform_points
+from .transform import _map_chunks, transform_mesh, transform_points
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
-
     import numpy as np
     from numpy.typing import ArrayLike
     import pyproj
     import pyvista as pv
+    import shapely
 
 # lazy import third-party dependencies
 np = lazy.load("numpy")
 pyproj = lazy.load("pyproj")
 pv = lazy.load("pyvista")
+shapely = lazy.load("shapely")
 
 __all__ = [
     "BBOX_C",
+    "BBOX_CACHE_SIZE",
+    "BBOX_ENGINE",
     "BBOX_OUTSIDE",
     "BBOX_RADIUS_RATIO",
     "BBOX_TOLERANCE",
@@ -60,8 +65,11 @@ __all__ = [
     "PREFERENCE",
     "BBox",
     "Corners",
+    "EnclosedEngine",
     "EnclosedPreference",
+    "Region",
     "line",
+    "lines",
     "npoints",
     "npoints_by_idx",
     "panel",
@@ -82,6 +90,12 @@ GEODESIC_NPTS: int = 64
 BBOX_C: int = 256
 """The bounding-box face geometry will contain ``BBOX_C**2`` cells."""
 
+BBOX_CACHE_SIZE: int = 8
+"""The maximum number of cached bounding-box meshes and enclosed surfaces."""
+
+BBOX_ENGINE: str = "analytic"
+"""The default bounding-box enclosed engine."""
+
 BBOX_OUTSIDE: bool = False
 """Preference for selecting sample points outside/inside bounding-box."""
 
@@ -133,6 +147,33 @@ N_PANELS: int = len(PANEL_IDX_BY_NAME)
 PREFERENCE: str = "center"
 """The default bounding-box preference."""
 
+_GEODESIC_CHUNK_SIZE: int = 2**16
+"""The number of geodesic points per batched sampling chunk."""
+
+_REGION_BOUNDARY_STEP: float = 1.0
+"""The maximum angle (degrees) between the points of a region boundary edge."""
+
+_REGION_BUCKET_EDGES: int = 8
+"""The mean number of region edges per longitude bucket of the edge index."""
+
+_REGION_CHUNK_SIZE: int = 2**20
+"""The number of point and edge pairs per region containment chunk."""
+
+
+class EnclosedEngine(StrEnumPlus):
+    """Enumeration of bounding-box enclosed engines.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    ANALYTIC = "analytic"
+    """Enclosed by the great-circle half-spaces of the bounding-box edges."""
+    MANIFOLD = "manifold"
+    """Enclosed by the interior of the extruded bounding-box manifold."""
+
 
 class EnclosedPreference(StrEnumPlus):
     """Enumeration of mesh geometry enclosed preferences.
@@ -251,8 +292,20 @@ class BBox:  # numpydoc ignore=PR01
         """Whether the bounding-box faces are triangulated."""
         # the resultant bounding-box mesh
         self._mesh: pv.PolyData | None = None
+        # the bounding-box mesh of each surface radius, as an optimisation
+        self._meshes: dict[float, pv.PolyData] = {}
+        # the radius independent bounding-box mesh faces
+        self._bbox_faces: np.ndarray | None = None
+        # the enclosed point classification of each surface, as an optimisation
+        self._classified: dict[
+            tuple[Any, ...], tuple[np.ndarray, np.ndarray | None]
+        ] = {}
         # the bounding-box mesh edges
         self._outline: pv.PolyData | None = None
+        # the bounding-box side half-spaces of the analytic engine
+        self._sides: tuple[np.ndarray, ...] | None = None
+        # enclosed engine for containment of points
+        self._engine = EnclosedEngine(BBOX_ENGINE)
         # enclosed preference for points outside/inside manifold
         self._outside = BBOX_OUTSIDE
         # enclosed cell preference
@@ -469,6 +522,44 @@ class BBox:  # numpydoc ignore=PR01
             self._outline = self.mesh.extract_feature_edges()
         return self._outline
 
+    @property
+    def engine(self) -> EnclosedEngine:
+        """The engine that determines containment within the bounding-box.
+
+        Returns
+        -------
+        EnclosedEngine
+            The bounding-box enclosed engine.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return self._engine
+
+    @engine.setter
+    def engine(self, value: str | EnclosedEngine | None) -> None:
+        """Set the engine that determines containment within the bounding-box.
+
+        Parameters
+        ----------
+        value : str or EnclosedEngine
+            The bounding-box enclosed engine.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if value is not None:
+            if not EnclosedEngine.valid(value):
+                options = " or ".join(f"{item!r}" for item in EnclosedEngine.values())
+                emsg = f"Expected an engine of {options}, got '{value}'."
+                raise ValueError(emsg)
+
+            self._engine = EnclosedEngine(value)
+
     @property
     def outside(self) -> bool:
         """The preference to select points outside/inside the bounding-box.
@@ -587,8 +678,8 @@ class BBox:  # numpydoc ignore=PR01
 
         """
         self._idx_map = np.empty((self.c + 1, self.c + 1), dtype=int)
-        self._bbox_lons: list[float] = []
-        self._bbox_lats: list[float] = []
+        self._bbox_lons: np.ndarray = np.empty(0)
+        self._bbox_lats: np.ndarray = np.empty(0)
         self._bbox_count = 0
         self._geod = pyproj.Geod(ellps=self.ellps)
         self._npts = self.c - 1
@@ -626,6 +717,141 @@ class BBox:  # numpydoc ignore=PR01
             ]
         )
 
+    def _classify(
+        self, surface: pv.PolyData, *, center: bool
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        """Determine the points or cell centers of the surface within the bounding-box.
+
+        Parameters
+        ----------
+        surface : PolyData
+            The :class:`~pyvista.PolyData` mesh to be checked for containment.
+        center : bool
+            Whether to classify the cell centers rather than the points of the
+            `surface`.
+
+        Returns
+        -------
+        tuple of ndarray
+            The boolean mask of the enclosed `surface` points or cell centers,
+            and the cell-ids of the cell centers if the `surface` was transformed,
+            otherwise ``None``.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        surface, cids = _surface(surface, center=center)
+
+        if self.engine == EnclosedEngine.ANALYTIC and (
+            (enclosed := self._enclosed_points(surface)) is not None
+        ):
+            return enclosed, cids
+
+        self._generate_bbox_mesh(surface=surface)
+
+        # filter the surface with the bbox manifold mesh
+        selected = surface.select_interior_points(
+            self.mesh,
+            method="cell_locator",
+            locator_tolerance=self.tolerance,
+            inside_out=False,
+            check_surface=False,
+        )
+
+        return np.asarray(selected["selected_points"], dtype=bool), cids
+
+    def _enclosed_points(self, surface: pv.PolyData) -> np.ndarray | None:
+        """Determine the points of the surface within the bounding-box.
+
+        The points are enclosed if within the radial shell of the bounding-box
+        manifold and on the inside of each side of the bounding-box, as
+        constructed by :meth:`_generate_bbox_sides`.
+
+        Parameters
+        ----------
+        surface : PolyData
+            The :class:`~pyvista.PolyData` mesh to be checked for containment.
+
+        Returns
+        -------
+        ndarray or None
+            The boolean mask of the enclosed `surface` points, or ``None`` if
+            the bounding-box has no convex corners.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if self._sides is None:
+            self._generate_bbox_sides()
+
+        if not self._sides:
+            return None
+
+        normals, bands, bases, thetas, segments = self._sides
+        radius = float(distance(surface)) if surface.n_points else RADIUS
+        offset = radius * BBOX_RADIUS_RATIO
+
+        points = np.asarray(surface.points, dtype=float)
+        norm = np.linalg.norm(points, axis=1)
+        result: np.ndarray = (norm > radius - offset) & (norm < radius + offset)
+        xyz = points / np.where(norm > 0, norm, 1)[:, np.newaxis]
+
+        for side in range(4):
+            dot = xyz @ normals[side]
+            inside = dot > bands[side]
+            # the points within the band of the side require the spanning segment
+            band = np.flatnonzero(result & (np.abs(dot) <= bands[side]))
+            if band.size:
+                near = xyz[band]
+                theta = np.arctan2(near @ bases[side, 1], near @ bases[side, 0])
+                idxs = np.searchsorted(thetas[side], theta).clip(1, self.c) - 1
+                inside[band] = np.einsum("ij,ij->i", near, segments[side, idxs]) > 0
+            result &= inside
+
+        return result
+
+    def _generate_bbox_edges(self, geod: pyproj.Geod) -> tuple[np.ndarray, np.ndarray]:
+        """Calculate the geodesic points of the bounding-box edges.
+
+        The edges are the first and last rows of the bounding-box face, from
+        the first to the second corner and from the fourth to the third corner,
+        then the first and last columns, from the first to the fourth corner
+        and from the second to the third corner. The corners are excluded.
+
+        Parameters
+        ----------
+        geod : Geod
+            The definition of the ellipsoid for geodesic calculations.
+
+        Returns
+        -------
+        tuple of ndarray
+            The longitudes and latitudes of the edge points, each of shape
+            ``(4, c - 1)``.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        lons = np.asarray(self.lons, dtype=float)
+        lats = np.asarray(self.lats, dtype=float)
+        start_idx = np.array([0, 3, 0, 1])
+        end_idx = np.array([1, 2, 3, 2])
+
+        return _npoints(
+            lons[start_idx],
+            lats[start_idx],
+            lons[end_idx],
+            lats[end_idx],
+            npts=self.c - 1,
+            geod=geod,
+        )
+
     def _generate_bbox_face(self) -> None:
         """Construct 2D geodetic bounding-box surface defined by corners.
 
@@ -638,6 +864,10 @@ class BBox:  # numpydoc ignore=PR01
         (_bbox_lon/_bbox_lat), and together are required to create the
         resultant bounding-box :class:`~pyvista.PolyData` mesh.
 
+        The geodesic points of the four bounding-box edges are sampled in one
+        batch, followed by one batch of the inner rows that span between the
+        points of the first and last bounding-box columns.
+
         Notes
         -----
         .. versionadded:: 0.1.0
@@ -645,75 +875,33 @@ class BBox:  # numpydoc ignore=PR01
         """
         # corner indices
         c1_idx, c2_idx, c3_idx, c4_idx = range(4)
+        lons = np.asarray(self.lons, dtype=float)
+        lats = np.asarray(self.lats, dtype=float)
+        npts = self._npts
+
+        # the first and last rows, then the first and last columns
+        edge_lons, edge_lats = self._generate_bbox_edges(self._geod)
+        edge_idxs = 4 + np.arange(4 * npts).reshape(4, npts)
+        self._idx_map[0] = [c1_idx, *edge_idxs[0], c2_idx]
+        self._idx_map[-1] = [c4_idx, *edge_idxs[1], c3_idx]
+        self._idx_map[:, 0] = [c1_idx, *edge_idxs[2], c4_idx]
+        self._idx_map[:, -1] = [c2_idx, *edge_idxs[3], c3_idx]
+
+        # the inner rows, between the first and last columns
+        inner_lons, inner_lats = _npoints(
+            edge_lons[2],
+            edge_lats[2],
+            edge_lons[3],
+            edge_lats[3],
+            npts=npts,
+            geod=self._geod,
+        )
+        inner_idxs = 4 * (npts + 1) + np.arange(npts * npts).reshape(npts, npts)
+        self._idx_map[1:-1, 1:-1] = inner_idxs
 
-        def bbox_extend(lons: Sequence[float], lats: Sequence[float]) -> None:
-            """Register the bounding box longitudes and latitudes.
-
-            Parameters
-            ----------
-            lons : iterable of float
-                The bounding box longitudes.
-            lats : iterable of float
-                The bounding box latitudes.
-
-            """
-            assert len(lons) == len(lats)
-            self._bbox_lons.extend(lons)
-            self._bbox_lats.extend(lats)
-            self._bbox_count += len(lons)
-
-        def bbox_update(
-            idx1: int, idx2: int, row: int | None = None, column: int | None = None
-        ) -> None:
-            """Generate and register a sampled geodesic bounding box line.
-
-            The line is either a row or column that is a bounding box edge, or
-            a row or column that traverses across the surface of the bounding box.
-
-            Parameters
-            ----------
-            idx1 : int
-                The start index of the bounding box, located on an edge.
-            idx2 : int
-                The end index of the bounding box, located on an edge.
-            row : int, optional
-                The index of the bounding box row. If not provided, the column spans
-                all rows.
-            column : int, optional
-                The index of the bounding box column. If not provided, the row spans
-                all columns.
-
-            """
-            assert row is not None or column is not None
-            row_slice = np.s_[:] if row is None else np.s_[row]
-            column_slice = np.s_[:] if column is None else np.s_[column]
-
-            glons, glats = npoints_by_idx(
-                self._bbox_lons,
-                self._bbox_lats,
-                start_idx=idx1,
-                end_idx=idx2,
-                npts=self._npts,
-                geod=self._geod,
-            )
-            self._idx_map[row_slice, column_slice] = [
-                idx1,
-                *(np.arange(self._npts) + self._bbox_count),
-                idx2,
-            ]
-            bbox_extend(glons, glats)
-
-        # register bbox edge indices, and points
-        bbox_extend(self.lons, self.lats)
-        bbox_update(c1_idx, c2_idx, row=0)
-        bbox_update(c4_idx, c3_idx, row=-1)
-        bbox_update(c1_idx, c4_idx, column=0)
-        bbox_update(c2_idx, c3_idx, column=-1)
-
-        # register bbox inner indices and points
-        for row_idx in range(1, self.c):
-            row_idx_map = self._idx_map[row_idx]
-            bbox_update(row_idx_map[0], row_idx_map[-1], row=row_idx)
+        self._bbox_lons = np.concatenate([lons, edge_lons.ravel(), inner_lons.ravel()])
+        self._bbox_lats = np.concatenate([lats, edge_lats.ravel(), inner_lats.ravel()])
+        self._bbox_count = self._bbox_lons.size
 
     def _generate_bbox_mesh(
         self, surface: pv.PolyData | None = None, *, radius: float | None = None
@@ -751,53 +939,116 @@ class BBox:  # numpydoc ignore=PR01
         radius = RADIUS if radius is None else abs(float(radius))
 
         if radius != self._surface_radius:
-            self._init()
+            if (mesh := self._meshes.get(radius)) is None:
+                if self._bbox_faces is None:
+                    self._init()
+                    self._generate_bbox_face()
+                    skirt_faces = self._generate_bbox_skirt()
+
+                    # generate the face indices
+                    bbox_n_faces = self._n_faces * 2
+                    faces_n = np.broadcast_to(
+                        np.array([4], dtype=np.int8), (bbox_n_faces, 1)
+                    )
+                    faces_c1 = np.ravel(self._idx_map[: self.c, : self.c])
+                    faces_c2 = np.ravel(self._idx_map[: self.c, 1:])
+                    faces_c3 = np.ravel(self._idx_map[1:, 1:])
+                    faces_c4 = np.ravel(self._idx_map[1:, : self.c])
+                    inner_faces = np.stack(
+                        [faces_c1, faces_c2, faces_c3, faces_c4], axis=1
+                    )
+                    outer_faces = inner_faces + self._n_points
+                    faces = np.vstack([inner_faces, outer_faces])
+
+                    # include the bbox skirt
+                    self._bbox_faces = np.vstack(
+                        [np.hstack([faces_n, faces]), skirt_faces]
+                    )
+
+                # calculate the radii of the inner and outer bbox faces
+                offset = radius * BBOX_RADIUS_RATIO
+                inner_radius = radius - offset
+                outer_radius = radius + offset
+
+                # generate the face points
+                inner_xyz = to_cartesian(
+                    self._bbox_lons, self._bbox_lats, radius=inner_radius
+                )
+                outer_xyz = to_cartesian(
+                    self._bbox_lons, self._bbox_lats, radius=outer_radius
+                )
+                bbox_xyz = np.vstack([inner_xyz, outer_xyz])
+
+                # create the bbox mesh
+                mesh = pv.PolyData(bbox_xyz, faces=self._bbox_faces)
+
+                mesh.field_data[GV_FIELD_RADIUS] = np.array([radius])
+                to_wkt(mesh, WGS84)
+
+                if self.triangulate:
+                    mesh = mesh.triangulate()
+
+                _cache(self._meshes, radius, mesh)
+
+            self._mesh = mesh
+            self._outline = None
             self._surface_radius = radius
 
-            self._generate_bbox_face()
-            skirt_faces = self._generate_bbox_skirt()
-
-            # generate the face indices
-            bbox_n_faces = self._n_faces * 2
-            faces_n = np.broadcast_to(np.array([4], dtype=np.int8), (bbox_n_faces, 1))
-            faces_c1 = np.ravel(self._idx_map[: self.c, : self.c]).reshape(-1, 1)
-            faces_c2 = np.ravel(self._idx_map[: self.c, 1:]).reshape(-1, 1)
-            faces_c3 = np.ravel(self._idx_map[1:, 1:]).reshape(-1, 1)
-            faces_c4 = np.ravel(self._idx_map[1:, : self.c]).reshape(-1, 1)
-            inner_faces = np.hstack([faces_c1, faces_c2, faces_c3, faces_c4])
-            outer_faces = inner_faces + self._n_points
-            faces = np.vstack([inner_faces, outer_faces])
-            bbox_faces = np.hstack([faces_n, faces])
-
-            # convert bbox lons/lats to ndarray (internal convenience i.e., boundary)
-            self._bbox_lons = np.asanyarray(self._bbox_lons)
-            self._bbox_lats = np.asanyarray(self._bbox_lats)
-
-            # calculate the radii of the inner and outer bbox faces
-            offset = self._surface_radius * BBOX_RADIUS_RATIO
-            inner_radius = self._surface_radius - offset
-            outer_radius = self._surface_radius + offset
-
-            # generate the face points
-            inner_xyz = to_cartesian(
-                self._bbox_lons, self._bbox_lats, radius=inner_radius
-            )
-            outer_xyz = to_cartesian(
-                self._bbox_lons, self._bbox_lats, radius=outer_radius
-            )
-            bbox_xyz = np.vstack([inner_xyz, outer_xyz])
+    def _generate_bbox_sides(self) -> None:
+        """Construct the great-circle half-spaces of the bounding-box sides.
+
+        Each side of the bounding-box boundary is a sequence of geodesic points
+        joined by great-circle segments, which are the faces of the skirt of the
+        bounding-box manifold. A point is on the inside of a side if it is
+        beyond the band about the great-circle through the side corners that
+        contains the side, or within the band and on the inside of the segment
+        that spans the point.
 
-            # include the bbox skirt
-            bbox_faces = np.vstack([bbox_faces, skirt_faces])
+        The half-spaces are only defined for a bounding-box with convex corners,
+        otherwise there are no sides (_sides).
 
-            # create the bbox mesh
-            self._mesh = pv.PolyData(bbox_xyz, faces=bbox_faces)
+        Notes
+        -----
+        .. versionadded:: 0.6.0
 
-            self._mesh.field_data[GV_FIELD_RADIUS] = np.array([radius])
-            to_wkt(self._mesh, WGS84)
+        """
+        edge_lons, edge_lats = self._generate_bbox_edges(pyproj.Geod(ellps=self.ellps))
+        lons = np.asarray(self.lons, dtype=float)
+        lats = np.asarray(self.lats, dtype=float)
+
+        # the sides from each corner to the next, in boundary order
+        order, reverse = [0, 3, 1, 2], [False, False, True, True]
+        side_lons, side_lats = [], []
+        for idx, (row, flip) in enumerate(zip(order, reverse, strict=True)):
+            step = -1 if flip else 1
+            end = (idx + 1) % 4
+            side_lons.append([lons[idx], *edge_lons[row, ::step], lons[end]])
+            side_lats.append([lats[idx], *edge_lats[row, ::step], lats[end]])
+
+        npts = self.c + 1
+        xyz = to_cartesian(np.ravel(side_lons), np.ravel(side_lats), radius=1.0)
+        xyz = xyz.reshape(4, npts, 3)
+        segments = np.cross(xyz[:, :-1], xyz[:, 1:])
+
+        # the turn at each corner, from the last segment of the prior side
+        turns = np.einsum("ij,ij->i", segments[:, -1], np.roll(xyz[:, 1], -1, axis=0))
+        sign = np.sign(turns[0])
+
+        if sign == 0 or np.any(np.sign(turns) != sign):
+            self._sides = ()
+            return
+
+        # the great-circle through the corners of each side
+        normals = np.cross(xyz[:, 0], xyz[:, -1])
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+        bases = np.stack([xyz[:, 0], np.cross(normals, xyz[:, 0])], axis=1)
+        thetas = np.arctan2(
+            np.einsum("ijk,ik->ij", xyz, bases[:, 1]),
+            np.einsum("ijk,ik->ij", xyz, bases[:, 0]),
+        )
+        bands = np.abs(np.einsum("ijk,ik->ij", xyz, normals)).max(axis=1)
 
-            if self.triangulate:
-                self._mesh = self._mesh.triangulate()
+        self._sides = (normals * sign, bands, bases, thetas, segments * sign)
 
     def _generate_bbox_skirt(self) -> np.ndarray:
         """Calculate indices of faces for boundary-box skirt.
@@ -898,6 +1149,7 @@ class BBox:  # numpydoc ignore=PR01
         tolerance: float | None = None,
         outside: bool | None = None,
         preference: str | EnclosedPreference | None = None,
+        engine: str | EnclosedEngine | None = None,
     ) -> pv.PolyData:
         """Extract region of the `surface` contained within the bounding-box.
 
@@ -905,6 +1157,15 @@ class BBox:  # numpydoc ignore=PR01
         considered within the bounding-box. See the `preference` and `tolerance`
         options.
 
+        The ``analytic`` `engine` decides containment exactly with the sign of
+        the dot product of each point with the great-circle normals of the
+        bounding-box boundary segments, which are the faces of the skirt of the
+        bounding-box manifold, without generating the manifold. Note that the
+        inner and outer faces of the manifold are approximated by spheres.
+        The ``manifold`` `engine` selects the points within the bounding-box
+        manifold with :meth:`~pyvista.DataSetFilters.select_interior_points`,
+        and is always used for a bounding-box without convex corners.
+
         Parameters
         ----------
         surface : PolyData
@@ -926,6 +1187,11 @@ class BBox:  # numpydoc ignore=PR01
             face cell center is within the bounding-box. A `preference` of
             ``point`` requires at least one point that defines the face to be
             within the bounding-box. Defaults to :data:`PREFERENCE`.
+        engine : str or EnclosedEngine, optional
+            The engine that determines whether the points of the `surface` are
+            within the bounding-box, either ``analytic`` or ``manifold``. Note
+            that the `tolerance` only applies to the ``manifold`` engine.
+            Defaults to :data:`BBOX_ENGINE`.
 
         Returns
         -------
@@ -974,160 +1240,678 @@ class BBox:  # numpydoc ignore=PR01
         >>> p.show()
 
         """
-        original = surface
-
         self.tolerance = tolerance
         self.outside = outside
         self.preference = preference
+        self.engine = engine
+
+        # the classification of the surface is independent of the outside preference,
+        # and shared by the cell and point preferences
+        center = self.preference == EnclosedPreference.CENTER
+        key = (
+            fingerprint(surface),
+            from_wkt(surface),
+            center,
+            self.engine,
+            self.tolerance,
+        )
 
-        # capture the current active scalars name
-        active_scalars_name = surface.active_scalars_name
+        if (classified := self._classified.get(key)) is None:
+            classified = self._classify(surface, center=center)
+            _cache(self._classified, key, classified)
 
-        crs = from_wkt(surface)
+        enclosed, cids = classified
 
-        if crs is not None:
-            if transformed := crs != WGS84:
-                if self.preference == EnclosedPreference.CENTER:
-                    surface[GV_MANIFOLD_CELL_IDS] = np.arange(surface.n_cells)
+        return _extract(
+            surface, enclosed ^ self.outside, cids, preference=self.preference
+        )
 
-                surface = transform_mesh(surface, tgt_crs=WGS84)
-        else:
-            # assume we have a raw mesh with cartesian points
-            transformed = False
 
-        # perform after transformation to avoid cloud specific transform behaviour
-        if self.preference == EnclosedPreference.CENTER:
-            surface = surface.cell_centers()
+class Region:  # numpydoc ignore=PR01
+    """A spherical polygon region, with one or more parts and holes."""
 
-        self._generate_bbox_mesh(surface=surface)
+    def __init__(self, geometry: object, /, *, crs: CRSLike | None = WGS84) -> None:
+        """Create a spherical polygon region to extract enclosed mesh, lines or points.
 
-        # filter the surface with the bbox manifold mesh
-        selected = surface.select_interior_points(
-            self.mesh,
-            method="cell_locator",
-            locator_tolerance=self.tolerance,
-            inside_out=self.outside,
-            check_surface=False,
-        )
-        # name of the point mask generated by select_interior_points
-        scalars = "selected_points"
-
-        # sample the surface with the enclosed cells to extract the bbox region
-        if self.preference == EnclosedPreference.CENTER:
-            mask = selected[scalars]
-            idxs = surface[GV_MANIFOLD_CELL_IDS][mask] if transformed else mask
-            region = original.extract_cells(idxs)
-        elif self.preference == EnclosedPreference.POINT:
-            original.point_data[scalars] = selected[scalars]
-            region = original.threshold(0.5, scalars=scalars, preference="cell")
-        else:
-            region = original.extract_points(selected[scalars], adjacent_cells=False)
+        The edges of the polygon rings are great-circle arcs between consecutive
+        vertices. Note that long edges of a planar polygon e.g., along a parallel,
+        should be densified beforehand with :func:`shapely.segmentize`.
 
-        # ensure to preserve active scalars name
-        region.active_scalars_name = active_scalars_name
+        The rings of each polygon part are oriented with an anti-clockwise
+        exterior and clockwise holes, and the region is on the left of each ring
+        of each part. A ring that winds around the pole is therefore permitted,
+        such as the coastline of Antarctica.
 
-        return cast(region)
+        Parameters
+        ----------
+        geometry : object
+            The ``Polygon`` or ``MultiPolygon``, as a :mod:`shapely` geometry, an
+            object with a ``__geo_interface__`` or GeoJSON-like mapping, or as
+            Well-Known Binary (WKB) e.g., from GeoParquet, or Well-Known Text (WKT).
+        crs : CRSLike, optional
+            The Coordinate Reference System of the `geometry` coordinates.
+            Defaults to :data:`geovista.crs.WGS84`.
 
+        Notes
+        -----
+        .. versionadded:: 0.6.0
 
-def line(
-    lons: ArrayLike,
-    lats: ArrayLike,
-    *,
-    surface: pv.PolyData | None = None,
-    radius: float | None = None,
-    npts: int | None = None,
-    ellps: str | None = None,
-    close: bool | None = False,
-    zlevel: int | None = None,
-    zscale: float | None = None,
-) -> pv.PolyData:
-    """Geodesic line consisting of one or more connected geodesic line segments.
+        """
+        if isinstance(geometry, bytes | bytearray):
+            shape = shapely.from_wkb(bytes(geometry))
+        elif isinstance(geometry, str):
+            shape = shapely.from_wkt(geometry)
+        elif isinstance(geometry, shapely.Geometry):
+            shape = geometry
+        else:
+            shape = shapely.geometry.shape(geometry)
 
-    Note that as a convenience, if a single value is provided for `lons` and ``N``
-    values are provided for `lats`, then the longitude value will be automatically
-    repeated ``N`` times, and vice versa, providing ``N >= 2``.
+        if not isinstance(shape, shapely.Polygon | shapely.MultiPolygon):
+            emsg = (
+                "Expected a 'Polygon' or 'MultiPolygon' region geometry, "
+                f"got '{shape.geom_type}'."
+            )
+            raise TypeError(emsg)
 
-    Parameters
-    ----------
-    lons : ArrayLike
-        The longitudes (degrees) of the geodesic line segments, in the half-closed
-        interval ``[-180, 180)``. Note that longitudes will be wrapped to this
-        interval.
-    lats : ArrayLike
-        The latitudes (degrees) of the geodesic line segments, in the closed
-        interval ``[-90, 90]``.
-    surface : PolyData, optional
-        The surface that the geodesic line will be rendered over.
-    radius : float, optional
-        The radius of the spherical surface that the geodesic line will be
-        rendered over.
-        Note that the `radius` is only used when the `surface` is not
-        provided. Defaults to :data:`geovista.common.RADIUS`.
-    npts : float, optional
-        The number of equally spaced geodesic points in a line segment, excluding
-        the segment end-point, but including the segment start-point i.e., `npts`
-        must be at least 2. Defaults to :data:`GEODESIC_NPTS`.
-    ellps : str, optional
-        The ellipsoid for geodesic calculations. See :func:`pyproj.list.get_ellps_map`.
-        Defaults to :data:`ELLIPSE`.
-    close : bool, optional
-        Whether to close the geodesic line segments into a loop i.e., the last
-        point is connected to the first point. Defaults to ``False``.
-    zlevel : int, optional
-        The z-axis level. Used in combination with the `zscale` to offset the
-        `radius` by a proportional amount i.e., ``radius * zlevel * zscale``.
-        Defaults to ``1``.
-    zscale : float, optional
-        The proportional multiplier for z-axis `zlevel`. Defaults to
-        :data:`geovista.common.ZLEVEL_SCALE`.
+        if shape.is_empty:
+            emsg = "Expected a non-empty region geometry."
+            raise ValueError(emsg)
 
-    Returns
-    -------
-    PolyData
-        The geodesic line.
+        rings, parts, holes = [], [], []
+        for part, polygon in enumerate(shapely.get_parts(shape)):
+            oriented = shapely.geometry.polygon.orient(polygon, sign=1.0)
+            for idx, ring in enumerate([oriented.exterior, *oriented.interiors]):
+                # drop the closing vertex of the ring
+                rings.append(shapely.get_coordinates(ring)[:-1])
+                parts.append(part)
+                holes.append(idx > 0)
+
+        self.crs = WGS84 if crs is None else crs
+        """The coordinate reference system of the region geometry."""
+        self.offsets = np.concatenate([[0], np.cumsum([len(ring) for ring in rings])])
+        """The index of the first vertex of each ring, and the number of vertices."""
+        self.parts = np.array(parts)
+        """The polygon part of each ring."""
+        self.holes = np.array(holes)
+        """Whether each ring is a hole of its polygon part."""
+
+        xy = np.concatenate(rings)
 
-    Notes
-    -----
-    .. versionadded:: 0.1.0
+        if self.crs != WGS84:
+            xy = np.asarray(
+                transform_points(
+                    xs=xy[:, 0], ys=xy[:, 1], src_crs=self.crs, tgt_crs=WGS84
+                )
+            )
 
-    Examples
-    --------
-    Add the anti-meridian great circle to the plotter. A texture mapped Natural Earth
-    base layer is also rendered.
+        self.lons = wrap(xy[:, 0])
+        """The longitudes of the region vertices."""
+        self.lats = np.asarray(xy[:, 1], dtype=float)
+        """The latitudes of the region vertices."""
 
-    >>> import geovista
-    >>> from geovista.geodesic import line
-    >>> p = geovista.GeoPlotter()
-    >>> _ = p.add_base_layer(texture=geovista.natural_earth_1())
-    >>> meridian = line(lons=-180, lats=[90, 0, -90])
-    >>> _ = p.add_mesh(meridian, color="orange", line_width=3)
-    >>> p.view_xy()
-    >>> p.show()
+        # enclosed preference for points outside/inside region
+        self._outside = BBOX_OUTSIDE
+        # enclosed cell preference
+        self._preference = EnclosedPreference(PREFERENCE)
+        # the edge bucket index of the region, see _generate_index
+        self._index: tuple[np.ndarray, ...] | None = None
+        # the enclosed point classification of each surface, as an optimisation
+        self._classified: dict[
+            tuple[Any, ...], tuple[np.ndarray, np.ndarray | None]
+        ] = {}
 
-    """
-    if surface is not None:
-        radius = distance(surface)
-    else:
-        radius = RADIUS if radius is None else abs(float(radius))
+    def __call__(self, surface: pv.PolyData) -> pv.PolyData:
+        """Extract region of the `surface` contained within the region.
 
-    zscale = ZLEVEL_SCALE if zscale is None else float(zscale)
-    zlevel = 1 if zlevel is None else int(zlevel)
-    radius += radius * zlevel * zscale
+        Parameters
+        ----------
+        surface : PolyData
+            The :class:`~pyvista.PolyData` mesh to be checked for containment.
 
-    if npts is None:
-        npts = GEODESIC_NPTS
+        Returns
+        -------
+        PolyData
+            The :class:`~pyvista.PolyData` representing those parts of the
+            provided `surface` enclosed by the region.
 
-    if ellps is None:
-        ellps = ELLIPSE
+        See Also
+        --------
+        enclosed : Equivalent method.
 
-    lons, lats = np.atleast_1d(lons), np.atleast_1d(lats)
+        Notes
+        -----
+        .. versionadded:: 0.6.0
 
-    # check whether to auto-repeat lons or lats
-    if (lons.size == 1 or lats.size == 1) and (lons.size + lats.size > 2):
-        if lons.size == 1:
-            lons = np.repeat(lons[0], lats.size)
-        else:
-            lats = np.repeat(lats[0], lons.size)
+        """
+        return self.enclosed(surface)
+
+    def __repr__(self) -> str:
+        """Serialize :class:`Region` representation.
+
+        Returns
+        -------
+        str
+            String representation of the instance.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        params = (
+            f"crs={self.crs}, n_parts={self.n_parts}, n_rings={self.n_rings}, "
+            f"n_vertices={self.lons.size}"
+        )
+
+        return f"{__package__}.{self.__class__.__name__}<{params}>"
+
+    @property
+    def n_parts(self) -> int:
+        """The number of polygon parts of the region.
+
+        Returns
+        -------
+        int
+            The number of polygon parts.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return int(self.parts[-1]) + 1
+
+    @property
+    def n_rings(self) -> int:
+        """The number of polygon rings of the region, including holes.
+
+        Returns
+        -------
+        int
+            The number of polygon rings.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return self.offsets.size - 1
+
+    @property
+    def outside(self) -> bool:
+        """The preference to select points outside/inside the region.
+
+        Returns
+        -------
+        bool
+            Region selection preference.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return self._outside
+
+    @outside.setter
+    def outside(self, value: bool | None) -> None:
+        """Set preference to select points outside/inside the region.
+
+        Parameters
+        ----------
+        value : bool
+            Whether to select points outside/inside the region.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if value is not None:
+            self._outside = bool(value)
+
+    @property
+    def preference(self) -> EnclosedPreference:
+        """The criterion for cell containment within the region.
+
+        Returns
+        -------
+        EnclosedPreference
+            The region enclosed preference.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return self._preference
+
+    @preference.setter
+    def preference(self, value: str | EnclosedPreference | None) -> None:
+        """Set the criterion for cell containment within the region.
+
+        Parameters
+        ----------
+        value : str or EnclosedPreference
+            The region enclosed preference for cell membership.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if value is not None:
+            if not EnclosedPreference.valid(value):
+                options = " or ".join(
+                    f"{item!r}" for item in EnclosedPreference.values()
+                )
+                emsg = f"Expected a preference of {options}, got '{value}'."
+                raise ValueError(emsg)
+
+            self._preference = EnclosedPreference(value)
+
+    def _edges(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get the start and end vertex indices of each ring edge.
+
+        Returns
+        -------
+        tuple of ndarray
+            The start and end vertex indices of each edge, in ring order.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        starts = np.arange(self.lons.size)
+        ends = starts + 1
+        # close each ring, from its last vertex to its first vertex
+        ends[self.offsets[1:] - 1] = self.offsets[:-1]
+        return starts, ends
+
+    def _generate_index(self) -> None:
+        """Construct the edge bucket index of the region.
+
+        The region is rotated so that its pole is the axis furthest from the
+        edges of the region, and the edges are bucketed by the longitudes
+        spanned by their great-circle arc. A point need then only be tested
+        against the edges that may cross its meridian.
+
+        Also determine whether the pole is within the region, being on the left
+        of each ring of a polygon part. A ring that winds eastwards around the
+        pole has the pole on its left, and a ring that does not wind around the
+        pole only has the pole on its left if it is a hole.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        starts, ends = self._edges()
+        xyz = to_cartesian(self.lons, self.lats, radius=1.0)
+        rotation = _rotation(xyz[starts], xyz[ends])
+        xyz = xyz @ rotation.T
+        lons = np.rad2deg(np.arctan2(xyz[:, 1], xyz[:, 0]))
+        deltas = wrap(lons[ends] - lons[starts])
+
+        # the winding of each ring about the pole
+        rings = np.repeat(np.arange(self.n_rings), np.diff(self.offsets))
+        winding = np.bincount(rings, weights=deltas, minlength=self.n_rings)
+        winding = np.round(winding / 360)
+        left = np.where(winding == 0, self.holes, winding > 0)
+        pole = bool(np.any(np.bincount(self.parts, weights=~left) == 0))
+
+        # the longitude buckets spanned by each edge
+        n_buckets = int(np.clip(starts.size // _REGION_BUCKET_EDGES, 1, 2**13))
+        width = 360 / n_buckets
+        west = np.where(deltas >= 0, lons[starts], lons[ends])
+        first = np.floor((west + 180) / width).astype(np.int64)
+        last = np.floor((west + np.abs(deltas) + 180) / width).astype(np.int64)
+        # an edge over the pole spans all buckets
+        last = np.where(np.abs(deltas) >= 180, first + n_buckets - 1, last)
+        spans = np.minimum(last - first, n_buckets - 1) + 1
+        edges = np.repeat(np.arange(starts.size), spans)
+        steps = np.arange(edges.size) - np.repeat(np.cumsum(spans) - spans, spans)
+        buckets = (first[edges] + steps) % n_buckets
+
+        order = np.argsort(buckets, kind="stable")
+        offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(buckets, minlength=n_buckets))]
+        )
+
+        self._index = (
+            rotation,
+            xyz[starts],
+            xyz[ends],
+            edges[order],
+            offsets,
+            np.array([pole]),
+        )
+
+    def boundary(
+        self, surface: pv.PolyData | None = None, *, radius: float | None = None
+    ) -> pv.PolyData:
+        """Footprint of the region rings over the provided mesh surface.
+
+        Each ring of the region is a closed polyline of great-circle arcs.
+
+        Parameters
+        ----------
+        surface : PolyData, optional
+            The :class:`~pyvista.PolyData` mesh that will be enclosed by the
+            region boundary.
+        radius : float, optional
+            The radius of the spherical mesh that will be enclosed by the region
+            boundary. Note that the `radius` is only used when the `surface` is
+            not provided. Defaults to :data:`geovista.common.RADIUS`.
+
+        Returns
+        -------
+        PolyData
+            The boundary of the region, with one polyline cell per ring.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if surface is not None:
+            radius = float(distance(surface))
+        else:
+            radius = RADIUS if radius is None else abs(float(radius))
+
+        radius += radius * ZLEVEL_SCALE
+
+        starts, ends = self._edges()
+        xyz = to_cartesian(self.lons, self.lats, radius=1.0)
+        a, b = xyz[starts], xyz[ends]
+        angles = np.arctan2(
+            np.linalg.norm(np.cross(a, b), axis=1), np.einsum("ij,ij->i", a, b)
+        )
+
+        # the number of great-circle arc points of each edge, including its start
+        counts = np.ceil(np.rad2deg(angles) / _REGION_BOUNDARY_STEP).astype(np.int64)
+        counts = counts.clip(min=1)
+        edges = np.repeat(np.arange(starts.size), counts)
+        steps = np.arange(edges.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        fractions = (steps / counts[edges])[:, np.newaxis]
+
+        # spherical linear interpolation along each edge
+        angle = angles[edges][:, np.newaxis]
+        sine = np.sin(angle)
+        safe = np.where(sine > 0, sine, 1)
+        weights_a = np.where(sine > 0, np.sin((1 - fractions) * angle) / safe, 1)
+        weights_b = np.where(sine > 0, np.sin(fractions * angle) / safe, 0)
+        points = weights_a * a[edges] + weights_b * b[edges]
+
+        # the closed polyline of each ring
+        idxs = np.concatenate([[0], np.cumsum(counts)])[self.offsets]
+        connectivity: np.ndarray = np.insert(np.arange(edges.size), idxs[1:], idxs[:-1])
+        cell_offsets = idxs + np.arange(idxs.size)
+
+        result = pv.PolyData()
+        result.points = points * radius
+        result.lines = pv.CellArray.from_arrays(cell_offsets, connectivity)
+
+        result.field_data[GV_FIELD_RADIUS] = np.array([radius])
+        to_wkt(result, WGS84)
+
+        return result
+
+    def contains(self, lons: ArrayLike, lats: ArrayLike) -> np.ndarray:
+        """Determine whether the geographic points are within the region.
+
+        Parameters
+        ----------
+        lons : ArrayLike
+            The longitudes (degrees) of the points.
+        lats : ArrayLike
+            The latitudes (degrees) of the points.
+
+        Returns
+        -------
+        ndarray
+            The boolean mask of the points within the region.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        xyz = to_cartesian(
+            np.ravel(lons).astype(float), np.ravel(lats).astype(float), radius=1.0
+        )
+        return self._contains(xyz)
+
+    def _contains(self, xyz: np.ndarray) -> np.ndarray:
+        """Determine whether the cartesian points are within the region.
+
+        The pole of the rotated region is joined to each point by its meridian,
+        which crosses the boundary of the region an odd number of times only if
+        the point and the pole are on different sides of the boundary.
+
+        Parameters
+        ----------
+        xyz : ndarray
+            The cartesian points of shape ``(N, 3)``.
+
+        Returns
+        -------
+        ndarray
+            The boolean mask of the points within the region.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if self._index is None:
+            self._generate_index()
+
+        assert self._index is not None
+        rotation, starts, ends, edges, offsets, pole = self._index
+        n_buckets = offsets.size - 1
+
+        xyz = np.asarray(xyz, dtype=float) @ rotation.T
+        norm = np.linalg.norm(xyz, axis=1)
+        unit = xyz / np.where(norm > 0, norm, 1)[:, np.newaxis]
+        lons = np.arctan2(unit[:, 1], unit[:, 0])
+        # the eastward normal, and the direction, of the meridian of each point
+        normals = np.stack([-np.sin(lons), np.cos(lons), np.zeros_like(lons)], axis=1)
+        directions = np.stack([np.cos(lons), np.sin(lons), np.zeros_like(lons)], axis=1)
+
+        buckets = np.floor((np.rad2deg(lons) + 180) / (360 / n_buckets))
+        buckets = buckets.astype(np.int64) % n_buckets
+        order = np.argsort(buckets, kind="stable")
+        bounds = np.concatenate(
+            [[0], np.cumsum(np.bincount(buckets, minlength=n_buckets))]
+        )
+        crossings = np.zeros(xyz.shape[0], dtype=np.int64)
+
+        occupied = (np.diff(bounds) > 0) & (np.diff(offsets) > 0)
+
+        for bucket in np.flatnonzero(occupied):
+            idxs = edges[offsets[bucket] : offsets[bucket + 1]]
+            a, b = starts[idxs], ends[idxs]
+            dot = np.einsum("ij,ij->i", a, b)
+            chunk = max(1, _REGION_CHUNK_SIZE // idxs.size)
+            points = order[bounds[bucket] : bounds[bucket + 1]]
+
+            for start in range(0, points.size, chunk):
+                pids = points[start : start + chunk]
+                sa, sb = normals[pids] @ a.T, normals[pids] @ b.T
+                da, db = directions[pids] @ a.T, directions[pids] @ b.T
+                # the edges with end-points on opposite sides of the meridian plane
+                opposite = (sa > 0) != (sb > 0)
+                sign = np.sign(sa)
+                # the meridian plane intersection with each edge great-circle arc
+                xe = sign * (sa * db - sb * da)
+                xz = sign * (sa * b[:, 2] - sb * a[:, 2])
+                xn = np.sqrt(np.maximum(sa**2 + sb**2 - 2 * sa * sb * dot, 0))
+                north = xz > unit[pids, 2][:, np.newaxis] * xn
+                crossings[pids] += np.count_nonzero(opposite & (xe > 0) & north, axis=1)
+
+        result: np.ndarray = (crossings % 2 == 1) ^ pole[0]
+        return result
+
+    def enclosed(
+        self,
+        surface: pv.PolyData,
+        /,
+        *,
+        outside: bool | None = None,
+        preference: str | EnclosedPreference | None = None,
+    ) -> pv.PolyData:
+        """Extract region of the `surface` contained within the region.
+
+        Parameters
+        ----------
+        surface : PolyData
+            The :class:`~pyvista.PolyData` mesh to be checked for containment.
+        outside : bool, optional
+            By default, select those points of the `surface` that are inside
+            the region. Otherwise, select those points that are outside
+            the region. Defaults to :data:`BBOX_OUTSIDE`.
+        preference : str or EnclosedPreference, optional
+            Criteria for defining whether a face of a `surface` mesh is
+            deemed to be enclosed by the region. A `preference` of ``cell``
+            requires all points defining the face to be within the region.
+            A `preference` of ``center`` requires that only the face cell
+            center is within the region. A `preference` of ``point`` requires
+            at least one point that defines the face to be within the region.
+            Defaults to :data:`PREFERENCE`.
+
+        Returns
+        -------
+        PolyData
+            The :class:`~pyvista.PolyData` representing those parts of
+            the provided `surface` enclosed by the region. This behaviour
+            may be inverted with the `outside` parameter.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        self.outside = outside
+        self.preference = preference
+
+        # the classification of the surface is independent of the outside preference,
+        # and shared by the cell and point preferences
+        center = self.preference == EnclosedPreference.CENTER
+        key = (fingerprint(surface), from_wkt(surface), center)
+
+        if (classified := self._classified.get(key)) is None:
+            points, cids = _surface(surface, center=center)
+            classified = (self._contains(points.points), cids)
+            _cache(self._classified, key, classified)
+
+        enclosed, cids = classified
+
+        return _extract(
+            surface, enclosed ^ self.outside, cids, preference=self.preference
+        )
+
+
+def line(
+    lons: ArrayLike,
+    lats: ArrayLike,
+    *,
+    surface: pv.PolyData | None = None,
+    radius: float | None = None,
+    npts: int | None = None,
+    ellps: str | None = None,
+    close: bool | None = False,
+    zlevel: int | None = None,
+    zscale: float | None = None,
+) -> pv.PolyData:
+    """Geodesic line consisting of one or more connected geodesic line segments.
+
+    Note that as a convenience, if a single value is provided for `lons` and ``N``
+    values are provided for `lats`, then the longitude value will be automatically
+    repeated ``N`` times, and vice versa, providing ``N >= 2``.
+
+    Parameters
+    ----------
+    lons : ArrayLike
+        The longitudes (degrees) of the geodesic line segments, in the half-closed
+        interval ``[-180, 180)``. Note that longitudes will be wrapped to this
+        interval.
+    lats : ArrayLike
+        The latitudes (degrees) of the geodesic line segments, in the closed
+        interval ``[-90, 90]``.
+    surface : PolyData, optional
+        The surface that the geodesic line will be rendered over.
+    radius : float, optional
+        The radius of the spherical surface that the geodesic line will be
+        rendered over.
+        Note that the `radius` is only used when the `surface` is not
+        provided. Defaults to :data:`geovista.common.RADIUS`.
+    npts : float, optional
+        The number of equally spaced geodesic points in a line segment, excluding
+        the segment end-point, but including the segment start-point i.e., `npts`
+        must be at least 2. Defaults to :data:`GEODESIC_NPTS`.
+    ellps : str, optional
+        The ellipsoid for geodesic calculations. See :func:`pyproj.list.get_ellps_map`.
+        Defaults to :data:`ELLIPSE`.
+    close : bool, optional
+        Whether to close the geodesic line segments into a loop i.e., the last
+        point is connected to the first point. Defaults to ``False``.
+    zlevel : int, optional
+        The z-axis level. Used in combination with the `zscale` to offset the
+        `radius` by a proportional amount i.e., ``radius * zlevel * zscale``.
+        Defaults to ``1``.
+    zscale : float, optional
+        The proportional multiplier for z-axis `zlevel`. Defaults to
+        :data:`geovista.common.ZLEVEL_SCALE`.
+
+    Returns
+    -------
+    PolyData
+        The geodesic line.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.0
+
+    Examples
+    --------
+    Add the anti-meridian great circle to the plotter. A texture mapped Natural Earth
+    base layer is also rendered.
+
+    >>> import geovista
+    >>> from geovista.geodesic import line
+    >>> p = geovista.GeoPlotter()
+    >>> _ = p.add_base_layer(texture=geovista.natural_earth_1())
+    >>> meridian = line(lons=-180, lats=[90, 0, -90])
+    >>> _ = p.add_mesh(meridian, color="orange", line_width=3)
+    >>> p.view_xy()
+    >>> p.show()
+
+    """
+    if surface is not None:
+        radius = distance(surface)
+    else:
+        radius = RADIUS if radius is None else abs(float(radius))
+
+    zscale = ZLEVEL_SCALE if zscale is None else float(zscale)
+    zlevel = 1 if zlevel is None else int(zlevel)
+    radius += radius * zlevel * zscale
+
+    if npts is None:
+        npts = GEODESIC_NPTS
+
+    if ellps is None:
+        ellps = ELLIPSE
+
+    lons, lats = np.atleast_1d(lons), np.atleast_1d(lats)
+
+    # check whether to auto-repeat lons or lats
+    if (lons.size == 1 or lats.size == 1) and (lons.size + lats.size > 2):
+        if lons.size == 1:
+            lons = np.repeat(lons[0], lats.size)
+        else:
+            lats = np.repeat(lats[0], lons.size)
 
     n_lons, n_lats = lons.size, lats.size
 
@@ -1186,6 +1970,199 @@ def line(
     return lines
 
 
+def lines(
+    lons: ArrayLike,
+    lats: ArrayLike,
+    offsets: ArrayLike,
+    *,
+    surface: pv.PolyData | None = None,
+    radius: float | None = None,
+    npts: int | None = None,
+    spacing: float | None = None,
+    ellps: str | None = None,
+    close: bool | None = False,
+    zlevel: int | None = None,
+    zscale: float | None = None,
+) -> pv.PolyData:
+    """Many geodesic lines, each consisting of one or more connected line segments.
+
+    This is the batched equivalent of :func:`line`, where the ragged tracks
+    of geodesic line segments are provided as flat longitudes and latitudes,
+    with the `offsets` of each track. All the segments are densified at once,
+    and each track is a polyline cell of the resultant mesh.
+
+    Parameters
+    ----------
+    lons : ArrayLike
+        The longitudes (degrees) of the geodesic line segments of all tracks, in
+        the half-closed interval ``[-180, 180)``. Note that longitudes will be
+        wrapped to this interval.
+    lats : ArrayLike
+        The latitudes (degrees) of the geodesic line segments of all tracks, in
+        the closed interval ``[-90, 90]``.
+    offsets : ArrayLike
+        The index of the first longitude/latitude of each track, followed by
+        the total number of longitudes/latitudes i.e., track ``i`` is
+        ``lons[offsets[i]:offsets[i + 1]]``.
+    surface : PolyData, optional
+        The surface that the geodesic lines will be rendered over.
+    radius : float, optional
+        The radius of the spherical surface that the geodesic lines will be
+        rendered over.
+        Note that the `radius` is only used when the `surface` is not
+        provided. Defaults to :data:`geovista.common.RADIUS`.
+    npts : float, optional
+        The number of equally spaced geodesic points in a line segment, excluding
+        the segment end-point, but including the segment start-point i.e., `npts`
+        must be at least 2. Defaults to :data:`GEODESIC_NPTS`.
+    spacing : float, optional
+        The maximum geodesic distance (meters) between the points of a line
+        segment. If provided, each line segment is adaptively densified by its
+        length, rather than with `npts` points.
+    ellps : str, optional
+        The ellipsoid for geodesic calculations. See :func:`pyproj.list.get_ellps_map`.
+        Defaults to :data:`ELLIPSE`.
+    close : bool, optional
+        Whether to close the geodesic line segments of each track into a loop
+        i.e., the last point of each track is connected to its first point.
+        Defaults to ``False``.
+    zlevel : int, optional
+        The z-axis level. Used in combination with the `zscale` to offset the
+        `radius` by a proportional amount i.e., ``radius * zlevel * zscale``.
+        Defaults to ``1``.
+    zscale : float, optional
+        The proportional multiplier for z-axis `zlevel`. Defaults to
+        :data:`geovista.common.ZLEVEL_SCALE`.
+
+    Returns
+    -------
+    PolyData
+        The geodesic lines, with one polyline cell per track.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    Examples
+    --------
+    Add the prime meridian and the equator great circles to the plotter as
+    one mesh. A texture mapped Natural Earth base layer is also rendered.
+
+    >>> import geovista
+    >>> from geovista.geodesic import lines
+    >>> p = geovista.GeoPlotter()
+    >>> _ = p.add_base_layer(texture=geovista.natural_earth_1())
+    >>> lons = [0, 0, 0, -180, -90, 0, 90]
+    >>> lats = [90, 0, -90, 0, 0, 0, 0]
+    >>> tracks = lines(lons, lats, [0, 3, 7])
+    >>> _ = p.add_mesh(tracks, color="orange", line_width=3)
+    >>> p.view_xz()
+    >>> p.show()
+
+    """
+    if surface is not None:
+        radius = float(distance(surface))
+    else:
+        radius = RADIUS if radius is None else abs(float(radius))
+
+    zscale = ZLEVEL_SCALE if zscale is None else float(zscale)
+    zlevel = 1 if zlevel is None else int(zlevel)
+    radius += radius * zlevel * zscale
+
+    if npts is None:
+        npts = GEODESIC_NPTS
+
+    if ellps is None:
+        ellps = ELLIPSE
+
+    lons = np.ravel(lons).astype(float)
+    lats = np.ravel(lats).astype(float)
+    offsets = np.ravel(offsets).astype(np.int64)
+    n_lons, n_lats = lons.size, lats.size
+
+    if n_lons != n_lats:
+        emsg = (
+            f"Require the same number of longitudes ({n_lons}) and "
+            f"latitudes ({n_lats})."
+        )
+        raise ValueError(emsg)
+
+    if offsets.size < 2 or offsets[0] != 0 or offsets[-1] != n_lons:
+        emsg = (
+            "Require track offsets starting at 0 and ending with the number of "
+            f"longitude/latitude values ({n_lons})."
+        )
+        raise ValueError(emsg)
+
+    if np.any(np.diff(offsets) < 2):
+        emsg = "Require each track to contain at least 2 longitude/latitude values."
+        raise ValueError(emsg)
+
+    lons = wrap(lons)
+    geod = pyproj.Geod(ellps=ellps)
+
+    # the start-point of each segment, being every point except the track end-points
+    ends = offsets[1:] - 1
+    segments = np.ones(n_lons, dtype=bool)
+    segments[ends] = False
+    starts = np.flatnonzero(segments)
+
+    azimuths, _, distances = geod.inv(
+        lons[starts], lats[starts], lons[starts + 1], lats[starts + 1]
+    )
+
+    # the number of points of each segment, including its start-point
+    if spacing is None:
+        counts = np.full(starts.size, npts, dtype=np.int64)
+    else:
+        counts = np.ceil(distances / float(spacing)).astype(np.int64).clip(min=1)
+
+    # the index of each point in the densified points
+    sizes = np.ones(n_lons, dtype=np.int64)
+    sizes[starts] = counts
+    idxs = np.concatenate([[0], np.cumsum(sizes)])
+    n_points = idxs[-1]
+
+    line_lons = np.empty(n_points)
+    line_lats = np.empty(n_points)
+    line_lons[idxs[:-1]] = lons
+    line_lats[idxs[:-1]] = lats
+
+    # the segment, and the fraction along the segment, of each mid-point
+    segment = np.repeat(np.arange(starts.size), counts - 1)
+    first = np.cumsum(counts - 1) - (counts - 1)
+    step = np.arange(segment.size) - first[segment] + 1
+    mid_lons, mid_lats = lons[starts][segment], lats[starts][segment]
+    _forward(
+        mid_lons,
+        mid_lats,
+        azimuths[segment],
+        distances[segment] * step / counts[segment],
+        geod=geod,
+    )
+    mid_idxs = idxs[starts][segment] + step
+    line_lons[mid_idxs] = wrap(mid_lons)
+    line_lats[mid_idxs] = mid_lats
+
+    # the polyline cell of each track
+    cell_offsets = idxs[offsets]
+    connectivity = np.arange(n_points)
+
+    if close:
+        connectivity = np.insert(connectivity, cell_offsets[1:], cell_offsets[:-1])
+        cell_offsets = cell_offsets + np.arange(offsets.size)
+
+    xyz = to_cartesian(line_lons, line_lats, radius=radius)
+    result = pv.PolyData()
+    result.points = xyz
+    result.lines = pv.CellArray.from_arrays(cell_offsets, connectivity)
+
+    result.field_data[GV_FIELD_RADIUS] = np.array([radius])
+    to_wkt(result, WGS84)
+
+    return result
+
+
 def npoints(
     start_lon: float,
     start_lat: float,
@@ -1499,3 +2476,302 @@ def wedge(
     lats = (90, 90, -90, -90)
 
     return BBox(lons, lats, ellps=ellps, c=c, triangulate=triangulate)
+
+
+def _cache[K, V](cache: dict[K, V], key: K, value: V) -> None:
+    """Insert the entry into the cache, evicting the oldest entries beyond capacity.
+
+    Parameters
+    ----------
+    cache : dict
+        The cache, in order of insertion.
+    key : K
+        The key of the entry.
+    value : V
+        The value of the entry.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    cache[key] = value
+    while len(cache) > BBOX_CACHE_SIZE:
+        del cache[next(iter(cache))]
+
+
+def _extract(
+    surface: pv.PolyData,
+    mask: np.ndarray,
+    cids: np.ndarray | None,
+    *,
+    preference: EnclosedPreference,
+) -> pv.PolyData:
+    """Extract the region of the surface selected by the enclosed mask.
+
+    Parameters
+    ----------
+    surface : PolyData
+        The :class:`~pyvista.PolyData` mesh checked for containment.
+    mask : ndarray
+        The boolean mask of the selected `surface` points, or cell centers for
+        the ``center`` `preference`.
+    cids : ndarray, optional
+        The `surface` cell-id of each cell center, see :func:`_surface`.
+    preference : EnclosedPreference
+        The criterion for `surface` cell inclusion.
+
+    Returns
+    -------
+    PolyData
+        The selected region of the `surface`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    # capture the current active scalars name
+    active_scalars_name = surface.active_scalars_name
+
+    # name of the point mask generated by select_interior_points
+    scalars = "selected_points"
+
+    # sample the surface with the enclosed cells to extract the region
+    if preference == EnclosedPreference.CENTER:
+        idxs = mask if cids is None else cids[mask]
+        region = surface.extract_cells(idxs)
+    elif preference == EnclosedPreference.POINT:
+        surface.point_data[scalars] = mask
+        region = surface.threshold(0.5, scalars=scalars, preference="cell")
+    else:
+        region = surface.extract_points(mask, adjacent_cells=False)
+
+    # ensure to preserve active scalars name
+    region.active_scalars_name = active_scalars_name
+
+    return cast(region)
+
+
+def _forward(
+    lons: np.ndarray,
+    lats: np.ndarray,
+    azimuths: np.ndarray,
+    distances: np.ndarray,
+    *,
+    geod: pyproj.Geod,
+) -> None:
+    """Solve the direct geodesic problem of the points in-place.
+
+    Parameters
+    ----------
+    lons : ndarray
+        The longitudes (degrees) of the start-points, which are replaced by the
+        longitudes of the end-points.
+    lats : ndarray
+        The latitudes (degrees) of the start-points, which are replaced by the
+        latitudes of the end-points.
+    azimuths : ndarray
+        The forward azimuths (degrees) from the start-points.
+    distances : ndarray
+        The distances (meters) from the start-points.
+    geod : Geod
+        Definition of the ellipsoid for geodesic calculations.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    chunk_size = _GEODESIC_CHUNK_SIZE
+
+    def worker(start: int) -> None:
+        """Solve the direct geodesic problem of a chunk of the points in-place.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first point of the chunk.
+
+        """
+        chunk = slice(start, start + chunk_size)
+        geod.fwd(
+            lons[chunk],
+            lats[chunk],
+            azimuths[chunk],
+            distances[chunk],
+            inplace=True,
+            return_back_azimuth=False,
+        )
+
+    # the geodesic calculation releases the GIL
+    _map_chunks(
+        worker,
+        lons.size,
+        workers=gvc.GEOVISTA_TRANSFORM_WORKERS,
+        chunk_size=chunk_size,
+    )
+
+
+def _rotation(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Calculate the rotation of the pole to the axis furthest from the edges.
+
+    The candidate axes are the 26 directions towards the faces, edges and
+    corners of the unit cube.
+
+    Parameters
+    ----------
+    starts : ndarray
+        The unit cartesian start-point of each great-circle arc edge of shape
+        ``(N, 3)``.
+    ends : ndarray
+        The unit cartesian end-point of each great-circle arc edge of shape
+        ``(N, 3)``.
+
+    Returns
+    -------
+    ndarray
+        The rotation matrix of shape ``(3, 3)``, which rotates the chosen axis
+        to the north pole.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    grid = np.stack(np.meshgrid(*[[-1, 0, 1]] * 3, indexing="ij"), axis=-1)
+    axes = grid.reshape(-1, 3)
+    axes = axes[np.any(axes != 0, axis=1)].astype(float)
+    axes /= np.linalg.norm(axes, axis=1, keepdims=True)
+
+    # the angular distance of each axis from the nearest point of each edge
+    normals = np.cross(starts, ends)
+    norm = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals /= np.where(norm > 0, norm, 1)
+    within = (axes @ np.cross(normals, starts).T >= 0) & (
+        axes @ np.cross(ends, normals).T >= 0
+    )
+    sine = np.abs(axes @ normals.T).clip(max=1)
+    cosine = np.maximum(axes @ starts.T, axes @ ends.T).clip(-1, 1)
+    distance = np.where(within, np.arcsin(sine), np.arccos(cosine)).min(axis=1)
+    pole = axes[np.argmax(distance)]
+
+    # an orthonormal basis with the chosen axis as the pole
+    other = np.zeros(3)
+    other[np.argmin(np.abs(pole))] = 1
+    east = np.cross(other, pole)
+    east /= np.linalg.norm(east)
+    result: np.ndarray = np.stack([east, np.cross(pole, east), pole])
+    return result
+
+
+def _surface(
+    surface: pv.PolyData, *, center: bool
+) -> tuple[pv.PolyData, np.ndarray | None]:
+    """Prepare the geographic points or cell centers of the surface for containment.
+
+    Parameters
+    ----------
+    surface : PolyData
+        The :class:`~pyvista.PolyData` mesh to be checked for containment.
+    center : bool
+        Whether to prepare the cell centers rather than the points of the
+        `surface`.
+
+    Returns
+    -------
+    tuple
+        The :data:`geovista.crs.WGS84` mesh of the `surface` points or cell
+        centers, and the cell-id of each cell center if the `surface` was
+        transformed, otherwise ``None``.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    crs = from_wkt(surface)
+    cids = None
+
+    if crs is not None:
+        if transformed := crs != WGS84:
+            if center:
+                surface[GV_MANIFOLD_CELL_IDS] = np.arange(surface.n_cells)
+
+            surface = transform_mesh(surface, tgt_crs=WGS84)
+    else:
+        # assume we have a raw mesh with cartesian points
+        transformed = False
+
+    # perform after transformation to avoid cloud specific transform behaviour
+    if center:
+        surface = surface.cell_centers()
+        if transformed:
+            cids = np.asarray(surface[GV_MANIFOLD_CELL_IDS])
+
+    return surface, cids
+
+
+def _npoints(
+    start_lons: ArrayLike,
+    start_lats: ArrayLike,
+    end_lons: ArrayLike,
+    end_lats: ArrayLike,
+    *,
+    npts: int,
+    geod: pyproj.Geod,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate geodesic mid-points between many start and end points.
+
+    This is the batched equivalent of :func:`npoints`, which excludes the
+    start-points and end-points.
+
+    Parameters
+    ----------
+    start_lons : ArrayLike
+        The longitudes (degrees) of the start-point of each geodesic line.
+    start_lats : ArrayLike
+        The latitudes (degrees) of the start-point of each geodesic line.
+    end_lons : ArrayLike
+        The longitudes (degrees) of the end-point of each geodesic line.
+    end_lats : ArrayLike
+        The latitudes (degrees) of the end-point of each geodesic line.
+    npts : int
+        The number of equally spaced points along each geodesic line.
+    geod : Geod
+        Definition of the ellipsoid for geodesic calculations.
+
+    Returns
+    -------
+    tuple of ndarray
+        The longitudes and latitudes of the points along each geodesic line,
+        both of shape ``(N, npts)``. The longitudes are wrapped to the
+        half-closed interval ``[-180, 180)``.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    start_lons = np.ravel(start_lons).astype(float)
+    start_lats = np.ravel(start_lats).astype(float)
+    shape = (start_lons.size, npts)
+
+    if not start_lons.size or not npts:
+        return np.empty(shape), np.empty(shape)
+
+    azimuths, _, distances = geod.inv(
+        start_lons, start_lats, np.ravel(end_lons), np.ravel(end_lats)
+    )
+    fractions = np.arange(1, npts + 1) / (npts + 1)
+    lons = np.repeat(start_lons, npts)
+    lats = np.repeat(start_lats, npts)
+    _forward(
+        lons,
+        lats,
+        np.repeat(azimuths, npts),
+        np.ravel(np.outer(distances, fractions)),
+        geod=geod,
+    )
+
+    return wrap(lons).reshape(shape), lats.reshape(shape)
@@ -18,7 +18,7 @@ from __future__ import annotations
 from collections.abc import Iterable
 from functools import lru_cache
 import os
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 from warnings import warn
 
 import lazy_loader as lazy
@@ -27,6 +27,8 @@ import geovista.config as gvc
 
 from .bridge import Transform
 from .common import (
+    BASE,
+    GV_CELL_IDS,
     GV_FIELD_ZSCALE,
     GV_POINT_IDS,
     GV_REMESH_POINT_IDS,
@@ -40,6 +42,7 @@ from .common import (
     to_cartesian,
     to_lonlat,
     vtk_warnings_off,
+    wrap,
 )
 from .common import cast_UnstructuredGrid_to_PolyData as cast
 from .core import add_texture_coords, resize, slice_mesh
@@ -50,10 +53,9 @@ from .crs import (
     get_central_meridian,
     has_wkt,
     projected,
-    set_central_meridian,
     to_wkt,
 )
-from .geodesic import BBox
+from .geodesic import BBox, Region
 from .geometry import coastlines
 from .gridlines import (
     GRATICULE_ZLEVEL,
@@ -69,7 +71,7 @@ from .pantry.meshes import (
 )
 from .raster import wrap_texture
 from .themes import resolve_theme_name
-from .transform import transform_mesh, transform_point
+from .transform import transform_mesh, transform_point, transform_points
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -94,6 +96,7 @@ __all__ = [
     "OPACITY_BLACKLIST",
     "GeoPlotter",
     "GeoPlotterBase",
+    "PickResult",
 ]
 
 ADD_POINTS_STYLE: tuple[str, str] = ("points", "points_gaussian")
@@ -153,6 +156,101 @@ def _lfric_mesh(
     return mesh
 
 
+@lru_cache(maxsize=LRU_CACHE_SIZE)
+def _graticule(
+    create: Callable[..., GraticuleGrid],
+    crs: pyproj.CRS,
+    /,
+    **kwargs: Any,
+) -> tuple[GraticuleGrid, tuple[pv.PolyData, ...]]:
+    """Generate the graticule lines ready to render in the target CRS.
+
+    The graticule lines are combined into a single mesh, which is sliced and
+    transformed to a projected `crs` in one pass, and memoized on the
+    graticule parameters and the `crs`. The closed interval meridians along
+    the anti-meridian of the central meridian are kept in a separate mesh, as
+    they are the seam of the projection and must not be sliced.
+
+    Parameters
+    ----------
+    create : callable
+        The graticule factory i.e., :func:`~geovista.gridlines.create_meridians`
+        or :func:`~geovista.gridlines.create_parallels`.
+    crs : CRS
+        The target Coordinate Reference System (CRS) of the plotter.
+    **kwargs : dict, optional
+        The graticule parameters passed through to `create`.
+
+    Returns
+    -------
+    tuple
+        The graticule and its non-empty meshes. The meshes are shared between
+        calls, and should not be modified in-place.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    graticule = create(**kwargs)
+    mesh = graticule.mesh
+
+    if not mesh.n_points:
+        return graticule, ()
+
+    if not crs.is_projected:
+        return graticule, (mesh,)
+
+    meshes = [mesh]
+
+    if GV_REMESH_POINT_IDS in mesh.point_data:
+        # separate the closed interval meridians along the anti-meridian
+        central_meridian = get_central_meridian(crs) or 0
+        values = wrap(np.asarray(graticule.values) - central_meridian)
+        seam = np.isclose(values, BASE)
+        if np.any(seam):
+            meshes = [
+                graticule.extract(np.flatnonzero(~seam)),
+                graticule.extract(np.flatnonzero(seam)),
+            ]
+
+    result = tuple(
+        transform_mesh(
+            mesh,
+            crs,
+            zlevel=kwargs.get("zlevel"),
+            zscale=kwargs.get("zscale"),
+            inplace=True,
+        )
+        for mesh in meshes
+        if mesh.n_points
+    )
+
+    return graticule, result
+
+
+class PickResult(NamedTuple):
+    """The geolocated spatial points picked from a mesh on a projected plotter.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    lons: ArrayLike
+    """The longitudes of the spatial points, or NaN outside the projection."""
+
+    lats: ArrayLike
+    """The latitudes of the spatial points, or NaN outside the projection."""
+
+    cell_ids: ArrayLike
+    """The original cell-id of the mesh cell containing each point, otherwise -1."""
+
+    values: ArrayLike | None
+    """The data values at the spatial points, or NaN where no cell is picked."""
+
+
 class GeoPlotterBase:  # numpydoc ignore=PR01
     """Base class with common behaviour for a geospatial aware plotter.
 
@@ -171,7 +269,7 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
         self,
         *args: Any | None,
         crs: CRSLike | None = None,
-        manifold: BBox | None = None,
+        manifold: BBox | Region | None = None,
         theme: Theme | str | None = None,
         **kwargs: Any | None,
     ) -> None:
@@ -185,7 +283,7 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
             The target CRS to render geolocated meshes added to the plotter.
             May be anything accepted by :meth:`pyproj.crs.CRS.from_user_input`.
             Defaults to ``EPSG:4326`` i.e., ``WGS 84``.
-        manifold : BBox, optional
+        manifold : BBox or Region, optional
             Apply the `manifold` to each mesh added to the plotter so that only
             the region enclosed by the `manifold` is rendered.
         theme : Theme or str, optional
@@ -234,15 +332,17 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
         self._missing_opacity = False
         # cartesian (xyz) center of last mesh added to the plotter
         self._poi: list[float] | None = None
+        # cell locators of picked meshes, keyed on the mesh identity
+        self._pick_locators: dict[int, tuple[pv.PolyData, int, Any]] = {}
         super().__init__(*args, **kwargs)
 
     @property
-    def manifold(self) -> BBox | None:
+    def manifold(self) -> BBox | Region | None:
         """The manifold boundary applied to meshes added to the plotter.
 
         Returns
         -------
-        BBox or None
+        BBox or Region or None
             The plotter manifold.
 
         Notes
@@ -258,7 +358,7 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
 
         Parameters
         ----------
-        value : BBox, optional
+        value : BBox or Region, optional
             The manifold boundary to apply to meshes added to the plotter.
 
         Notes
@@ -266,8 +366,11 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
         .. versionadded:: 0.6.0
 
         """
-        if value is not None and not isinstance(value, BBox):
-            emsg = f"'manifold' must be a 'BBox' instance, got '{type(value)}'."
+        if value is not None and not isinstance(value, BBox | Region):
+            emsg = (
+                "'manifold' must be a 'BBox' instance or a 'Region' instance, "
+                f"got '{type(value)}'."
+            )
             raise TypeError(emsg)
         self._manifold = value
 
@@ -765,22 +868,15 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
             central_meridian = get_central_meridian(tgt_crs) or 0
 
             if transform_required and not cloud and not src_crs.is_projected:
-                if central_meridian:
-                    mesh.rotate_z(-central_meridian, inplace=True)
-                    tgt_crs = set_central_meridian(tgt_crs, 0)
-
-                # the sliced_mesh is guaranteed to be a new instance,
-                # even if not bisected
-                sliced_mesh = slice_mesh(mesh, rtol=rtol, atol=atol)
-
-                if central_meridian:
-                    # undo rotation of original mesh
-                    mesh.rotate_z(central_meridian, inplace=True)
-
-                mesh = sliced_mesh
+                # the sliced mesh is guaranteed to be a new instance, even
+                # if not bisected, with the seam along the anti-meridian of
+                # the central meridian
+                mesh = slice_mesh(mesh, meridian=central_meridian, rtol=rtol, atol=atol)
 
             if "texture" in kwargs and kwargs["texture"] is not None:
-                mesh = add_texture_coords(mesh, antimeridian=True)
+                mesh = add_texture_coords(
+                    mesh, meridian=central_meridian, antimeridian=True
+                )
                 texture = wrap_texture(
                     kwargs["texture"], central_meridian=central_meridian
                 )
@@ -1029,7 +1125,9 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
         closed_interval = self.crs.is_projected
         central_meridian = get_central_meridian(self.crs)
 
-        meridians = create_meridians(
+        meridians, meshes = _graticule(
+            create_meridians,
+            self.crs,
             start=start,
             stop=stop,
             step=step,
@@ -1052,22 +1150,24 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
         if zscale is not None:
             mesh_args["zscale"] = zscale
 
-        labels = (
-            label.replace("°", "")
-            for label in meridians.labels[: len(meridians.blocks)]
-        )
+        # the mesh of a single meridian is named after its label
+        prefix = "meridian"
+        if np.size(meridians.values) == 1:
+            prefix = f"meridian-{meridians.labels[0].replace('°', '')}"
         mesh_names = []
 
-        for label, mesh in zip(labels, meridians.blocks, strict=True):
+        for shared in meshes:
+            # a shallow copy, as the graticule meshes are shared
+            mesh = shared.copy(deep=False)
             address = f"{type(mesh).__name__}({mesh.GetAddressAsString('')})"
             postfix = f"{address}" if name is None else f"{name}-{address}"
-            mesh_name = f"meridian-{label}-{postfix}"
+            mesh_name = f"{prefix}-{postfix}"
             mesh_names.append(mesh_name)
             self.add_mesh(mesh, name=mesh_name, **mesh_args)
 
         if show_labels:
-            if len(mesh_names) == 1:
-                (labels_name,) = mesh_names
+            if np.size(meridians.values) == 1 and mesh_names:
+                labels_name = mesh_names[0]
             else:
                 labels_name = "meridian" if name is None else f"meridian-{name}"
 
@@ -1257,7 +1357,9 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
         # TODO @bjlittle: Fix behaviour of longitudes at poles.
         poles_parallel = False
 
-        parallels = create_parallels(
+        parallels, meshes = _graticule(
+            create_parallels,
+            self.crs,
             start=start,
             stop=stop,
             step=step,
@@ -1280,22 +1382,24 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
         if zscale is not None:
             mesh_args["zscale"] = zscale
 
-        labels = (
-            label.replace("°", "")
-            for label in parallels.labels[: len(parallels.blocks)]
-        )
+        # the mesh of a single parallel is named after its label
+        prefix = "parallel"
+        if np.size(parallels.values) == 1:
+            prefix = f"parallel-{parallels.labels[0].replace('°', '')}"
         mesh_names = []
 
-        for label, mesh in zip(labels, parallels.blocks, strict=True):
+        for shared in meshes:
+            # a shallow copy, as the graticule meshes are shared
+            mesh = shared.copy(deep=False)
             address = f"{type(mesh).__name__}({mesh.GetAddressAsString('')})"
             postfix = f"{address}" if name is None else f"{name}-{address}"
-            mesh_name = f"parallel-{label}-{postfix}"
+            mesh_name = f"{prefix}-{postfix}"
             mesh_names.append(mesh_name)
             self.add_mesh(mesh, name=mesh_name, **mesh_args)
 
         if show_labels:
-            if len(mesh_names) == 1:
-                (labels_name,) = mesh_names
+            if np.size(parallels.values) == 1 and mesh_names:
+                labels_name = mesh_names[0]
             else:
                 labels_name = "parallel" if name is None else f"parallel-{name}"
 
@@ -1464,6 +1568,147 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
 
         return self.add_mesh(mesh, style=style, scalars=scalars, **kwargs)
 
+    def pick_points(
+        self,
+        actor: pv.Actor,
+        xs: ArrayLike,
+        ys: ArrayLike,
+        *,
+        scalars: str | None = None,
+    ) -> PickResult:
+        """Pick the mesh cells and data values at projected spatial points.
+
+        The spatial points are located within the mesh rendered by the `actor`,
+        and inverse transformed to geographic longitudes and latitudes. The cell
+        locator of the mesh is built once and reused by subsequent picks, and
+        the inverse transformation uses a cached :class:`pyproj.Transformer`,
+        hence picking is cheap enough to be performed on every mouse-move event
+        for many thousands of spatial points.
+
+        Parameters
+        ----------
+        actor : Actor
+            The actor of a mesh added to the plotter e.g., by
+            :meth:`~geovista.geoplotter.GeoPlotterBase.add_mesh`.
+        xs : ArrayLike
+            The spatial x-values, in canonical plotter CRS units, to pick.
+        ys : ArrayLike
+            The spatial y-values, in canonical plotter CRS units, to pick.
+        scalars : str, optional
+            The name of the cell or point data array of the mesh to pick values
+            from. Point data is interpolated within the containing cell.
+            Defaults to the active scalars of the mesh, if any.
+
+        Returns
+        -------
+        PickResult
+            The longitudes, latitudes, original mesh cell-ids and data values of
+            the picked spatial points.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        The original cell-ids are those of the mesh before it was sliced, and
+        a spatial point is picked by at most one cell.
+
+        """
+        if self.crs.is_geographic:
+            emsg = (
+                "Cannot pick points, requires a projected plotter coordinate "
+                "reference system (CRS)."
+            )
+            raise ValueError(emsg)
+
+        mesh = actor.mapper.dataset
+        x, y = np.ravel(xs), np.ravel(ys)
+
+        if x.shape != y.shape:
+            emsg = (
+                "Cannot pick points, require 'xs' and 'ys' to have the same shape, "
+                f"got {x.shape} and {y.shape}."
+            )
+            raise ValueError(emsg)
+
+        key = id(mesh)
+        mtime = mesh.GetMTime()
+        cached = self._pick_locators.get(key)
+
+        if cached is None or cached[0] is not mesh or cached[1] != mtime:
+            locator = pv._vtk.vtkStaticCellLocator()  # noqa: SLF001
+            locator.SetDataSet(mesh)
+            locator.BuildLocator()
+            self._pick_locators[key] = (mesh, mtime, locator)
+        else:
+            locator = cached[2]
+
+        if scalars is None:
+            scalars = mesh.active_scalars_name
+
+        association = None
+        if scalars is not None:
+            association = mesh.get_array_association(scalars, preference="cell")
+
+        interpolate = association == pv.FieldAssociation.POINT
+        n_points = x.size
+        # the rendered projected mesh is planar, but may be offset by a zlevel
+        _, _, _, _, zmin, zmax = mesh.bounds
+        points = np.empty((n_points, 3))
+        points[:, 0], points[:, 1], points[:, 2] = x, y, (zmin + zmax) / 2
+        cids = np.empty(n_points, dtype=int)
+
+        if interpolate:
+            cell = pv._vtk.vtkGenericCell()  # noqa: SLF001
+            sub_id = pv._vtk.reference(0)  # noqa: SLF001
+            pcoords = [0.0] * 3
+            size = mesh.GetMaxCellSize()
+            weights = [0.0] * size
+            pids = np.zeros((n_points, size), dtype=int)
+            pweights = np.zeros((n_points, size))
+
+            for i, point in enumerate(points):
+                cids[i] = cid = locator.FindCell(
+                    point, 0.0, cell, sub_id, pcoords, weights
+                )
+                if cid >= 0:
+                    ids = cell.GetPointIds()
+                    n_ids = ids.GetNumberOfIds()
+                    pids[i, :n_ids] = [ids.GetId(j) for j in range(n_ids)]
+                    pweights[i, :n_ids] = weights[:n_ids]
+        else:
+            for i, point in enumerate(points):
+                cids[i] = locator.FindCell(point)
+
+        found = cids >= 0
+        cell_ids = np.full(n_points, -1, dtype=int)
+
+        if GV_CELL_IDS in mesh.cell_data:
+            cell_ids[found] = mesh.cell_data[GV_CELL_IDS][cids[found]]
+        else:
+            cell_ids[found] = cids[found]
+
+        values = None
+        if association is not None:
+            data = np.asanyarray(mesh[scalars])
+            values = np.full((n_points, *data.shape[1:]), np.nan)
+            if interpolate:
+                weights_shape = (-1, size) + (1,) * (data.ndim - 1)
+                values[found] = np.sum(
+                    data[pids[found]] * pweights[found].reshape(weights_shape),
+                    axis=1,
+                )
+            else:
+                values[found] = data[cids[found]]
+
+        lonlat = np.asarray(
+            transform_points(src_crs=self.crs, tgt_crs=WGS84, xs=x, ys=y, trap=False)
+        )
+        lons, lats = lonlat[:, 0], lonlat[:, 1]
+        invalid = ~(np.isfinite(lons) & np.isfinite(lats))
+        lons[invalid] = lats[invalid] = np.nan
+
+        return PickResult(lons=lons, lats=lats, cell_ids=cell_ids, values=values)
+
     def view_poi(
         self,
         x: float | None = None,
@@ -125,7 +125,7 @@ LONGITUDE_STOP: float = BASE + PERIOD
 
 @dataclass
 class GraticuleGrid:
-    """Graticule composed of a block of meshes, labels and their points.
+    """Graticule composed of a mesh of lines, labels and their points.
 
     Notes
     -----
@@ -133,8 +133,10 @@ class GraticuleGrid:
 
     """
 
-    blocks: pv.MultiBlock
-    """Meridian/Parallel meshes in a multi-block dataset."""
+    mesh: pv.PolyData
+    """Meridian/Parallel lines combined in a single polyline mesh."""
+    values: ArrayLike
+    """The longitude/latitude (degrees) of each meridian/parallel line in the mesh."""
     lonlat: ArrayLike
     """The longitude/latitude points for the meridian/parallel labels."""
     labels: list[str]
@@ -142,6 +144,139 @@ class GraticuleGrid:
     mask: ArrayLike | None = None
     """A mask for closed interval meridians, if applicable."""
 
+    @property
+    def blocks(self) -> pv.MultiBlock:
+        """Meridian/Parallel meshes in a multi-block dataset.
+
+        Each meridian/parallel line is extracted from the :attr:`mesh` as a
+        separate block.
+
+        Returns
+        -------
+        MultiBlock
+            The meridian/parallel meshes.
+
+        Notes
+        -----
+        .. versionadded:: 0.3.0
+
+        """
+        result = pv.MultiBlock()
+
+        for index, value in enumerate(self.values):
+            result[f"{index},{value}"] = self.extract([index])
+
+        return result
+
+    def extract(self, lines: ArrayLike) -> pv.PolyData:
+        """Extract the meridian/parallel lines from the :attr:`mesh`.
+
+        Parameters
+        ----------
+        lines : ArrayLike
+            The indices of the meridian/parallel lines to extract.
+
+        Returns
+        -------
+        PolyData
+            The mesh of the extracted lines. The closed interval meridian
+            marker is only attached to the mesh when it contains the seam.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        lines = np.asarray(lines, dtype=int).reshape(-1)
+        n_values = np.size(self.values)
+        n_points = self.mesh.n_points // n_values if n_values else 0
+        n_cells = self.mesh.n_lines // n_values if n_values else 0
+
+        pids = (lines[:, np.newaxis] * n_points + np.arange(n_points)).reshape(-1)
+        cids = (lines[:, np.newaxis] * n_cells + np.arange(n_cells)).reshape(-1)
+        connectivity = self.mesh.lines.reshape(-1, 3)[cids]
+        # renumber the points of each line relative to its extracted position
+        shift = np.repeat((np.arange(lines.size) - lines) * n_points, n_cells)
+        connectivity[:, 1:] += shift[:, np.newaxis]
+
+        result = (
+            pv.PolyData(self.mesh.points[pids], lines=connectivity)
+            if pids.size
+            else pv.PolyData()
+        )
+        to_wkt(result, WGS84)
+
+        if GV_REMESH_POINT_IDS in self.mesh.point_data:
+            seam = self.mesh[GV_REMESH_POINT_IDS][pids]
+            if np.any(seam == REMESH_SEAM):
+                result.point_data[GV_REMESH_POINT_IDS] = seam
+                result.set_active_scalars(name=None)
+
+        return result
+
+
+def _polylines(
+    lons: ArrayLike,
+    lats: ArrayLike,
+    n_lines: int,
+    *,
+    closed: bool,
+    radius: float | None = None,
+    zlevel: int | None = None,
+    zscale: float | None = None,
+) -> pv.PolyData:
+    """Combine graticule lines with the same number of points into a single mesh.
+
+    Parameters
+    ----------
+    lons : ArrayLike
+        The longitudes (degrees) of the points of all lines, ordered by line.
+    lats : ArrayLike
+        The latitudes (degrees) of the points of all lines, ordered by line.
+    n_lines : int
+        The number of lines.
+    closed : bool
+        Whether each line is a closed loop, with its last point connected to
+        its first point.
+    radius : float, optional
+        The radius of the sphere. Defaults to :data:`geovista.common.RADIUS`.
+    zlevel : int, optional
+        The z-axis level. Used in combination with the `zscale` to offset the
+        `radius` by a proportional amount i.e., ``radius * zlevel * zscale``.
+    zscale : float, optional
+        The proportional multiplier for z-axis `zlevel`. Defaults to
+        :data:`geovista.common.ZLEVEL_SCALE`.
+
+    Returns
+    -------
+    PolyData
+        The polyline mesh, with the lines stored in order.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if n_lines == 0:
+        result = pv.PolyData()
+    else:
+        xyz = to_cartesian(lons, lats, radius=radius, zlevel=zlevel, zscale=zscale)
+        starts = np.arange(xyz.shape[0]).reshape(n_lines, -1)
+        ends = np.roll(starts, -1, axis=1)
+
+        if not closed:
+            # a line with N points has N-1 segments
+            starts, ends = starts[:, :-1], ends[:, :-1]
+
+        lines = np.column_stack(
+            [np.full(starts.size, 2), starts.reshape(-1), ends.reshape(-1)]
+        )
+        result = pv.PolyData(xyz, lines=lines)
+
+    to_wkt(result, WGS84)
+
+    return result
+
 
 def _step_period(lon: float, lat: float) -> tuple[float, float]:
     """Wrap graticule meridian/parallel step size (degrees) to sane upper bounds.
@@ -332,52 +467,37 @@ def create_meridians(
         lons = np.unique(wrap(lons))
 
     lats = np.linspace(LATITUDE_START, LATITUDE_STOP, num=n_samples)
-    blocks = pv.MultiBlock()
-
-    for index, lon in enumerate(lons):
-        xyz = to_cartesian(
-            np.ones_like(lats) * lon,
-            lats,
-            radius=radius,
-            zlevel=zlevel,
-            zscale=zscale,
-        )
-        # a meridian with N points has N-1 lines
-        n_points = xyz.shape[0] - 1
-        lines = np.full((n_points, 3), 2, dtype=int)
-        lines[:, 1] = np.arange(n_points)
-        lines[:, 2] = np.arange(n_points) + 1
-
-        mesh = pv.PolyData(xyz, lines=lines)
-        to_wkt(mesh, WGS84)
-
-        if closed_interval and mask[index]:
-            # mark this meridian as the closed interval wrap
-            seam = np.empty(mesh.n_points, dtype=int)
-            seam.fill(REMESH_SEAM)
-            mesh.point_data[GV_REMESH_POINT_IDS] = seam
-            mesh.set_active_scalars(name=None)
+    mesh = _polylines(
+        np.repeat(lons, n_samples),
+        np.tile(lats, lons.size),
+        lons.size,
+        closed=False,
+        radius=radius,
+        zlevel=zlevel,
+        zscale=zscale,
+    )
 
-        blocks[f"{index},{lon}"] = mesh
+    if closed_interval:
+        # mark the closed interval wrap meridian
+        mesh.point_data[GV_REMESH_POINT_IDS] = (
+            np.repeat(mask, n_samples).astype(int) * REMESH_SEAM
+        )
+        mesh.set_active_scalars(name=None)
 
-    grid_points, grid_labels = [], []
     labels = create_meridian_labels(list(lons))
     grid_lats = np.arange(LATITUDE_START, LATITUDE_STOP, lat_step, dtype=float) + (
         lat_step / 2
     )
-
-    for lat in grid_lats:
-        lonlat = np.vstack([lons, np.ones_like(lons, dtype=float) * lat]).T
-        grid_points.append(lonlat)
-        grid_labels.extend(labels)
-
-    grid_points = np.vstack(grid_points)
+    grid_points = np.column_stack(
+        [np.tile(lons, grid_lats.size), np.repeat(grid_lats, lons.size)]
+    )
+    grid_labels = labels * grid_lats.size
 
     if mask is not None:
         mask = np.tile(mask, grid_lats.size)
 
     return GraticuleGrid(
-        blocks=blocks, lonlat=grid_points, labels=grid_labels, mask=mask
+        mesh=mesh, values=lons, lonlat=grid_points, labels=grid_labels, mask=mask
     )
 
 
@@ -538,43 +658,29 @@ def create_parallels(
     lats = np.arange(start, stop + lat_step, lat_step, dtype=float)
     lons = wrap(np.linspace(LONGITUDE_START, LONGITUDE_STOP, num=n_samples + 1)[:-1])
 
-    grid_lats = []
-    blocks = pv.MultiBlock()
-
-    for index, lat in enumerate(lats):
-        if not poles_parallel and np.isclose(np.abs(lat), 90.0):
-            continue
+    poles = np.isclose(np.abs(lats), 90.0)
+    grid_lats = lats if poles_parallel else lats[~poles]
+    mesh = _polylines(
+        np.tile(lons, grid_lats.size),
+        np.repeat(grid_lats, lons.size),
+        grid_lats.size,
+        closed=True,
+        radius=radius,
+        zlevel=zlevel,
+        zscale=zscale,
+    )
 
-        xyz = to_cartesian(
-            lons,
-            np.ones_like(lons) * lat,
-            radius=radius,
-            zlevel=zlevel,
-            zscale=zscale,
-        )
-        # a parallel is a closed loop with N points and N lines
-        n_points = xyz.shape[0]
-        lines = np.full((n_points, 3), 2, dtype=int)
-        lines[:, 1] = np.arange(n_points)
-        lines[:, 2] = np.arange(n_points) + 1
-        lines[-1, 2] = 0
-
-        mesh = pv.PolyData(xyz, lines=lines)
-        to_wkt(mesh, WGS84)
-        blocks[f"{index},{lat}"] = mesh
-        grid_lats.append(lat)
-
-    grid_points, grid_labels = [], []
-    labels = create_parallel_labels(grid_lats, poles_parallel=poles_parallel)
+    labels = create_parallel_labels(list(grid_lats), poles_parallel=poles_parallel)
     grid_lons = wrap(
         np.arange(LONGITUDE_START, LONGITUDE_STOP, lon_step, dtype=float)
         + (lon_step / 2)
     )
-
-    for lon in grid_lons:
-        lonlat = np.vstack([np.ones_like(grid_lats, dtype=float) * lon, grid_lats]).T
-        grid_points.append(lonlat)
-        grid_labels.extend(labels)
+    grid_points = [
+        np.column_stack(
+            [np.repeat(grid_lons, grid_lats.size), np.tile(grid_lats, grid_lons.size)]
+        )
+    ]
+    grid_labels = labels * grid_lons.size
 
     if not poles_parallel and poles_label:
         lonlat = []
@@ -592,4 +698,6 @@ def create_parallels(
 
     grid_points = np.vstack(grid_points)
 
-    return GraticuleGrid(blocks=blocks, lonlat=grid_points, labels=grid_labels)
+    return GraticuleGrid(
+        mesh=mesh, values=grid_lats, lonlat=grid_points, labels=grid_labels
+    )
@@ -0,0 +1,851 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Support to regrid data from a source mesh onto a target mesh.
+
+Notes
+-----
+.. versionadded:: 0.6.0
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import lazy_loader as lazy
+
+import geovista
+import geovista.config as gvc
+
+from .common import StrEnumPlus, fingerprint
+from .crs import WGS84, from_wkt
+from .search import (
+    KDTREE_PREFERENCE,
+    KDTree,
+    SearchPreference,
+    _cartesian,
+    _polygons,
+    _unit,
+)
+from .transform import _map_chunks
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
+    from pyproj import CRS
+    import pyvista as pv
+
+# lazy import third-party dependencies
+np = lazy.load("numpy")
+
+__all__ = [
+    "REGRID_CACHE_DIR",
+    "REGRID_K",
+    "REGRID_PERSIST",
+    "REGRID_POWER",
+    "REGRID_SCHEME",
+    "RegridScheme",
+    "RegridWeights",
+    "Regridder",
+]
+
+REGRID_CACHE_DIR: str = "regrid"
+"""The sub-directory of the geovista cache directory of persisted regrid weights."""
+
+REGRID_K: int = 4
+"""The default number of source neighbours per target of inverse-distance regridding."""
+
+REGRID_PERSIST: bool = False
+"""The default regrid weights persistence within the geovista cache directory."""
+
+REGRID_POWER: float = 2.0
+"""The default power of the inverse-distance regrid weights."""
+
+REGRID_SCHEME: str = "nearest"
+"""The default regrid scheme."""
+
+_REGRID_BATCH_SIZE: int = 2**24
+"""The maximum number of weighted source values gathered per regrid batch."""
+
+_REGRID_CHUNK_SIZE: int = 2**14
+"""The number of overlapping source and target cell pairs per area-weighted chunk."""
+
+_REGRID_SCHEMA: int = 1
+"""The version of the persisted regrid weights format."""
+
+
+class RegridScheme(StrEnumPlus):
+    """Enumeration of regrid schemes.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    AREA = "area"
+    """Area-weighted by the spherical overlap of the source and target cells."""
+    IDW = "idw"
+    """Inverse-distance weighted by the great-circle distance of the nearest
+    source neighbours."""
+    NEAREST = "nearest"
+    """Nearest source neighbour."""
+
+
+class RegridWeights(NamedTuple):
+    """The sparse regrid weights of each target in CSR format.
+
+    The source indices and weights of the ``i``-th target are
+    ``indices[offsets[i]:offsets[i + 1]]`` and ``weights[offsets[i]:offsets[i + 1]]``.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    offsets: np.ndarray
+    """The offsets of the source contributions of each target."""
+    indices: np.ndarray
+    """The concatenated source indices of the contributions."""
+    weights: np.ndarray
+    """The concatenated normalised weights of the contributions."""
+
+
+class Regridder:  # numpydoc ignore=PR01
+    """Regrid data from a source mesh onto a target mesh.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    def __init__(
+        self,
+        src: pv.PolyData,
+        tgt: pv.PolyData,
+        /,
+        *,
+        scheme: str | RegridScheme | None = None,
+        src_preference: str | SearchPreference | None = None,
+        tgt_preference: str | SearchPreference | None = None,
+        k: int | None = None,
+        power: float | None = None,
+        persist: bool | None = None,
+    ) -> None:
+        """Precompute the sparse regrid weights from the `src` to the `tgt` mesh.
+
+        The weights are calculated once for the pair of meshes, and then applied
+        to any number of source data arrays with :meth:`regrid`.
+
+        Parameters
+        ----------
+        src : PolyData
+            The source mesh defining the points, cells and CRS of the data.
+        tgt : PolyData
+            The target mesh defining the points, cells and CRS of the result.
+        scheme : str or RegridScheme, optional
+            The regrid scheme. Also see :class:`RegridScheme`. Defaults to
+            :data:`REGRID_SCHEME`.
+        src_preference : str or SearchPreference, optional
+            The source data located on the `src` mesh points ``point`` or cells
+            ``center``. Also see :class:`~geovista.search.SearchPreference`.
+            Defaults to :data:`~geovista.search.KDTREE_PREFERENCE`, or ``center``
+            for the ``area`` `scheme`.
+        tgt_preference : str or SearchPreference, optional
+            The result located on the `tgt` mesh points ``point`` or cells
+            ``center``. Defaults as for `src_preference`.
+        k : int, optional
+            The number of nearest source neighbours per target of the ``idw``
+            `scheme`. Defaults to :data:`REGRID_K`.
+        power : float, optional
+            The power of the inverse great-circle distance weights of the ``idw``
+            `scheme`. Defaults to :data:`REGRID_POWER`.
+        persist : bool, optional
+            Save the regrid weights to the :data:`REGRID_CACHE_DIR` sub-directory
+            of the :data:`geovista.config.resources` ``cache_dir``, keyed on the
+            geometry fingerprint and CRS of both meshes and the regrid options.
+            Subsequent regridders of the same meshes load the saved weights rather
+            than recalculating them. Defaults to :data:`REGRID_PERSIST`.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        The ``area`` `scheme` calculates the exact overlap of each pair of
+        source and target cells, with the edges of each cell as great-circle
+        arcs between its vertices. The cells are assumed to be convex. The
+        weights of each target are normalised by its overlapped area, rather
+        than its total area, so a target partially overlapping the source mesh
+        is the mean of the overlapping source cells.
+
+        """
+        if scheme is None:
+            scheme = REGRID_SCHEME
+
+        if not RegridScheme.valid(scheme):
+            options = " or ".join(f"{item!r}" for item in RegridScheme.values())
+            emsg = f"Expected a regrid scheme of {options}, got '{scheme}'."
+            raise ValueError(emsg)
+
+        self._scheme = RegridScheme(scheme)
+        default = (
+            SearchPreference.CENTER
+            if self._scheme == RegridScheme.AREA
+            else KDTREE_PREFERENCE
+        )
+        preferences = []
+
+        for value in (src_preference, tgt_preference):
+            preference = default if value is None else value
+
+            if not SearchPreference.valid(preference):
+                options = " or ".join(f"{item!r}" for item in SearchPreference.values())
+                emsg = f"Expected a preference of {options}, got '{preference}'."
+                raise ValueError(emsg)
+
+            preference = SearchPreference(preference)
+
+            if (
+                self._scheme == RegridScheme.AREA
+                and preference != SearchPreference.CENTER
+            ):
+                emsg = (
+                    f"Expected a '{SearchPreference.CENTER}' preference for the "
+                    f"'{self._scheme}' regrid scheme, got '{preference}'."
+                )
+                raise ValueError(emsg)
+
+            preferences.append(preference)
+
+        self._src_preference, self._tgt_preference = preferences
+        self._k = REGRID_K if k is None else int(k)
+        self._power = REGRID_POWER if power is None else float(power)
+
+        if self._scheme == RegridScheme.IDW and self._k < 1:
+            emsg = f"Expected a positive number of neighbours, got '{self._k}'."
+            raise ValueError(emsg)
+
+        if persist is None:
+            persist = REGRID_PERSIST
+
+        self._n_src = (
+            src.n_points
+            if self._src_preference == SearchPreference.POINT
+            else src.n_cells
+        )
+        self._n_tgt = (
+            tgt.n_points
+            if self._tgt_preference == SearchPreference.POINT
+            else tgt.n_cells
+        )
+        src_crs: CRS | None = from_wkt(src)
+        tgt_crs: CRS | None = from_wkt(tgt)
+        src_crs = WGS84 if src_crs is None else src_crs
+        tgt_crs = WGS84 if tgt_crs is None else tgt_crs
+        entry = None
+
+        if persist:
+            key = self._key(src, src_crs, tgt, tgt_crs)
+            entry = self._load(key)
+
+        if entry is None:
+            if self._scheme == RegridScheme.AREA:
+                entry = self._area(src, src_crs, tgt, tgt_crs)
+            else:
+                entry = self._nearest(src, tgt, tgt_crs)
+
+            if persist:
+                self._save(key, entry)
+
+        self._weights = entry
+
+    def __repr__(self) -> str:
+        """Serialize :class:`Regridder` representation.
+
+        Returns
+        -------
+        str
+            String representation of the instance.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        klass = f"{self.__class__.__name__}"
+        sizes = f"N SOURCE: {self._n_src}, N TARGET: {self._n_tgt}"
+        return f"{klass}({sizes}, scheme='{self._scheme}')"
+
+    def _key(
+        self, src: pv.PolyData, src_crs: CRS, tgt: pv.PolyData, tgt_crs: CRS
+    ) -> str:
+        """Compute the persisted entry key of the regrid weights.
+
+        Parameters
+        ----------
+        src : PolyData
+            The source mesh.
+        src_crs : CRS
+            The Coordinate Reference System (CRS) of the `src` mesh.
+        tgt : PolyData
+            The target mesh.
+        tgt_crs : CRS
+            The Coordinate Reference System (CRS) of the `tgt` mesh.
+
+        Returns
+        -------
+        str
+            The hexadecimal digest key.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        # stale entries of other geovista releases or entry formats never match
+        digest.update(f"{_REGRID_SCHEMA}:{geovista.__version__}".encode())
+
+        for mesh, crs in ((src, src_crs), (tgt, tgt_crs)):
+            digest.update(fingerprint(mesh).encode())
+            digest.update(crs.to_wkt().encode())
+
+        options = f"{self._scheme}:{self._src_preference}:{self._tgt_preference}"
+
+        if self._scheme == RegridScheme.IDW:
+            options = f"{options}:{self._k}:{self._power}"
+
+        digest.update(options.encode())
+        return digest.hexdigest()
+
+    def _load(self, key: str) -> RegridWeights | None:
+        """Load the persisted regrid weights, if available.
+
+        Parameters
+        ----------
+        key : str
+            The persisted entry key.
+
+        Returns
+        -------
+        RegridWeights
+            The regrid weights, or ``None`` if there is no such valid entry.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        fname = Path(gvc.resources["cache_dir"]) / REGRID_CACHE_DIR / f"{key}.npz"
+        entry = None
+
+        try:
+            with np.load(fname, allow_pickle=False) as npz:
+                entry = RegridWeights(*(npz[name] for name in RegridWeights._fields))
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, ValueError):
+            pass
+
+        valid = (
+            entry is not None
+            and entry.offsets.shape == (self._n_tgt + 1,)
+            and entry.offsets.dtype.kind == "i"
+            and entry.offsets[0] == 0
+            and entry.indices.shape == entry.weights.shape == (entry.offsets[-1],)
+            and entry.indices.dtype.kind == "i"
+            and entry.weights.dtype == np.float64
+            and np.all(entry.indices < self._n_src)
+        )
+
+        if not valid:
+            # purge the corrupt entry
+            fname.unlink(missing_ok=True)
+            entry = None
+
+        return entry
+
+    @staticmethod
+    def _save(key: str, entry: RegridWeights) -> None:
+        """Persist the regrid weights.
+
+        Parameters
+        ----------
+        key : str
+            The persisted entry key.
+        entry : RegridWeights
+            The regrid weights.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        cache_dir = Path(gvc.resources["cache_dir"]) / REGRID_CACHE_DIR
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            fname = cache_dir / f"{key}.npz"
+            tmp = fname.with_name(f"{fname.name}.{os.getpid()}.tmp")
+            with tmp.open("wb") as fh:
+                np.savez(fh, allow_pickle=False, **entry._asdict())
+            # atomic replacement, safe for concurrent processes
+            tmp.replace(fname)
+        except OSError:
+            # persistence is an optimisation, so a read-only cache is not fatal
+            pass
+
+    @property
+    def n_src(self) -> int:
+        """The number of source data values.
+
+        Returns
+        -------
+        int
+            The number of source points or cells.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return self._n_src
+
+    @property
+    def n_tgt(self) -> int:
+        """The number of target data values.
+
+        Returns
+        -------
+        int
+            The number of target points or cells.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return self._n_tgt
+
+    @property
+    def scheme(self) -> RegridScheme:
+        """The regrid scheme.
+
+        Returns
+        -------
+        RegridScheme
+            The scheme of the regrid weights.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return self._scheme
+
+    @property
+    def weights(self) -> RegridWeights:
+        """The sparse regrid weights.
+
+        Returns
+        -------
+        RegridWeights
+            The CSR offsets, source indices and normalised weights of each target.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return self._weights
+
+    def regrid(self, data: ArrayLike, /) -> np.ndarray:
+        """Regrid the source data onto the target mesh.
+
+        The data is regridded in batches, each with a single gather and
+        segmented sum of the weighted source values. Source values that are
+        ``NaN`` are excluded, with the weights of each target renormalised over
+        its remaining source values.
+
+        Parameters
+        ----------
+        data : ArrayLike
+            The source data of shape ``(N,)``, or a stack of source data of shape
+            ``(T, N)``, where ``N`` is :attr:`n_src`.
+
+        Returns
+        -------
+        ndarray
+            The regridded data of shape ``(M,)`` or ``(T, M)``, where ``M`` is
+            :attr:`n_tgt`. A target without any contributing source values is
+            ``NaN``.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        data = np.asarray(data)
+
+        if data.ndim not in (1, 2) or data.shape[-1] != self._n_src:
+            emsg = (
+                f"Expected source data of shape ({self._n_src},) or "
+                f"(T, {self._n_src}), got {data.shape}."
+            )
+            raise ValueError(emsg)
+
+        dtype = data.dtype if data.dtype.kind == "f" else np.float64
+        values = np.atleast_2d(data).astype(dtype, copy=False)
+        result = np.empty((values.shape[0], self._n_tgt), dtype=dtype)
+        batch = max(_REGRID_BATCH_SIZE // max(self._weights.indices.size, 1), 1)
+
+        for start in range(0, values.shape[0], batch):
+            stop = start + batch
+            result[start:stop] = self._matmul(values[start:stop])
+
+        return result[0] if data.ndim == 1 else result
+
+    def _matmul(self, values: np.ndarray) -> np.ndarray:
+        """Apply the sparse regrid weights to a batch of source data.
+
+        Parameters
+        ----------
+        values : ndarray
+            The source data of shape ``(T, N)``.
+
+        Returns
+        -------
+        ndarray
+            The regridded data of shape ``(T, M)``.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        offsets, indices, weights = self._weights
+        result = np.full((values.shape[0], self._n_tgt), np.nan, dtype=values.dtype)
+
+        if not indices.size:
+            return result
+
+        # the first contribution of each target with contributions, as empty
+        # targets would otherwise be reduced to the next contribution
+        starts = offsets[:-1]
+        covered = offsets[1:] > starts
+        starts = starts[covered]
+        gathered = values[:, indices]
+
+        if np.any(missing := np.isnan(gathered)):
+            scale = np.where(missing, 0, weights)
+            gathered[missing] = 0
+            total = np.add.reduceat(gathered * scale, starts, axis=1)
+            norm = np.add.reduceat(scale, starts, axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result[:, covered] = total / norm
+        else:
+            result[:, covered] = np.add.reduceat(gathered * weights, starts, axis=1)
+
+        return result
+
+    def _nearest(
+        self, src: pv.PolyData, tgt: pv.PolyData, tgt_crs: CRS
+    ) -> RegridWeights:
+        """Calculate the nearest or inverse-distance regrid weights.
+
+        Parameters
+        ----------
+        src : PolyData
+            The source mesh.
+        tgt : PolyData
+            The target mesh.
+        tgt_crs : CRS
+            The Coordinate Reference System (CRS) of the `tgt` mesh.
+
+        Returns
+        -------
+        RegridWeights
+            The regrid weights.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        k = 1 if self._scheme == RegridScheme.NEAREST else self._k
+        k = min(k, self._n_src)
+        offsets = np.arange(self._n_tgt + 1, dtype=np.int64) * k
+
+        if not k or not self._n_tgt:
+            return RegridWeights(
+                offsets=np.zeros(self._n_tgt + 1, dtype=np.int64),
+                indices=np.empty(0, dtype=np.int64),
+                weights=np.empty(0),
+            )
+
+        kdtree = KDTree(src, preference=self._src_preference)
+        xyz = _unit(_cartesian(tgt, tgt_crs, self._tgt_preference))
+        _, idx = kdtree.query(*_lonlat(xyz), k=k)
+        indices = np.reshape(idx, (-1, k)).astype(np.int64)
+
+        if k == 1:
+            weights = np.ones(indices.shape)
+        else:
+            # the great-circle distance of the unit chord, as the cell centers
+            # are not on the sphere
+            chord = np.linalg.norm(
+                _unit(kdtree.points)[indices] - xyz[:, np.newaxis], axis=-1
+            )
+            theta = 2 * np.arcsin(np.minimum(chord / 2, 1))
+            # a target coincident with a source takes the source value
+            exact = theta <= np.finfo(float).eps
+            coincident = np.any(exact, axis=1, keepdims=True)
+            with np.errstate(divide="ignore"):
+                weights = np.where(coincident, exact, theta**-self._power)
+            weights /= weights.sum(axis=1, keepdims=True)
+
+        return RegridWeights(
+            offsets=offsets, indices=indices.ravel(), weights=weights.ravel()
+        )
+
+    def _area(
+        self, src: pv.PolyData, src_crs: CRS, tgt: pv.PolyData, tgt_crs: CRS
+    ) -> RegridWeights:
+        """Calculate the area-weighted regrid weights.
+
+        The candidate source cells of each target cell are those with a cell
+        center within the sum of the maximum source and target cell radii,
+        which are then clipped against the target cell.
+
+        Parameters
+        ----------
+        src : PolyData
+            The source mesh.
+        src_crs : CRS
+            The Coordinate Reference System (CRS) of the `src` mesh.
+        tgt : PolyData
+            The target mesh.
+        tgt_crs : CRS
+            The Coordinate Reference System (CRS) of the `tgt` mesh.
+
+        Returns
+        -------
+        RegridWeights
+            The regrid weights.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        cells = []
+
+        for mesh, crs in ((src, src_crs), (tgt, tgt_crs)):
+            points = _unit(_cartesian(mesh, crs, SearchPreference.POINT))
+            centers = _unit(_cartesian(mesh, crs, SearchPreference.CENTER))
+            vertices, valid, orientation = _polygons(mesh, points, centers)
+            cosine = np.einsum("ij,ikj->ik", centers, points[vertices])
+            radius = np.arccos(np.clip(cosine.min(axis=1, initial=1), -1, 1))
+            cells.append((points, centers, vertices, valid, orientation, radius))
+
+        src_points, _, src_vertices, src_valid, src_orientation, src_radius = cells[0]
+        tgt_points, tgt_centers, tgt_vertices, tgt_valid, _, tgt_radius = cells[1]
+
+        # the candidate overlapping source cells of each target cell
+        kdtree = KDTree(src, preference=SearchPreference.CENTER)
+        distance = src_radius.max(initial=0) + tgt_radius.max(initial=0)
+        lons, lats = _lonlat(tgt_centers)
+        neighbours = kdtree.query_radius(
+            lons, lats, distance, units="rad", return_distance=True
+        )
+        rows = np.repeat(np.arange(self._n_tgt), np.diff(neighbours.offsets))
+        cols = neighbours.indices
+        # the cells with overlapping bounding circles
+        keep = neighbours.distances <= (tgt_radius[rows] + src_radius[cols]) * (
+            1 + 1e-9
+        )
+        keep &= tgt_valid[rows] & src_valid[cols]
+        rows, cols = rows[keep], cols[keep]
+
+        # the outward great-circle plane of each source cell edge
+        a = src_points[src_vertices]
+        b = src_points[np.roll(src_vertices, -1, axis=1)]
+        planes = np.cross(a, b) * src_orientation[:, np.newaxis, np.newaxis]
+
+        overlap = np.empty(rows.size)
+
+        def worker(start: int) -> None:
+            """Calculate the overlap of a chunk of the cell pairs.
+
+            Parameters
+            ----------
+            start : int
+                The index of the first cell pair of the chunk.
+
+            """
+            chunk = slice(start, start + _REGRID_CHUNK_SIZE)
+            subject = tgt_points[tgt_vertices[rows[chunk]]]
+            clipping = planes[cols[chunk]]
+            # exclude the target cells wholly outside of any source cell edge
+            side = np.einsum("pwi,pei->pew", subject, clipping)
+            keep = ~np.any(np.all(side < 0, axis=2), axis=1)
+            area = np.zeros(keep.size)
+            area[keep] = _spherical_area(_clip(subject[keep], clipping[keep]))
+            overlap[chunk] = area
+
+        _map_chunks(
+            worker,
+            rows.size,
+            workers=max(int(gvc.GEOVISTA_TRANSFORM_WORKERS), 1),
+            chunk_size=_REGRID_CHUNK_SIZE,
+        )
+
+        # discard the numerical noise of cells that only share an edge or vertex
+        area = _spherical_area(tgt_points[tgt_vertices])
+        keep = overlap > area[rows] * np.sqrt(np.finfo(float).eps)
+        rows, cols, overlap = rows[keep], cols[keep], overlap[keep]
+        norm = np.bincount(rows, weights=overlap, minlength=self._n_tgt)
+        counts = np.bincount(rows, minlength=self._n_tgt)
+        offsets = np.zeros(self._n_tgt + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        return RegridWeights(
+            offsets=offsets,
+            indices=cols.astype(np.int64),
+            weights=overlap / norm[rows],
+        )
+
+
+def _clip(subject: np.ndarray, planes: np.ndarray) -> np.ndarray:
+    """Clip each spherical polygon by the hemispheres of its clipping planes.
+
+    This is a vectorized Sutherland-Hodgman algorithm with the edges of each
+    polygon as great-circle arcs.
+
+    Parameters
+    ----------
+    subject : ndarray
+        The unit cartesian vertices of each polygon of shape ``(P, W, 3)``.
+    planes : ndarray
+        The normals of the clipping planes of each polygon of shape ``(P, E, 3)``.
+        The inside of each plane is its non-negative hemisphere, and a zero
+        normal does not clip.
+
+    Returns
+    -------
+    ndarray
+        The unit cartesian vertices of each clipped polygon, padded by repeating
+        its last vertex. The vertices of a polygon clipped away entirely are zero.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    result = subject
+
+    for j in range(planes.shape[1]):
+        side = np.einsum("pwi,pi->pw", result, planes[:, j])
+        inside = side >= 0
+        # only the polygons straddling the plane are clipped
+        cut = np.flatnonzero(~np.all(inside, axis=1))
+
+        if not cut.size:
+            continue
+
+        poly, side, inside = result[cut], side[cut], inside[cut]
+
+        # the intersection of the arc from the previous vertex with the plane
+        prev, prev_side = np.roll(poly, 1, axis=1), np.roll(side, 1, axis=1)
+        crossing = inside != np.roll(inside, 1, axis=1)
+        scale = np.sign(side - prev_side)[..., np.newaxis]
+        point = side[..., np.newaxis] * prev - prev_side[..., np.newaxis] * poly
+        point *= scale
+        norm = np.linalg.norm(point, axis=-1, keepdims=True)
+        point /= np.where(norm > 0, norm, 1)
+
+        # each vertex emits the intersection then itself, as appropriate
+        candidates = np.stack([point, poly], axis=2).reshape(cut.size, -1, 3)
+        emit = np.stack([crossing, inside], axis=2).reshape(cut.size, -1)
+        counts = emit.sum(axis=1)
+        width = max(int(counts.max()), result.shape[1])
+        compact = np.zeros((cut.size, width, 3))
+        rows, cols = np.nonzero(emit)
+        compact[rows, np.cumsum(emit, axis=1)[rows, cols] - 1] = candidates[rows, cols]
+        slots = np.minimum(np.arange(width), np.maximum(counts - 1, 0)[:, None])
+
+        if width > result.shape[1]:
+            pad = np.repeat(result[:, -1:], width - result.shape[1], axis=1)
+            result = np.concatenate([result, pad], axis=1)
+        elif result is subject:
+            result = subject.copy()
+
+        result[cut] = np.take_along_axis(compact, slots[..., np.newaxis], axis=1)
+
+    return result
+
+
+def _lonlat(xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Convert the cartesian points to geographic longitudes and latitudes.
+
+    Parameters
+    ----------
+    xyz : ndarray
+        The cartesian points of shape ``(N, 3)``.
+
+    Returns
+    -------
+    tuple of ndarray
+        The longitudes and latitudes of the points.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    xyz = _unit(xyz)
+    lons = np.degrees(np.arctan2(xyz[:, 1], xyz[:, 0]))
+    lats = np.degrees(np.arcsin(np.clip(xyz[:, 2], -1, 1)))
+    return lons, lats
+
+
+def _spherical_area(vertices: np.ndarray) -> np.ndarray:
+    """Calculate the area of each spherical polygon on the unit sphere.
+
+    The area is the sum of the solid angles of the fan triangulation of each
+    polygon, see https://doi.org/10.1109/TBME.1983.325207.
+
+    Parameters
+    ----------
+    vertices : ndarray
+        The unit cartesian vertices of each polygon of shape ``(P, W, 3)``.
+
+    Returns
+    -------
+    ndarray
+        The non-negative area (steradians) of each polygon.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    a, b, c = vertices[:, :1], vertices[:, 1:-1], vertices[:, 2:]
+    numerator = np.einsum("pwi,pwi->pw", np.broadcast_to(a, b.shape), np.cross(b, c))
+    denominator = (
+        1
+        + np.einsum("pwi,pwi->pw", np.broadcast_to(a, b.shape), b)
+        + np.einsum("pwi,pwi->pw", b, c)
+        + np.einsum("pwi,pwi->pw", c, np.broadcast_to(a, c.shape))
+    )
+    result: np.ndarray = np.abs(2 * np.arctan2(numerator, denominator).sum(axis=1))
+    return result
+
@@ -14,18 +14,33 @@ Notes
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import TYPE_CHECKING
+import hashlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import lazy_loader as lazy
 from pykdtree.kdtree import KDTree as pyKDTree
 
-from .common import VTK_CELL_IDS, StrEnumPlus, to_cartesian
+import geovista
+import geovista.config as gvc
+
+from .common import (
+    CELL_ARRAY_TYPES,
+    VTK_CELL_IDS,
+    StrEnumPlus,
+    fingerprint,
+    to_cartesian,
+)
 from .crs import WGS84, from_wkt
-from .transform import transform_points
+from .transform import _map_chunks, transform_points
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import numpy as np
     from numpy.typing import ArrayLike
+    from pyproj import CRS
     import pyvista as pv
 
     type NearestNeighbours = tuple[ArrayLike, ArrayLike]
@@ -37,19 +52,49 @@ if TYPE_CHECKING:
 
 # lazy import third-party dependencies
 np = lazy.load("numpy")
+pv = lazy.load("pyvista")
 
 __all__ = [
+    "CELL_INDEX_OCCUPANCY",
+    "EARTH_RADIUS",
+    "KDTREE_CACHE_DIR",
+    "KDTREE_CHUNK_SIZE",
+    "KDTREE_DISTANCE_UNITS",
     "KDTREE_EPSILON",
     "KDTREE_K",
     "KDTREE_LEAF_SIZE",
+    "KDTREE_PERSIST",
     "KDTREE_PREFERENCE",
+    "KDTREE_RADIUS_K",
+    "LOCATOR_K",
+    "LOCATOR_TOLERANCE",
+    "CellAdjacency",
+    "CellIndex",
+    "CellLocator",
+    "DistanceUnits",
     "KDTree",
     "NearestNeighbours",
+    "RadiusNeighbours",
     "SearchPreference",
     "find_cell_neighbours",
     "find_nearest_cell",
 ]
 
+CELL_INDEX_OCCUPANCY: int = 16
+"""The default mean number of cells per bucket of a cell index."""
+
+EARTH_RADIUS: float = 6371.0088
+"""The mean radius (kilometres) of the Earth used for great-circle distances."""
+
+KDTREE_CACHE_DIR: str = "kdtree"
+"""The sub-directory of the geovista cache directory of persisted kd-trees."""
+
+KDTREE_CHUNK_SIZE: int = 2**16
+"""The number of points-of-interest per kd-tree radius query chunk."""
+
+KDTREE_DISTANCE_UNITS: str = "km"
+"""The default kd-tree radius query distance units."""
+
 KDTREE_EPSILON: float = 0.0
 """The default kd-tree nearest neighbour epsilon."""
 
@@ -59,112 +104,132 @@ KDTREE_K: int = 1
 KDTREE_LEAF_SIZE: int = 16
 """The default kd-tree leaf-size."""
 
+KDTREE_PERSIST: bool = False
+"""The default kd-tree persistence within the geovista cache directory."""
+
 KDTREE_PREFERENCE: str = "point"
 """The default search preference."""
 
+KDTREE_RADIUS_K: int = 32
+"""The initial number of neighbours per point-of-interest of a radius query."""
 
-class SearchPreference(StrEnumPlus):
-    """Enumeration of mesh geometry search preferences.
+LOCATOR_K: int = 8
+"""The default number of candidate cells per point-of-interest of a cell locator."""
 
-    Notes
-    -----
-    .. versionadded:: 0.3.0
+LOCATOR_TOLERANCE: float = 1e-10
+"""The default angular tolerance (radians) of a point-of-interest on a cell edge."""
 
-    """
+_LOCATOR_CHUNK_SIZE: int = 2**13
+"""The number of points-of-interest located per cell locator chunk."""
 
-    CENTER = "center"
-    """Preference to search the cell centers."""
-    POINT = "point"
-    """Preference to search the mesh points."""
+_KDTREE_GRID_CANDIDATES: int = 2**22
+"""The maximum number of candidate data points gathered per uniform grid batch."""
 
+_KDTREE_MORTON_BITS: int = 10
+"""The number of bits per axis of the kd-tree data point spatial order."""
 
-class KDTree:  # numpydoc ignore=PR01
-    """Construct a kd-tree for fast nearest neighbour search of a mesh.
+_MORTON_MASKS: tuple[tuple[int, int], ...] = (
+    (16, 0x030000FF),
+    (8, 0x0300F00F),
+    (4, 0x030C30C3),
+    (2, 0x09249249),
+)
+"""The shifts and masks spreading the 10-bits of a Morton code coordinate."""
 
-    For further details, see https://github.com/storpipfugl/pykdtree.
+_KDTREE_SCHEMA: int = 1
+"""The format version of the persisted kd-tree entries."""
+
+
+def _morton_order(xyz: np.ndarray) -> np.ndarray:
+    """Determine the Morton (Z-order) curve spatial order of the cartesian points.
+
+    Spatially ordered data points improve the memory locality of the kd-tree,
+    which is both faster to construct and to query.
+
+    Parameters
+    ----------
+    xyz : ndarray
+        The cartesian points of shape ``(N, 3)``.
+
+    Returns
+    -------
+    ndarray
+        The stable sorting indices of the points along the Morton curve.
 
     Notes
     -----
-    .. versionadded:: 0.3.0
+    .. versionadded:: 0.6.0
 
     """
+    lo = xyz.min(axis=0)
+    span = np.ptp(xyz, axis=0)
+    span[span == 0] = 1
+    scale = 2**_KDTREE_MORTON_BITS - 1
+    quantized = ((xyz - lo) / span * scale).astype(np.uint64)
+    codes = np.zeros(xyz.shape[0], dtype=np.uint64)
+
+    for axis in range(3):
+        # spread the bits of each quantized coordinate two bits apart
+        value = quantized[:, axis]
+        for shift, mask in _MORTON_MASKS:
+            value = (value | (value << np.uint64(shift))) & np.uint64(mask)
+        codes |= value << np.uint64(axis)
+
+    result: np.ndarray = np.argsort(codes, kind="stable")
+    return result
 
-    def __init__(
-        self,
-        mesh: pv.PolyData,
-        /,
-        *,
-        leaf_size: int | None = None,
-        preference: str | SearchPreference | None = None,
-    ) -> None:
-        """Construct kd-tree for nearest neighbour search of mesh points/cell centers.
 
-        Note that the cell centers will be calculated from the mesh geometry and do not
-        require to be provided.
+class CellAdjacency:  # numpydoc ignore=PR01
+    """Index of the point and cell adjacency of a mesh in CSR format.
 
-        The geolocated mesh data points are converted to cartesian coordinates on a S2
-        sphere, as the kd-tree implementation uses Euclidean distance as the metric for
-        nearest neighbours.
+    Notes
+    -----
+    .. versionadded:: 0.6.0
 
-        Nearest neighbour queries are optionally multi-threaded using OpenMP. For
-        further details see https://github.com/storpipfugl/pykdtree.
+    """
+
+    def __init__(self, mesh: pv.PolyData, /) -> None:
+        """Construct the point-to-cell and cell-to-cell adjacency of the `mesh`.
+
+        The index is built once from the connectivity arrays of the `mesh`, and
+        answers queries without creating any VTK objects. The point-to-cell
+        adjacency is built eagerly, whereas the cell-to-cell adjacency of shared
+        vertices or edges is built on first use.
 
         Parameters
         ----------
         mesh : PolyData
-            The mesh used to construct the kd-tree.
-        leaf_size : int, optional
-            The number of data points per tree leaf. Used to control the memory overhead
-            of the kd-tree. Increasing the leaf size will reduce the memory overhead and
-            construction time, but increase the query time. Defaults to
-            :data:`KDTREE_LEAF_SIZE`.
-        preference : str or SearchPreference, optional
-            Construct the kd-tree from the `mesh` points ``point`` or cell centers
-            ``center``. Also see :class:`SearchPreference`. Defaults to
-            :data:`KDTREE_PREFERENCE`.
+            The mesh defining the points and cells.
 
         Notes
         -----
-        .. versionadded:: 0.3.0
+        .. versionadded:: 0.6.0
 
         """
-        if leaf_size is None:
-            leaf_size = KDTREE_LEAF_SIZE
-
-        leaf_size = int(leaf_size)
-
-        if preference is None:
-            preference = KDTREE_PREFERENCE
-
-        if not SearchPreference.valid(preference):
-            options = " or ".join(f"{item!r}" for item in SearchPreference.values())
-            emsg = f"Expected a preference of {options}, got '{preference}'."
-            raise ValueError(emsg)
-
-        self._preference = SearchPreference(preference)
-        xyz = (
-            mesh.points
-            if self._preference == SearchPreference.POINT
-            else mesh.cell_centers().points
-        )
-        crs = from_wkt(mesh)
-
-        if crs is None:
-            crs = WGS84
-
-        if crs != WGS84:
-            transformed = transform_points(
-                src_crs=crs, tgt_crs=WGS84, xs=xyz[:, 0], ys=xyz[:, 1]
-            )
-            # TODO @bjlittle: Clarify zlevel preservation for non-WGS84 point-clouds.
-            xyz = to_cartesian(transformed[:, 0], transformed[:, 1])
-
-        self._n_points: int = xyz.shape[0]
-        self._mesh_type = mesh.__class__.__name__
-        self._kdtree = pyKDTree(xyz, leafsize=leaf_size)
+        offsets, connectivity = [np.zeros(1, dtype=np.int64)], []
+        self._cell_arrays = _cell_arrays(mesh)
+
+        for _, _, offset, conn in self._cell_arrays:
+            offsets.append(offset[1:] + offsets[-1][-1])
+            connectivity.append(conn)
+
+        self._n_points: int = mesh.n_points
+        #: the cell-to-point offsets and connectivity
+        self._offsets = np.concatenate(offsets)
+        self._connectivity = np.concatenate([np.empty(0, np.int64), *connectivity])
+        sizes = np.diff(self._offsets)
+        self._n_cells: int = sizes.size
+        owners = np.repeat(np.arange(self._n_cells), sizes)
+        #: the point-to-cell offsets and cells
+        order = np.argsort(self._connectivity, kind="stable")
+        self._point_cells = owners[order]
+        counts = np.bincount(self._connectivity, minlength=self._n_points)
+        self._point_offsets = np.concatenate([[0], np.cumsum(counts)])
+        #: the lazy cell-to-cell adjacency of shared vertices and edges
+        self._neighbours: dict[bool, tuple[np.ndarray, np.ndarray]] = {}
 
     def __repr__(self) -> str:
-        """Serialize :class:`KDTree` representation.
+        """Serialize :class:`CellAdjacency` representation.
 
         Returns
         -------
@@ -173,232 +238,1615 @@ class KDTree:  # numpydoc ignore=PR01
 
         Notes
         -----
-        .. versionadded:: 0.3.0
+        .. versionadded:: 0.6.0
 
         """
         klass = f"{self.__class__.__name__}"
-        mesh = f"<{self._mesh_type} N POINTS: {self._n_points}>"
-        leaf_size = f"leaf_size={self.leaf_size}"
-        preference = f"preference='{self.preference}'"
-        return f"{klass}({mesh}, {leaf_size}, {preference})"
+        return f"{klass}(N CELLS: {self._n_cells}, N POINTS: {self._n_points})"
 
     @property
-    def leaf_size(self) -> int:
-        """The number of data points per tree leaf.
-
-        Used to control the memory overhead of the kd-tree. Increasing the leaf size
-        will reduce the memory overhead and construction time, but increase the query
-        time.
+    def n_cells(self) -> int:
+        """Number of mesh cells registered with the index.
 
         Returns
         -------
         int
-            The leaf size i.e., the number of data points per leaf, for the tree
-            creation.
+            The number of mesh cells.
 
         Notes
         -----
-        .. versionadded:: 0.3.0
+        .. versionadded:: 0.6.0
 
         """
-        result = self._kdtree.leafsize
-        assert isinstance(result, int)
-        return result
+        return self._n_cells
 
     @property
     def n_points(self) -> int:
-        """Number of mesh points registered with the kd-tree.
+        """Number of mesh points registered with the index.
 
         Returns
         -------
         int
-            The number of mesh points in the kd-tree.
+            The number of mesh points.
 
         Notes
         -----
-        .. versionadded:: 0.3.0
+        .. versionadded:: 0.6.0
 
         """
         return self._n_points
 
-    @property
-    def points(self) -> np.ndarray:
-        """The cartesian data points registered with the kd-tree.
+    def cell_points(self, cids: ArrayLike) -> np.ndarray:
+        """Find the unique points of the cells.
+
+        Parameters
+        ----------
+        cids : ArrayLike
+            The cell-ids.
 
         Returns
         -------
-        np.ndarray
-            The cartesian data points in the kd-tree.
+        ndarray
+            The sorted unique point-ids of the cells.
 
         Notes
         -----
-        .. versionadded:: 0.3.0
+        .. versionadded:: 0.6.0
 
         """
-        return self._kdtree.data.reshape(-1, 3).copy()
+        return _unique(_gather(self._offsets, self._connectivity, cids))
 
-    @property
-    def preference(self) -> SearchPreference:
-        """The target mesh geometry to search.
+    def point_cells(self, pids: ArrayLike) -> np.ndarray:
+        """Find the unique cells sharing the points.
 
-        Focus either on the mesh points or the mesh cell centers.
+        Parameters
+        ----------
+        pids : ArrayLike
+            The point-ids.
 
         Returns
         -------
-        SearchPreference
-            The preference of mesh geometry to search.
+        ndarray
+            The sorted unique cell-ids of the cells containing the points.
 
         Notes
         -----
-        .. versionadded:: 0.3.0
+        .. versionadded:: 0.6.0
 
         """
-        return self._preference
+        return _unique(_gather(self._point_offsets, self._point_cells, pids))
 
-    def query(
-        self,
-        lons: float | ArrayLike,
-        lats: float | ArrayLike,
-        /,
-        *,
-        k: int | None = None,
-        epsilon: float | None = None,
-        distance_upper_bound: float | None = None,
-        radius: float | None = None,
-        zlevel: float | ArrayLike | None = None,
-        zscale: float | None = None,
-    ) -> NearestNeighbours:
-        """Query the kd-tree for `k` nearest neighbours per point-of-interest.
+    def adjacency(self, *, edge: bool | None = False) -> tuple[np.ndarray, np.ndarray]:
+        """Determine the cell-to-cell adjacency of every cell in CSR format.
+
+        The neighbours of cell ``i`` are ``indices[offsets[i]:offsets[i + 1]]``,
+        sorted in increasing order, which excludes the cell itself.
 
         Parameters
         ----------
-        lons : float or ArrayLike
-            One or more longitude values for the query points-of-interest.
-        lats : float or ArrayLike
-            One or more latitude values for the query points-of-interest.
-        k : int, optional
-            The number of nearest neighbours to find per point-of-interest. Defaults
-            to :data:`KDTREE_K`.
-        epsilon : non-negative float, optional
-            Return approximate nearest neighbours; the k-th returned value
-            is guaranteed to be no further than (1 + epsilon) times the distance
-            to the real k-th nearest neighbour. Defaults to :data:`KDTREE_EPSILON`.
-        distance_upper_bound : non-negative float, optional
-            Return only neighbors within this distance. This is used to prune tree
-            searches.
-        radius : float, optional
-            The radius of the sphere. Defaults to :data:`geovista.common.RADIUS`.
-        zlevel : float or ArrayLike, default=0.0
-            The z-axis level. Used in combination with the `zscale` to offset the
-            `radius` by a proportional amount i.e., ``radius * zlevel * zscale``.
-            If `zlevel` is not a scalar, then its shape must match or broadcast
-            with the shape of `lons` and `lats`.
-        zscale : float, optional
-            The proportional multiplier for z-axis `zlevel`. Defaults to
-            :data:`geovista.common.ZLEVEL_SCALE`.
+        edge : bool, default=False
+            Cells are adjacent if they share an edge. Otherwise, cells are
+            adjacent if they share at least one vertex.
 
         Returns
         -------
-        NearestNeighbours
-            The Euclidean distance and index of the k nearest neighbours for each
-            query point-of-interest.
+        tuple of ndarray
+            The CSR offsets and indices of the neighbouring cells.
 
         Notes
         -----
-        .. versionadded:: 0.3.0
+        .. versionadded:: 0.6.0
 
         """
-        if k is None:
-            k = KDTREE_K
+        edge = bool(edge)
 
-        if epsilon is None:
-            epsilon = KDTREE_EPSILON
+        if edge not in self._neighbours:
+            if edge:
+                keys, cells = self._edge_keys()
+            else:
+                keys, cells = (
+                    self._connectivity,
+                    np.repeat(np.arange(self._n_cells), np.diff(self._offsets)),
+                )
+            self._neighbours[edge] = _pairs(keys, cells, self._n_cells)
 
-        xyz = to_cartesian(lons, lats, radius=radius, zlevel=zlevel, zscale=zscale)
+        return self._neighbours[edge]
 
-        result = self._kdtree.query(
-            xyz, k=k, eps=epsilon, distance_upper_bound=distance_upper_bound
-        )
-        assert isinstance(result, tuple)
-        assert len(result) == 2
-        return result
+    def neighbours(
+        self,
+        cids: int | ArrayLike,
+        *,
+        rings: int | None = 1,
+        edge: bool | None = False,
+    ) -> np.ndarray:
+        """Find the cells neighbouring the given cells.
 
+        Vertex neighbours are found via the point-to-cell adjacency, unless the
+        cell-to-cell adjacency has already been built by :meth:`adjacency`, in
+        which case the neighbours of a single cell are a slice of the index.
 
-def find_cell_neighbours(mesh: pv.PolyData, cid: CellIDLike) -> CellIDs:
-    """Find all the cells neighbouring the given `cid` cell/s of the `mesh`.
+        Parameters
+        ----------
+        cids : int or ArrayLike
+            The cell-ids that are the focus of the neighbourhood.
+        rings : int, default=1
+            The number of rings of neighbours e.g., ``2`` also includes the
+            neighbours of the neighbours.
+        edge : bool, default=False
+            Cells are adjacent if they share an edge. Otherwise, cells are
+            adjacent if they share at least one vertex.
 
-    A cell is deemed to neighbour a `cid` cell if it shares at least one
-    vertex.
+        Returns
+        -------
+        ndarray
+            The sorted unique cell-ids of the neighbourhood, excluding `cids`.
 
-    Parameters
-    ----------
-    mesh : PolyData
-        The mesh defining the points cells.
-    cid : int or list of int
-        The offset of the cell/s in the `mesh` that is/are the focus of the
-        neighbourhood.
+        Notes
+        -----
+        .. versionadded:: 0.6.0
 
-    Returns
-    -------
-    list of int
-        The sorted list of neighbouring cell-ids.
+        """
+        edge = bool(edge)
+        csr = self.adjacency(edge=True) if edge else self._neighbours.get(edge)
+
+        if csr is not None and np.ndim(cids) == 0 and rings == 1:
+            # fast path for the neighbours of a single cell
+            offsets, indices = csr
+            cid = int(cids)  # type: ignore[arg-type]
+            result: np.ndarray = indices[offsets[cid] : offsets[cid + 1]].copy()
+            return result
+
+        cids = _unique(np.asarray(cids, dtype=np.int64).ravel())
+        seen = frontier = cids
+
+        for _ in range(int(1 if rings is None else rings)):
+            if csr is not None:
+                ring = _unique(_gather(*csr, frontier))
+            else:
+                ring = self.point_cells(self.cell_points(frontier))
+            frontier = ring[~_isin(ring, seen)]
+            if not frontier.size:
+                break
+            seen = _unique(np.concatenate([seen, frontier]))
+
+        neighbours: np.ndarray = seen[~_isin(seen, cids)]
+        return neighbours
+
+    def _edge_keys(self) -> tuple[np.ndarray, np.ndarray]:
+        """Calculate the undirected edge key and the owning cell of each edge.
+
+        Returns
+        -------
+        tuple of ndarray
+            The edge key of the end-points and the cell-id of each cell edge.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        keys, cells = [np.empty(0, np.int64)], [np.empty(0, np.int64)]
+
+        for kind, first, offsets, conn in self._cell_arrays:
+            if kind == "verts":
+                continue
+            sizes = np.diff(offsets)
+            owner = np.repeat(np.arange(sizes.size) + first, sizes)
+            start = np.repeat(offsets[:-1], sizes)
+            position = np.arange(conn.size) - start
+            size = np.repeat(sizes, sizes)
+            steps = [1, 2] if kind == "strips" else [1]
+            for step in steps:
+                if kind == "polys":
+                    # polygons are closed
+                    mask = size > 1
+                    other = start + (position + step) % size
+                else:
+                    mask = position + step < size
+                    other = start + position + step
+                lo = np.minimum(conn[mask], conn[other[mask]])
+                hi = np.maximum(conn[mask], conn[other[mask]])
+                keys.append(lo * self._n_points + hi)
+                cells.append(owner[mask])
+
+        return np.concatenate(keys), np.concatenate(cells)
+
+
+class CellIndex:  # numpydoc ignore=PR01
+    """Cubed-sphere bucket index of the cells of a mesh for range queries.
 
     Notes
     -----
-    .. versionadded:: 0.1.0
+    .. versionadded:: 0.6.0
 
     """
-    if not isinstance(cid, Iterable):
-        cid = [cid]
-
-    pids = []
-    for idx in cid:
-        # NOTE: pyvista 0.38.0: cell_point_ids(idx) -> get_cell(idx).point_ids
-        pids.extend(mesh.get_cell(idx).point_ids)
 
-    # determine the unique points
-    pids = np.unique(list(pids))
-    # get the cell-ids of cells containing at least one common point
-    result = set(mesh.extract_points(pids)[VTK_CELL_IDS])
-    # remove the original cell/s
-    result -= set(cid)
+    def __init__(self, mesh: pv.PolyData, /, *, resolution: int | None = None) -> None:
+        """Construct the bucket index of the bounding caps of the `mesh` cells.
 
-    return sorted(result)
+        The bounding cap of each cell is centered on its cell center, and
+        encloses all of its vertices. Each cell is bucketed by the cubed-sphere
+        panel and equiangular ``(i, j)`` grid cell containing its cell center.
+        A query visits only those buckets within reach of the query region, and
+        then filters their cells on the distance of each bounding cap from the
+        query region.
 
+        Parameters
+        ----------
+        mesh : PolyData
+            The mesh defining the points, cells and CRS.
+        resolution : int, optional
+            The number of buckets along each edge of each cubed-sphere panel.
+            Defaults to a resolution with :data:`CELL_INDEX_OCCUPANCY` cells per
+            bucket on average.
 
-def find_nearest_cell(
-    mesh: pv.PolyData,
-    /,
-    x: float,
-    y: float,
-    z: float | None = 0,
-    *,
-    single: bool | None = False,
-) -> CellIDLike:
-    """Find the cell in the `mesh` that is closest to the point-of-interest (POI).
+        Notes
+        -----
+        .. versionadded:: 0.6.0
 
-    Assumes that the POI is in the canonical units of the `gvCRS`
-    associated with the `mesh`, otherwise assumes geographic longitude
-    and latitude.
+        The bounding caps are conservative, so the cells of a query are the
+        candidate cells that may intersect the query region, and include all
+        cells that do.
 
-    If the POI is coincident with a vertex of the `mesh`, then the
-    ``cellID`` of each cell face which shares that vertex is returned.
+        """
+        self._n_cells: int = mesh.n_cells
+
+        if resolution is None:
+            resolution = np.sqrt(self._n_cells / (6 * CELL_INDEX_OCCUPANCY))
+
+        self._resolution = max(int(np.ceil(resolution)), 1)
+        crs: CRS | None = from_wkt(mesh)
+        crs = WGS84 if crs is None else crs
+        points = _unit(_cartesian(mesh, crs, SearchPreference.POINT))
+        self._centers = _unit(_cartesian(mesh, crs, SearchPreference.CENTER))
+
+        # the angular radius of the bounding cap of each cell, from its
+        # maximum squared chord
+        chords = np.zeros(self._n_cells)
+
+        for _, first, offsets, conn in _cell_arrays(mesh):
+            sizes = np.diff(offsets)
+            owners = np.repeat(np.arange(first, first + sizes.size), sizes)
+            delta = points[conn] - self._centers[owners]
+            squared = np.einsum("ij,ij->i", delta, delta)
+            cells = chords[first : first + sizes.size]
+            cells[sizes > 0] = np.maximum.reduceat(squared, offsets[:-1][sizes > 0])
+
+        self._radii = 2 * np.arcsin(np.minimum(np.sqrt(chords) / 2, 1))
+
+        # the cells of each bucket in CSR format
+        n_buckets = 6 * self._resolution**2
+        buckets = _buckets(self._centers, self._resolution)
+        self._cells = np.argsort(buckets, kind="stable")
+        counts = np.bincount(buckets, minlength=n_buckets)
+        self._offsets = np.zeros(n_buckets + 1, dtype=np.int64)
+        np.cumsum(counts, out=self._offsets[1:])
+
+        # the reach of the cells of each bucket from the bucket center
+        corners = _bucket_corners(self._resolution)
+        self._bucket_centers = _unit(corners.sum(axis=1))
+        self._reach = np.full(n_buckets, -np.inf)
+        occupied = counts > 0
+        self._reach[occupied] = np.maximum.reduceat(
+            self._radii[self._cells], self._offsets[:-1][occupied]
+        )
+        self._reach += _angle(corners, self._bucket_centers[:, np.newaxis]).max(axis=1)
 
-    Parameters
-    ----------
-    mesh : PolyData
-        The mesh defining the points, cells and CRS.
-    x : float
-        The POI x-coordinate. Defaults to ``longitude`` if no `mesh` CRS is
-        available.
-    y : float
-        The POI y-coordinate. Defaults to ``latitude`` if no `mesh` CRS is
-        available.
-    z : float, optional
-        The POI z-coordinate, if applicable. Defaults to zero.
-    single : bool, default=False
-        Enforce expectation of only one nearest ``cellID`` result. Otherwise,
-        a sorted list of ``cellIDs`` are returned.
+    def __repr__(self) -> str:
+        """Serialize :class:`CellIndex` representation.
+
+        Returns
+        -------
+        str
+            String representation of the instance.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        klass = f"{self.__class__.__name__}"
+        return f"{klass}(N CELLS: {self._n_cells}, resolution={self._resolution})"
+
+    @property
+    def n_cells(self) -> int:
+        """The number of cells in the index.
+
+        Returns
+        -------
+        int
+            The number of mesh cells.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return self._n_cells
+
+    @property
+    def resolution(self) -> int:
+        """The number of buckets along each edge of each cubed-sphere panel.
+
+        Returns
+        -------
+        int
+            The bucket resolution.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return self._resolution
+
+    def query_box(
+        self, west: float, east: float, south: float, north: float
+    ) -> np.ndarray:
+        """Find the candidate cells intersecting a geographic bounding-box.
+
+        The bounding-box is bounded by the `west` and `east` meridians, and the
+        `south` and `north` parallels. It spans the antimeridian when `west` is
+        greater than `east`.
+
+        Parameters
+        ----------
+        west : float
+            The western longitude (degrees) of the bounding-box.
+        east : float
+            The eastern longitude (degrees) of the bounding-box.
+        south : float
+            The southern latitude (degrees) of the bounding-box.
+        north : float
+            The northern latitude (degrees) of the bounding-box.
+
+        Returns
+        -------
+        ndarray
+            The sorted cell-ids of the candidate cells.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if not -90 <= south <= north <= 90:
+            emsg = (
+                "Expected a southern latitude no greater than the northern "
+                f"latitude within [-90, 90], got '{south}' and '{north}'."
+            )
+            raise ValueError(emsg)
+
+        span = 360.0 if east - west >= 360 else (east - west) % 360
+
+        def distance(xyz: np.ndarray) -> np.ndarray:
+            """Calculate the angular distance of each point from the bounding-box.
+
+            Parameters
+            ----------
+            xyz : ndarray
+                The unit cartesian points of shape ``(N, 3)``.
+
+            Returns
+            -------
+            ndarray
+                The angular distance (radians) of each point.
+
+            """
+            lons = np.arctan2(xyz[:, 1], xyz[:, 0])
+            lats = np.arcsin(np.clip(xyz[:, 2], -1, 1))
+            lower, upper = np.radians(south), np.radians(north)
+            inside = np.degrees(lons - np.radians(west)) % 360 <= span
+            result: np.ndarray = np.maximum(lower - lats, lats - upper).clip(min=0)
+
+            if span < 360:
+                # the distance from the nearest point of each meridian edge
+                cosine = np.full(lons.shape, -1.0)
+
+                for edge in np.radians([west, east]):
+                    scale = np.cos(lats) * np.cos(lons - edge)
+                    nearest = np.arctan2(np.sin(lats), scale).clip(lower, upper)
+
+                    for theta in (lower, upper, nearest):
+                        dot = scale * np.cos(theta) + np.sin(lats) * np.sin(theta)
+                        cosine = np.maximum(cosine, dot)
+
+                edges = np.arccos(cosine.clip(-1, 1))
+                result = np.where(inside, result, edges)
+
+            return result
+
+        return self._query(distance)
+
+    def query_cap(
+        self,
+        lon: float,
+        lat: float,
+        /,
+        distance: float,
+        *,
+        units: str | DistanceUnits | None = None,
+    ) -> np.ndarray:
+        """Find the candidate cells intersecting a spherical cap.
+
+        Parameters
+        ----------
+        lon : float
+            The longitude (degrees) of the center of the spherical cap.
+        lat : float
+            The latitude (degrees) of the center of the spherical cap.
+        distance : float
+            The non-negative great-circle radius of the spherical cap, in `units`.
+        units : str or DistanceUnits, optional
+            The units of the `distance`. Also see :class:`DistanceUnits`. Defaults
+            to :data:`KDTREE_DISTANCE_UNITS`.
+
+        Returns
+        -------
+        ndarray
+            The sorted cell-ids of the candidate cells.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        scale = _distance_scale(units)
+
+        if (distance := float(distance)) < 0:
+            emsg = f"Expected a non-negative distance, got '{distance}'."
+            raise ValueError(emsg)
+
+        center = to_cartesian(lon, lat).reshape(3)
+        angle = distance / scale
+        return self._query(lambda xyz: _angle(xyz, center) - angle)
+
+    def query_polygon(self, lons: ArrayLike, lats: ArrayLike) -> np.ndarray:
+        """Find the candidate cells intersecting a spherical polygon.
+
+        The polygon is closed, with its edges as great-circle arcs between its
+        vertices, and must lie within a hemisphere.
+
+        Parameters
+        ----------
+        lons : ArrayLike
+            The longitudes (degrees) of the polygon vertices.
+        lats : ArrayLike
+            The latitudes (degrees) of the polygon vertices.
+
+        Returns
+        -------
+        ndarray
+            The sorted cell-ids of the candidate cells.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        lons, lats = np.ravel(lons), np.ravel(lats)
+
+        if lons.shape != lats.shape or lons.size < 3:
+            emsg = (
+                "Expected the same number of at least 3 polygon longitudes and "
+                f"latitudes, got {lons.size} and {lats.size}."
+            )
+            raise ValueError(emsg)
+
+        vertices = to_cartesian(lons, lats)
+        center = _unit(vertices.sum(axis=0, keepdims=True))[0]
+        # the bounding cap of the polygon
+        cap = center, float(_angle(vertices, center).max())
+
+        if cap[1] >= np.pi / 2:
+            emsg = "Expected a polygon within a hemisphere."
+            raise ValueError(emsg)
+
+        return self._query(
+            lambda xyz: _polygon_distance(xyz, vertices, center), cap=cap
+        )
+
+    def _query(
+        self,
+        distance: Callable[[np.ndarray], np.ndarray],
+        *,
+        cap: tuple[np.ndarray, float] | None = None,
+    ) -> np.ndarray:
+        """Find the cells with a bounding cap within reach of the query region.
+
+        Parameters
+        ----------
+        distance : callable
+            The angular distance (radians) of each unit cartesian point of shape
+            ``(N, 3)`` from the query region, which is zero or negative for a
+            point within the region.
+        cap : tuple, optional
+            The unit cartesian center and angular radius (radians) of a spherical
+            cap enclosing the query region, which cheaply excludes the distant
+            buckets before the `distance` of the remaining buckets.
+
+        Returns
+        -------
+        ndarray
+            The sorted cell-ids of the candidate cells.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        # the slack of the cells touching the query region
+        slack = 1e-12
+        buckets = np.flatnonzero(np.isfinite(self._reach))
+
+        if cap is not None:
+            center, angle = cap
+            near = _angle(self._bucket_centers[buckets], center) - angle
+            buckets = buckets[near <= self._reach[buckets] + slack]
+
+        near = distance(self._bucket_centers[buckets])
+        buckets = buckets[near <= self._reach[buckets] + slack]
+        cells = _gather(self._offsets, self._cells, buckets)
+        keep = distance(self._centers[cells]) <= self._radii[cells] + slack
+        result: np.ndarray = np.sort(cells[keep])
+        return result
+
+
+class CellLocator:  # numpydoc ignore=PR01
+    """Locate the cells of a mesh containing many points-of-interest.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    def __init__(
+        self,
+        mesh: pv.PolyData,
+        /,
+        *,
+        k: int | None = None,
+        tolerance: float | None = None,
+    ) -> None:
+        """Construct a batch locator of the polygonal cells of the `mesh`.
+
+        The candidate cells of each point-of-interest are the `k` nearest cell
+        centers of a :class:`KDTree`, which are then confirmed with a vectorized
+        spherical point-in-polygon test of each candidate cell.
+
+        Parameters
+        ----------
+        mesh : PolyData
+            The mesh defining the points, cells and CRS.
+        k : int, optional
+            The number of candidate cells per point-of-interest. Defaults to
+            :data:`LOCATOR_K`.
+        tolerance : float, optional
+            The angular distance (radians) of a point-of-interest from a cell edge
+            within which it is deemed to lie on the edge. Defaults to
+            :data:`LOCATOR_TOLERANCE`.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        The cells are assumed to be convex. The edges of each cell are great
+        circle arcs between its vertices.
+
+        """
+        self._k = min(LOCATOR_K if k is None else int(k), mesh.n_cells)
+        self._tolerance = LOCATOR_TOLERANCE if tolerance is None else float(tolerance)
+        crs: CRS | None = from_wkt(mesh)
+        self._crs = WGS84 if crs is None else crs
+        self._kdtree = KDTree(mesh, preference=SearchPreference.CENTER)
+        xyz = _cartesian(mesh, self._crs, SearchPreference.POINT)
+        self._points = xyz / np.linalg.norm(xyz, axis=1, keepdims=True)
+        centers = self._kdtree.points
+        self._centers = centers / np.linalg.norm(centers, axis=1, keepdims=True)
+
+        self._vertices, self._valid, self._orientation = _polygons(
+            mesh, self._points, self._centers
+        )
+
+    def __repr__(self) -> str:
+        """Serialize :class:`CellLocator` representation.
+
+        Returns
+        -------
+        str
+            String representation of the instance.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        klass = f"{self.__class__.__name__}"
+        return f"{klass}(N CELLS: {self._valid.size}, k={self._k})"
+
+    def locate(
+        self,
+        xs: float | ArrayLike,
+        ys: float | ArrayLike,
+        /,
+        *,
+        workers: int | None = None,
+    ) -> np.ndarray:
+        """Find the cell containing each point-of-interest (POI).
+
+        Assumes that the POIs are in the canonical units of the `gvCRS`
+        associated with the mesh, otherwise assumes geographic longitude and
+        latitude.
+
+        A POI coincident with a vertex or an edge shared by several cells is
+        located in the cell with the lowest cell-id.
+
+        Parameters
+        ----------
+        xs : float or ArrayLike
+            The POI x-coordinates.
+        ys : float or ArrayLike
+            The POI y-coordinates.
+        workers : int, optional
+            The maximum number of threads locating chunks of POIs. Defaults to
+            :data:`geovista.config.GEOVISTA_TRANSFORM_WORKERS`.
+
+        Returns
+        -------
+        ndarray
+            The cell-id of each POI, or ``-1`` if no cell contains the POI.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if workers is None:
+            workers = gvc.GEOVISTA_TRANSFORM_WORKERS
+
+        lons: np.ndarray = np.ravel(xs).astype(float)
+        lats: np.ndarray = np.ravel(ys).astype(float)
+
+        if lons.shape != lats.shape:
+            emsg = (
+                "Expected the same number of x and y points-of-interest, got "
+                f"{lons.size} and {lats.size}."
+            )
+            raise ValueError(emsg)
+
+        if self._crs != WGS84:
+            transformed = np.asarray(
+                transform_points(
+                    src_crs=self._crs, tgt_crs=WGS84, xs=lons, ys=lats, trap=False
+                )
+            )
+            lons, lats = transformed[:, 0], transformed[:, 1]
+
+        result = np.full(lons.size, -1, dtype=np.int64)
+
+        if not self._k:
+            return result
+
+        def worker(start: int) -> None:
+            """Locate a chunk of the POIs.
+
+            Parameters
+            ----------
+            start : int
+                The index of the first POI of the chunk.
+
+            """
+            chunk = slice(start, start + _LOCATOR_CHUNK_SIZE)
+            result[chunk] = self._locate(lons[chunk], lats[chunk])
+
+        _map_chunks(
+            worker,
+            lons.size,
+            workers=max(int(workers), 1),
+            chunk_size=_LOCATOR_CHUNK_SIZE,
+        )
+
+        return result
+
+    def _locate(self, lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+        """Find the cell containing each geographic point-of-interest.
+
+        Parameters
+        ----------
+        lons : ndarray
+            The POI longitudes.
+        lats : ndarray
+            The POI latitudes.
+
+        Returns
+        -------
+        ndarray
+            The cell-id of each POI, or ``-1`` if no candidate cell contains the
+            POI.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        finite = np.isfinite(lons) & np.isfinite(lats)
+        lons, lats = np.where(finite, lons, 0), np.where(finite, lats, 0)
+        poi = to_cartesian(lons, lats)
+        poi /= np.linalg.norm(poi, axis=1, keepdims=True)
+        result = np.full(lons.size, -1, dtype=np.int64)
+
+        # most POIs are strictly inside the cell with the nearest center
+        _, idx = self._kdtree.query(lons, lats, k=1)
+        nearest = np.asarray(idx, dtype=np.int64).reshape(-1, 1)
+        sine = self._sine(nearest, poi)[:, 0]
+        resolved = finite & (sine > np.sin(self._tolerance))
+        result[resolved] = nearest[resolved, 0]
+
+        if self._k > 1 and np.any(pending := finite & ~resolved):
+            # the POIs on a cell boundary, or outside the nearest cell
+            _, idx = self._kdtree.query(lons[pending], lats[pending], k=self._k)
+            candidates = np.asarray(idx, dtype=np.int64).reshape(-1, self._k)
+            inside = self._sine(candidates, poi[pending]) >= -np.sin(self._tolerance)
+            sentinel = np.iinfo(np.int64).max
+            cids = np.where(inside, candidates, sentinel).min(axis=1)
+            result[pending] = np.where(cids == sentinel, -1, cids)
+        elif self._k == 1:
+            inside = finite & (sine >= -np.sin(self._tolerance))
+            result[inside] = nearest[inside, 0]
+
+        return result
+
+    def _sine(self, candidates: np.ndarray, poi: np.ndarray) -> np.ndarray:
+        """Calculate the minimum signed angular distance of each POI from each cell.
+
+        The sine of the angular distance of each POI from the great circle of
+        each candidate cell edge is positive inside the cell.
+
+        Parameters
+        ----------
+        candidates : ndarray
+            The candidate cell-ids of shape ``(N, K)``.
+        poi : ndarray
+            The unit cartesian POIs of shape ``(N, 3)``.
+
+        Returns
+        -------
+        ndarray
+            The sine of the minimum signed angular distance of each POI from the
+            edges of each candidate cell, of shape ``(N, K)``. Invalid cells, and
+            cells of the opposite hemisphere, are ``-inf``.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        # the great circle plane of each candidate cell edge, shape (N, K, M, 3)
+        vertices = self._vertices[candidates]
+        a = self._points[vertices]
+        b = self._points[np.roll(vertices, -1, axis=-1)]
+        normal = np.cross(a, b)
+        norm = np.linalg.norm(normal, axis=-1)
+        sine = np.einsum("nkmi,ni->nkm", normal, poi) / np.where(norm > 0, norm, 1)
+        sine *= self._orientation[candidates][..., np.newaxis]
+        result: np.ndarray = sine.min(axis=-1)
+        # exclude invalid cells, and cells of the opposite hemisphere
+        hemisphere = np.einsum("nki,ni->nk", self._centers[candidates], poi) > 0
+        result[~(hemisphere & self._valid[candidates])] = -np.inf
+        return result
+
+
+class DistanceUnits(StrEnumPlus):
+    """Enumeration of great-circle distance units.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    DEGREES = "deg"
+    """Angular distance in degrees."""
+    KM = "km"
+    """Distance in kilometres on a sphere of radius :data:`EARTH_RADIUS`."""
+    M = "m"
+    """Distance in metres on a sphere of radius :data:`EARTH_RADIUS`."""
+    RADIANS = "rad"
+    """Angular distance in radians."""
+
+
+class RadiusNeighbours(NamedTuple):
+    """The neighbours within a radius of each point-of-interest in CSR format.
+
+    The neighbours of the ``i``-th point-of-interest are
+    ``indices[offsets[i]:offsets[i + 1]]``.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    offsets: np.ndarray
+    """The offsets of the neighbours of each point-of-interest."""
+    indices: np.ndarray
+    """The concatenated indices of the neighbours."""
+    distances: np.ndarray | None
+    """The concatenated great-circle distances of the neighbours, if requested."""
+
+
+class SearchPreference(StrEnumPlus):
+    """Enumeration of mesh geometry search preferences.
+
+    Notes
+    -----
+    .. versionadded:: 0.3.0
+
+    """
+
+    CENTER = "center"
+    """Preference to search the cell centers."""
+    POINT = "point"
+    """Preference to search the mesh points."""
+
+
+class KDTree:  # numpydoc ignore=PR01
+    """Construct a kd-tree for fast nearest neighbour search of a mesh.
+
+    For further details, see https://github.com/storpipfugl/pykdtree.
+
+    Notes
+    -----
+    .. versionadded:: 0.3.0
+
+    """
+
+    def __init__(
+        self,
+        mesh: pv.PolyData,
+        /,
+        *,
+        leaf_size: int | None = None,
+        preference: str | SearchPreference | None = None,
+        persist: bool | None = None,
+    ) -> None:
+        """Construct kd-tree for nearest neighbour search of mesh points/cell centers.
+
+        Note that the cell centers will be calculated from the mesh geometry and do not
+        require to be provided.
+
+        The geolocated mesh data points are converted to cartesian coordinates on a S2
+        sphere, as the kd-tree implementation uses Euclidean distance as the metric for
+        nearest neighbours.
+
+        Nearest neighbour queries are optionally multi-threaded using OpenMP. For
+        further details see https://github.com/storpipfugl/pykdtree.
+
+        Parameters
+        ----------
+        mesh : PolyData
+            The mesh used to construct the kd-tree.
+        leaf_size : int, optional
+            The number of data points per tree leaf. Used to control the memory overhead
+            of the kd-tree. Increasing the leaf size will reduce the memory overhead and
+            construction time, but increase the query time. Defaults to
+            :data:`KDTREE_LEAF_SIZE`.
+        preference : str or SearchPreference, optional
+            Construct the kd-tree from the `mesh` points ``point`` or cell centers
+            ``center``. Also see :class:`SearchPreference`. Defaults to
+            :data:`KDTREE_PREFERENCE`.
+        persist : bool, optional
+            Save the spatially ordered kd-tree data points to the
+            :data:`KDTREE_CACHE_DIR` sub-directory of the
+            :data:`geovista.config.resources` ``cache_dir``, keyed on the mesh
+            geometry fingerprint, CRS, `preference` and `leaf_size`. Subsequent
+            kd-trees of the same mesh memory-map the saved data points rather
+            than recalculating them, which also allows concurrent processes to
+            share the same physical memory. Defaults to :data:`KDTREE_PERSIST`.
+
+        Notes
+        -----
+        .. versionadded:: 0.3.0
+
+        The persisted entry holds the data points and not the tree nodes, as
+        the ``pykdtree`` tree cannot be serialized. The tree construction over
+        spatially ordered data points is considerably faster than over the
+        original mesh order.
+
+        """
+        if leaf_size is None:
+            leaf_size = KDTREE_LEAF_SIZE
+
+        leaf_size = int(leaf_size)
+
+        if preference is None:
+            preference = KDTREE_PREFERENCE
+
+        if not SearchPreference.valid(preference):
+            options = " or ".join(f"{item!r}" for item in SearchPreference.values())
+            emsg = f"Expected a preference of {options}, got '{preference}'."
+            raise ValueError(emsg)
+
+        if persist is None:
+            persist = KDTREE_PERSIST
+
+        self._preference = SearchPreference(preference)
+        self._mesh_type = mesh.__class__.__name__
+        # the original indices of the spatially ordered data points
+        self._indices: np.ndarray | None = None
+        # the minimum and maximum radius of the data points
+        self._radii: tuple[float, float] | None = None
+        # the uniform grid of the data points, for large radius queries
+        self._grid: tuple[Any, ...] | None = None
+        crs = from_wkt(mesh)
+
+        if crs is None:
+            crs = WGS84
+
+        entry = None
+
+        if persist:
+            key = self._key(mesh, crs, leaf_size)
+            entry = self._load(key)
+
+        if entry is None:
+            xyz = _cartesian(mesh, crs, self._preference)
+
+            if persist:
+                indices = _morton_order(xyz)
+                dtype = np.int32 if indices.size < 2**31 else np.int64
+                entry = (
+                    np.ascontiguousarray(xyz[indices]),
+                    indices.astype(dtype, copy=False),
+                )
+                self._save(key, entry)
+
+        if entry is not None:
+            xyz, self._indices = entry
+
+        self._n_points: int = xyz.shape[0]
+        self._kdtree = pyKDTree(xyz, leafsize=leaf_size)
+
+    def __repr__(self) -> str:
+        """Serialize :class:`KDTree` representation.
+
+        Returns
+        -------
+        str
+            String representation of the instance.
+
+        Notes
+        -----
+        .. versionadded:: 0.3.0
+
+        """
+        klass = f"{self.__class__.__name__}"
+        mesh = f"<{self._mesh_type} N POINTS: {self._n_points}>"
+        leaf_size = f"leaf_size={self.leaf_size}"
+        preference = f"preference='{self.preference}'"
+        return f"{klass}({mesh}, {leaf_size}, {preference})"
+
+    def _key(self, mesh: pv.PolyData, crs: CRS, leaf_size: int) -> str:
+        """Compute the persisted entry key of the kd-tree.
+
+        Parameters
+        ----------
+        mesh : PolyData
+            The mesh used to construct the kd-tree.
+        crs : CRS
+            The Coordinate Reference System (CRS) of the `mesh`.
+        leaf_size : int
+            The number of data points per tree leaf.
+
+        Returns
+        -------
+        str
+            The hexadecimal digest key.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        # stale entries of other geovista releases or entry formats never match
+        digest.update(f"{_KDTREE_SCHEMA}:{geovista.__version__}".encode())
+        digest.update(fingerprint(mesh).encode())
+        digest.update(crs.to_wkt().encode())
+        digest.update(f"{self._preference}:{leaf_size}".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _load(key: str) -> tuple[np.ndarray, np.ndarray] | None:
+        """Memory-map the persisted kd-tree data points, if available.
+
+        Parameters
+        ----------
+        key : str
+            The persisted entry key.
+
+        Returns
+        -------
+        tuple of ndarray
+            The read-only memory-mapped spatially ordered data points and their
+            original indices, or ``None`` if there is no such valid entry.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        cache_dir = Path(gvc.resources["cache_dir"]) / KDTREE_CACHE_DIR
+        fnames = [cache_dir / f"{key}.{name}.npy" for name in ("points", "indices")]
+        entry = None
+
+        try:
+            xyz, indices = (
+                np.load(fname, mmap_mode="r", allow_pickle=False) for fname in fnames
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            xyz = indices = None
+
+        valid = (
+            xyz is not None
+            and indices is not None
+            and xyz.ndim == 2
+            and xyz.shape[1] == 3
+            and xyz.dtype == np.float64
+            and indices.shape == (xyz.shape[0],)
+            and indices.dtype.kind == "i"
+        )
+
+        if valid:
+            entry = xyz, indices
+        else:
+            # purge the corrupt entry
+            for fname in fnames:
+                fname.unlink(missing_ok=True)
+
+        return entry
+
+    @staticmethod
+    def _save(key: str, entry: tuple[np.ndarray, np.ndarray]) -> None:
+        """Persist the kd-tree data points.
+
+        Parameters
+        ----------
+        key : str
+            The persisted entry key.
+        entry : tuple of ndarray
+            The spatially ordered data points and their original indices.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        cache_dir = Path(gvc.resources["cache_dir"]) / KDTREE_CACHE_DIR
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # the indices are saved before the points, as the points mark a
+            # complete entry. concurrent processes save identical entries.
+            for name, data in zip(("indices", "points"), entry[::-1], strict=True):
+                fname = cache_dir / f"{key}.{name}.npy"
+                tmp = fname.with_name(f"{fname.name}.{os.getpid()}.tmp")
+                with tmp.open("wb") as fh:
+                    np.save(fh, data, allow_pickle=False)
+                # atomic replacement, safe for concurrent processes
+                tmp.replace(fname)
+        except OSError:
+            # persistence is an optimisation, so a read-only cache is not fatal
+            pass
+
+    @property
+    def leaf_size(self) -> int:
+        """The number of data points per tree leaf.
+
+        Used to control the memory overhead of the kd-tree. Increasing the leaf size
+        will reduce the memory overhead and construction time, but increase the query
+        time.
+
+        Returns
+        -------
+        int
+            The leaf size i.e., the number of data points per leaf, for the tree
+            creation.
+
+        Notes
+        -----
+        .. versionadded:: 0.3.0
+
+        """
+        result = self._kdtree.leafsize
+        assert isinstance(result, int)
+        return result
+
+    @property
+    def n_points(self) -> int:
+        """Number of mesh points registered with the kd-tree.
+
+        Returns
+        -------
+        int
+            The number of mesh points in the kd-tree.
+
+        Notes
+        -----
+        .. versionadded:: 0.3.0
+
+        """
+        return self._n_points
+
+    @property
+    def points(self) -> np.ndarray:
+        """The cartesian data points registered with the kd-tree.
+
+        Returns
+        -------
+        np.ndarray
+            The cartesian data points in the kd-tree.
+
+        Notes
+        -----
+        .. versionadded:: 0.3.0
+
+        """
+        data = self._kdtree.data.reshape(-1, 3)
+
+        if self._indices is None:
+            return data.copy()
+
+        result = np.empty_like(data)
+        result[self._indices] = data
+        return result
+
+    @property
+    def preference(self) -> SearchPreference:
+        """The target mesh geometry to search.
+
+        Focus either on the mesh points or the mesh cell centers.
+
+        Returns
+        -------
+        SearchPreference
+            The preference of mesh geometry to search.
+
+        Notes
+        -----
+        .. versionadded:: 0.3.0
+
+        """
+        return self._preference
+
+    def query(
+        self,
+        lons: float | ArrayLike,
+        lats: float | ArrayLike,
+        /,
+        *,
+        k: int | None = None,
+        epsilon: float | None = None,
+        distance_upper_bound: float | None = None,
+        radius: float | None = None,
+        zlevel: float | ArrayLike | None = None,
+        zscale: float | None = None,
+    ) -> NearestNeighbours:
+        """Query the kd-tree for `k` nearest neighbours per point-of-interest.
+
+        Parameters
+        ----------
+        lons : float or ArrayLike
+            One or more longitude values for the query points-of-interest.
+        lats : float or ArrayLike
+            One or more latitude values for the query points-of-interest.
+        k : int, optional
+            The number of nearest neighbours to find per point-of-interest. Defaults
+            to :data:`KDTREE_K`.
+        epsilon : non-negative float, optional
+            Return approximate nearest neighbours; the k-th returned value
+            is guaranteed to be no further than (1 + epsilon) times the distance
+            to the real k-th nearest neighbour. Defaults to :data:`KDTREE_EPSILON`.
+        distance_upper_bound : non-negative float, optional
+            Return only neighbors within this distance. This is used to prune tree
+            searches.
+        radius : float, optional
+            The radius of the sphere. Defaults to :data:`geovista.common.RADIUS`.
+        zlevel : float or ArrayLike, default=0.0
+            The z-axis level. Used in combination with the `zscale` to offset the
+            `radius` by a proportional amount i.e., ``radius * zlevel * zscale``.
+            If `zlevel` is not a scalar, then its shape must match or broadcast
+            with the shape of `lons` and `lats`.
+        zscale : float, optional
+            The proportional multiplier for z-axis `zlevel`. Defaults to
+            :data:`geovista.common.ZLEVEL_SCALE`.
+
+        Returns
+        -------
+        NearestNeighbours
+            The Euclidean distance and index of the k nearest neighbours for each
+            query point-of-interest.
+
+        Notes
+        -----
+        .. versionadded:: 0.3.0
+
+        """
+        if k is None:
+            k = KDTREE_K
+
+        if epsilon is None:
+            epsilon = KDTREE_EPSILON
+
+        xyz = to_cartesian(lons, lats, radius=radius, zlevel=zlevel, zscale=zscale)
+
+        result = self._kdtree.query(
+            xyz, k=k, eps=epsilon, distance_upper_bound=distance_upper_bound
+        )
+        assert isinstance(result, tuple)
+        assert len(result) == 2
+
+        if self._indices is not None:
+            distances, idx = result
+            # map to the original indices, preserving the missing neighbour index
+            found = idx < self._n_points
+            mapped = np.full_like(idx, self._n_points)
+            mapped[found] = self._indices[idx[found]]
+            result = distances, mapped
+
+        return result
+
+    def query_radius(
+        self,
+        lons: float | ArrayLike,
+        lats: float | ArrayLike,
+        /,
+        distance: float,
+        *,
+        units: str | DistanceUnits | None = None,
+        return_distance: bool | None = False,
+        sort: bool | None = False,
+    ) -> RadiusNeighbours:
+        """Query the kd-tree for all neighbours within a distance of each point.
+
+        The great-circle `distance` is converted to an enclosing Euclidean chord
+        bound of the kd-tree, with the candidate neighbours then filtered on their
+        exact great-circle distance. The points-of-interest are queried in chunks
+        of :data:`KDTREE_CHUNK_SIZE`, bounding the memory of the query.
+
+        Parameters
+        ----------
+        lons : float or ArrayLike
+            One or more longitude values for the query points-of-interest.
+        lats : float or ArrayLike
+            One or more latitude values for the query points-of-interest.
+        distance : float
+            The non-negative great-circle distance of the neighbours from each
+            point-of-interest, in `units`.
+        units : str or DistanceUnits, optional
+            The units of the `distance`. Also see :class:`DistanceUnits`. Defaults
+            to :data:`KDTREE_DISTANCE_UNITS`.
+        return_distance : bool, default=False
+            Also calculate the great-circle distance, in `units`, of each
+            neighbour.
+        sort : bool, default=False
+            Order the neighbours of each point-of-interest by increasing distance.
+            Otherwise, the neighbours are in no particular order.
+
+        Returns
+        -------
+        RadiusNeighbours
+            The CSR offsets and indices, and optionally the distances, of the
+            neighbours of each point-of-interest.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        # the distance per radian
+        scale = _distance_scale(units)
+
+        if (distance := float(distance)) < 0:
+            emsg = f"Expected a non-negative distance, got '{distance}'."
+            raise ValueError(emsg)
+
+        lons, lats = np.ravel(lons), np.ravel(lats)
+
+        if lons.shape != lats.shape:
+            emsg = (
+                "Expected the same number of longitudes and latitudes, got "
+                f"{lons.size} and {lats.size}."
+            )
+            raise ValueError(emsg)
+
+        angle = min(distance / scale, np.pi)
+        data = self._kdtree.data.reshape(-1, 3)
+
+        if self._radii is None:
+            radii = np.linalg.norm(data, axis=1)
+            self._radii = float(radii.min()), float(radii.max())
+
+        rmin, radius = self._radii
+        # the chord bound enclosing the angle for all data points between the
+        # minimum and maximum radius, with the points-of-interest on the sphere
+        # of maximum radius
+        bound = np.sqrt((radius - rmin) ** 2 + 2 * radius**2 * (1 - np.cos(angle)))
+        bound = bound * (1 + 1e-9) + 1e-12
+        # the squared unit chord of the angle
+        limit = (2 * np.sin(angle / 2)) ** 2
+
+        offsets = [np.zeros(1, dtype=np.int64)]
+        indices, distances = [], []
+
+        for start in range(0, lons.size, KDTREE_CHUNK_SIZE):
+            stop = start + KDTREE_CHUNK_SIZE
+            xyz = to_cartesian(lons[start:stop], lats[start:stop], radius=radius)
+            rows, idx = self._query_bound(xyz, bound)
+            # the exact chord between the unit vectors, grouped by point
+            order = np.argsort(rows, kind="stable")
+            rows, idx = rows[order], idx[order]
+            neighbours = data[idx]
+            neighbours /= np.linalg.norm(neighbours, axis=1, keepdims=True)
+            delta = neighbours - xyz[rows] / radius
+            chord = np.einsum("ij,ij->i", delta, delta)
+            keep = chord <= limit
+            rows, idx, chord = rows[keep], idx[keep], chord[keep]
+
+            if return_distance or sort:
+                theta = 2 * np.arcsin(np.minimum(np.sqrt(chord) / 2, 1))
+
+            if sort:
+                order = np.lexsort((theta, rows))
+                rows, idx, theta = rows[order], idx[order], theta[order]
+
+            if self._indices is not None:
+                idx = self._indices[idx]
+
+            counts = np.bincount(rows, minlength=xyz.shape[0])
+            offsets.append(offsets[-1][-1] + np.cumsum(counts))
+            indices.append(idx.astype(np.intp, copy=False))
+
+            if return_distance:
+                distances.append(theta * scale)
+
+        return RadiusNeighbours(
+            offsets=np.concatenate(offsets),
+            indices=np.concatenate([np.empty(0, dtype=np.intp), *indices]),
+            distances=np.concatenate([np.empty(0), *distances])
+            if return_distance
+            else None,
+        )
+
+    def _query_bound(
+        self, xyz: np.ndarray, bound: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find all the data points within the Euclidean bound of each point.
+
+        The kd-tree is queried for up to :data:`KDTREE_RADIUS_K` neighbours per
+        point. The points with a saturated query are resolved with a uniform grid
+        of the data points instead, as the cost of a k-nearest neighbour query
+        grows rapidly with large `k`.
+
+        Parameters
+        ----------
+        xyz : ndarray
+            The cartesian points-of-interest of shape ``(N, 3)``.
+        bound : float
+            The Euclidean distance bound of the neighbours.
+
+        Returns
+        -------
+        tuple of ndarray
+            The row of the point-of-interest and the index of the kd-tree data
+            point, for each neighbour.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        n_points = self._n_points
+        k = min(KDTREE_RADIUS_K, n_points)
+
+        if not k or not xyz.shape[0]:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+        _, idx = self._kdtree.query(xyz, k=k, distance_upper_bound=bound)
+        idx = idx.reshape(-1, k)
+        found = idx < n_points
+        saturated = found[:, -1].copy() if k < n_points else np.zeros(len(idx), bool)
+        found[saturated] = False
+        rows = [np.repeat(np.arange(len(idx)), found.sum(axis=1))]
+        indices = [idx[found].astype(np.intp)]
+
+        if np.any(saturated):
+            pending = np.flatnonzero(saturated)
+            grid_rows, grid_indices = self._query_grid(xyz[pending], bound)
+            rows.append(pending[grid_rows])
+            indices.append(grid_indices)
+
+        return np.concatenate(rows), np.concatenate(indices)
+
+    def _query_grid(
+        self, xyz: np.ndarray, bound: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find all the data points within the Euclidean bound using a uniform grid.
+
+        The data points are binned into a uniform grid of cubes with an edge no
+        smaller than the `bound`, such that the neighbours of each point are
+        within the surrounding ``3 x 3 x 3`` cubes. The grid is cached for
+        subsequent queries with the same `bound`.
+
+        Parameters
+        ----------
+        xyz : ndarray
+            The cartesian points-of-interest of shape ``(N, 3)``.
+        bound : float
+            The Euclidean distance bound of the neighbours.
+
+        Returns
+        -------
+        tuple of ndarray
+            The row of the point-of-interest and the index of the kd-tree data
+            point, for each neighbour.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        data = self._kdtree.data.reshape(-1, 3)
+
+        if self._grid is None or self._grid[0] != bound:
+            lo = data.min(axis=0)
+            # limit the number of grid cubes per axis, avoiding key overflow
+            size = max(bound, float(np.ptp(data, axis=0).max()) / 2**20)
+            dims = (np.ptp(data, axis=0) // size).astype(np.int64) + 1
+            cube = np.floor((data - lo) / size).astype(np.int64)
+            keys = self._grid_keys(np.clip(cube, 0, dims - 1), dims)
+            order = np.argsort(keys, kind="stable")
+            self._grid = (bound, lo, size, dims, order, keys[order])
+
+        _, lo, size, dims, order, keys = self._grid
+        cube = np.floor((xyz - lo) / size).astype(np.int64)
+        offsets = np.stack(
+            np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1], indexing="ij"), axis=-1
+        ).reshape(-1, 3)
+        # the 27 neighbouring cubes of each point, shape (N, 27, 3)
+        cubes = cube[:, np.newaxis] + offsets
+        valid = np.all((cubes >= 0) & (cubes < dims), axis=-1)
+        cubes = np.where(valid[..., np.newaxis], cubes, 0)
+        neighbours = self._grid_keys(cubes, dims)
+        starts = np.searchsorted(keys, neighbours, side="left")
+        stops = np.searchsorted(keys, neighbours, side="right")
+        counts = np.where(valid, stops - starts, 0)
+        rows, indices = [np.empty(0, dtype=np.intp)], [np.empty(0, dtype=np.intp)]
+
+        # bound the number of candidates gathered per batch of points
+        totals = counts.sum(axis=1)
+        batches = (np.cumsum(totals) - totals) // _KDTREE_GRID_CANDIDATES
+
+        for label in np.unique(batches):
+            (select,) = np.nonzero(batches == label)
+            n = counts[select].ravel()
+            total = int(n.sum())
+            # gather the candidate data points of the neighbouring cubes
+            first = np.repeat(starts[select].ravel() - np.cumsum(n) + n, n)
+            candidates = order[np.arange(total) + first]
+            owner = np.repeat(np.repeat(select, offsets.shape[0]), n)
+            delta = data[candidates] - xyz[owner]
+            keep = np.einsum("ij,ij->i", delta, delta) <= bound**2
+            rows.append(owner[keep])
+            indices.append(candidates[keep].astype(np.intp))
+
+        return np.concatenate(rows), np.concatenate(indices)
+
+    @staticmethod
+    def _grid_keys(cubes: np.ndarray, dims: np.ndarray) -> np.ndarray:
+        """Calculate the key of each uniform grid cube.
+
+        Parameters
+        ----------
+        cubes : ndarray
+            The integer grid cube coordinates, with a trailing axis of size 3.
+        dims : ndarray
+            The number of grid cubes per axis.
+
+        Returns
+        -------
+        ndarray
+            The key of each grid cube.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        x, y, z = np.moveaxis(cubes, -1, 0)
+        result: np.ndarray = (x * dims[1] + y) * dims[2] + z
+        return result
+
+
+def find_cell_neighbours(
+    mesh: pv.PolyData,
+    cid: CellIDLike,
+    *,
+    adjacency: CellAdjacency | None = None,
+) -> CellIDs:
+    """Find all the cells neighbouring the given `cid` cell/s of the `mesh`.
+
+    A cell is deemed to neighbour a `cid` cell if it shares at least one
+    vertex.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh defining the points cells.
+    cid : int or list of int
+        The offset of the cell/s in the `mesh` that is/are the focus of the
+        neighbourhood.
+    adjacency : CellAdjacency, optional
+        The adjacency index of the `mesh`, which may be reused between calls.
+        Otherwise, the index is constructed for the `mesh`.
+
+    Returns
+    -------
+    list of int
+        The sorted list of neighbouring cell-ids.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.0
+
+    """
+    if not isinstance(cid, Iterable):
+        cid = [cid]
+
+    if adjacency is None:
+        adjacency = CellAdjacency(mesh)
+
+    result: CellIDs = adjacency.neighbours(list(cid)).tolist()
+    return result
+
+
+def find_nearest_cell(
+    mesh: pv.PolyData,
+    /,
+    x: float,
+    y: float,
+    z: float | None = 0,
+    *,
+    single: bool | None = False,
+) -> CellIDLike:
+    """Find the cell in the `mesh` that is closest to the point-of-interest (POI).
+
+    Assumes that the POI is in the canonical units of the `gvCRS`
+    associated with the `mesh`, otherwise assumes geographic longitude
+    and latitude.
+
+    If the POI is coincident with a vertex of the `mesh`, then the
+    ``cellID`` of each cell face which shares that vertex is returned.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh defining the points, cells and CRS.
+    x : float
+        The POI x-coordinate. Defaults to ``longitude`` if no `mesh` CRS is
+        available.
+    y : float
+        The POI y-coordinate. Defaults to ``latitude`` if no `mesh` CRS is
+        available.
+    z : float, optional
+        The POI z-coordinate, if applicable. Defaults to zero.
+    single : bool, default=False
+        Enforce expectation of only one nearest ``cellID`` result. Otherwise,
+        a sorted list of ``cellIDs`` are returned.
 
     Returns
     -------
@@ -434,3 +1882,471 @@ def find_nearest_cell(
         (result,) = result
 
     return result
+
+
+def _angle(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Calculate the angle between the unit cartesian vectors.
+
+    Parameters
+    ----------
+    a : ndarray
+        The unit cartesian vectors of shape ``(..., 3)``.
+    b : ndarray
+        The unit cartesian vectors of shape ``(..., 3)``, which broadcast with
+        the vectors `a`.
+
+    Returns
+    -------
+    ndarray
+        The angle (radians) between each pair of vectors.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    a, b = np.broadcast_arrays(a, b)
+    sine = np.linalg.norm(np.cross(a, b), axis=-1)
+    result: np.ndarray = np.arctan2(sine, np.einsum("...i,...i->...", a, b))
+    return result
+
+
+def _bucket_corners(resolution: int) -> np.ndarray:
+    """Calculate the corners of each cubed-sphere bucket.
+
+    Parameters
+    ----------
+    resolution : int
+        The number of buckets along each edge of each cubed-sphere panel.
+
+    Returns
+    -------
+    ndarray
+        The unit cartesian corners of each bucket of shape ``(6 * R * R, 4, 3)``,
+        in the order of :func:`_buckets`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    edges = np.tan(np.linspace(-np.pi / 4, np.pi / 4, resolution + 1))
+    i, j = (
+        index.ravel()
+        for index in np.meshgrid(
+            np.arange(resolution), np.arange(resolution), indexing="ij"
+        )
+    )
+    u = np.stack([edges[i], edges[i + 1], edges[i + 1], edges[i]], axis=-1)
+    v = np.stack([edges[j], edges[j], edges[j + 1], edges[j + 1]], axis=-1)
+    result = np.empty((6, resolution**2, 4, 3))
+
+    for panel in range(6):
+        axis, sign = divmod(panel, 2)
+        result[panel, ..., axis] = -1 if sign else 1
+        result[panel, ..., (axis + 1) % 3] = u
+        result[panel, ..., (axis + 2) % 3] = v
+
+    result /= np.linalg.norm(result, axis=-1, keepdims=True)
+    return result.reshape(-1, 4, 3)
+
+
+def _buckets(xyz: np.ndarray, resolution: int) -> np.ndarray:
+    """Determine the cubed-sphere bucket containing each cartesian point.
+
+    The bucket of each point is its cube panel, and the ``(i, j)`` cell of the
+    equiangular grid of the panel.
+
+    Parameters
+    ----------
+    xyz : ndarray
+        The cartesian points of shape ``(N, 3)``.
+    resolution : int
+        The number of buckets along each edge of each cubed-sphere panel.
+
+    Returns
+    -------
+    ndarray
+        The bucket of each point.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    rows = np.arange(xyz.shape[0])
+    axis = np.argmax(np.abs(xyz), axis=1)
+    major = xyz[rows, axis]
+    panel = 2 * axis + (major < 0)
+    scale = np.where(major == 0, 1, np.abs(major))
+    result = panel.astype(np.int64)
+
+    for offset in (1, 2):
+        angle = np.arctan(xyz[rows, (axis + offset) % 3] / scale)
+        index = np.floor((angle / (np.pi / 2) + 0.5) * resolution).astype(np.int64)
+        result = result * resolution + index.clip(0, resolution - 1)
+
+    return result
+
+
+def _cartesian(mesh: pv.PolyData, crs: CRS, preference: SearchPreference) -> np.ndarray:
+    """Calculate the cartesian points or cell centers of the `mesh`.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh defining the points, cells and CRS.
+    crs : CRS
+        The Coordinate Reference System (CRS) of the `mesh`.
+    preference : SearchPreference
+        The mesh points or cell centers.
+
+    Returns
+    -------
+    ndarray
+        The cartesian points of shape ``(N, 3)``.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    xyz = (
+        mesh.points
+        if preference == SearchPreference.POINT
+        else mesh.cell_centers().points
+    )
+
+    if crs != WGS84:
+        transformed = transform_points(
+            src_crs=crs, tgt_crs=WGS84, xs=xyz[:, 0], ys=xyz[:, 1]
+        )
+        # TODO @bjlittle: Clarify zlevel preservation for non-WGS84 point-clouds.
+        xyz = to_cartesian(transformed[:, 0], transformed[:, 1])
+
+    result: np.ndarray = xyz
+    return result
+
+
+def _cell_arrays(mesh: pv.PolyData) -> list[tuple[str, int, np.ndarray, np.ndarray]]:
+    """Get the offsets and connectivity of each non-empty cell array of the mesh.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh defining the cells.
+
+    Returns
+    -------
+    list of tuple
+        The cell array type, the cell-id of its first cell, and its offsets and
+        connectivity, in the vertices, lines, polygons then triangle strips
+        order of the `mesh` cell-ids.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    result = []
+    first = 0
+
+    for kind in CELL_ARRAY_TYPES:
+        cells = getattr(mesh, f"Get{kind.capitalize()}")()
+        if n_cells := cells.GetNumberOfCells():
+            offsets = pv.convert_array(cells.GetOffsetsArray()).astype(np.int64)
+            conn = pv.convert_array(cells.GetConnectivityArray()).astype(np.int64)
+            result.append((kind, first, offsets, conn))
+            first += n_cells
+
+    return result
+
+
+def _distance_scale(units: str | DistanceUnits | None) -> float:
+    """Determine the great-circle distance per radian of the distance units.
+
+    Parameters
+    ----------
+    units : str or DistanceUnits, optional
+        The distance units. Defaults to :data:`KDTREE_DISTANCE_UNITS`.
+
+    Returns
+    -------
+    float
+        The distance, in `units`, per radian.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if units is None:
+        units = KDTREE_DISTANCE_UNITS
+
+    if not DistanceUnits.valid(units):
+        options = " or ".join(f"{item!r}" for item in DistanceUnits.values())
+        emsg = f"Expected distance units of {options}, got '{units}'."
+        raise ValueError(emsg)
+
+    result: float = {
+        DistanceUnits.DEGREES: np.degrees(1),
+        DistanceUnits.KM: EARTH_RADIUS,
+        DistanceUnits.M: EARTH_RADIUS * 1e3,
+        DistanceUnits.RADIANS: 1.0,
+    }[DistanceUnits(units)]
+    return result
+
+
+def _gather(offsets: np.ndarray, values: np.ndarray, items: ArrayLike) -> np.ndarray:
+    """Gather the concatenated CSR values of the items.
+
+    Parameters
+    ----------
+    offsets : ndarray
+        The CSR offsets.
+    values : ndarray
+        The CSR values.
+    items : ArrayLike
+        The items to gather.
+
+    Returns
+    -------
+    ndarray
+        The concatenated values of each item.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    items = np.atleast_1d(np.asarray(items, dtype=np.int64))
+    starts, stops = offsets[items], offsets[items + 1]
+    sizes = stops - starts
+    index = np.arange(sizes.sum()) + np.repeat(starts - np.cumsum(sizes) + sizes, sizes)
+    result: np.ndarray = values[index]
+    return result
+
+
+def _isin(values: np.ndarray, sorted_values: np.ndarray) -> np.ndarray:
+    """Determine whether each value is a member of the sorted unique values.
+
+    Parameters
+    ----------
+    values : ndarray
+        The values to test.
+    sorted_values : ndarray
+        The sorted unique values.
+
+    Returns
+    -------
+    ndarray
+        The boolean membership of each value.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if not sorted_values.size:
+        return np.zeros(values.shape, dtype=bool)
+
+    index = np.minimum(np.searchsorted(sorted_values, values), sorted_values.size - 1)
+    result: np.ndarray = sorted_values[index] == values
+    return result
+
+
+def _pairs(
+    keys: np.ndarray, cells: np.ndarray, n_cells: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Determine the CSR adjacency of cells sharing the same key.
+
+    Parameters
+    ----------
+    keys : ndarray
+        The key of each item e.g., a point-id or an edge.
+    cells : ndarray
+        The cell-id owning each item.
+    n_cells : int
+        The total number of cells.
+
+    Returns
+    -------
+    tuple of ndarray
+        The CSR offsets and sorted indices of the neighbouring cells.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    order = np.argsort(keys, kind="stable")
+    keys, cells = keys[order], cells[order]
+    # the groups of items sharing the same key
+    starts = np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))
+    sizes = np.diff(np.concatenate([starts, [keys.size]]))
+    # pair each item with every item of its group
+    group = np.repeat(sizes, sizes)
+    owner = np.repeat(cells, group)
+    first = np.repeat(np.repeat(starts, sizes), group)
+    index = np.arange(group.sum()) - np.repeat(np.cumsum(group) - group, group)
+    other = cells[first + index]
+    mask = owner != other
+    pairs = _unique(owner[mask] * n_cells + other[mask])
+    owner, other = np.divmod(pairs, n_cells)
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(owner, minlength=n_cells))])
+    return offsets, other
+
+
+def _polygon_distance(
+    xyz: np.ndarray, vertices: np.ndarray, center: np.ndarray
+) -> np.ndarray:
+    """Calculate the angular distance of each point from a spherical polygon.
+
+    Parameters
+    ----------
+    xyz : ndarray
+        The unit cartesian points of shape ``(N, 3)``.
+    vertices : ndarray
+        The unit cartesian vertices of the closed polygon of shape ``(M, 3)``,
+        with its edges as great-circle arcs.
+    center : ndarray
+        The unit cartesian center of the hemisphere containing the polygon.
+
+    Returns
+    -------
+    ndarray
+        The angular distance (radians) of each point from the polygon, which is
+        zero for a point within the polygon.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    a, b = vertices, np.roll(vertices, -1, axis=0)
+    normal = np.cross(a, b)
+    pa, pb = xyz @ a.T, xyz @ b.T
+    # the winding angle of the polygon about each point
+    winding = np.arctan2(xyz @ normal.T, np.einsum("ij,ij->i", a, b) - pa * pb)
+    # the polygon also winds about its antipodal points
+    inside = (np.abs(winding.sum(axis=1)) > np.pi) & (xyz @ center > 0)
+
+    # the distance from the nearest point of each edge
+    normal = _unit(normal)
+    sine = np.abs(xyz @ normal.T)
+    within = (xyz @ np.cross(normal, a).T >= 0) & (xyz @ np.cross(b, normal).T >= 0)
+    ends = np.arccos(np.maximum(pa, pb).clip(-1, 1))
+    distance = np.where(within, np.arcsin(sine.clip(max=1)), ends).min(axis=1)
+    result: np.ndarray = np.where(inside, 0, distance)
+    return result
+
+
+def _polygons(
+    mesh: pv.PolyData, points: np.ndarray, centers: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Tabulate the vertices and orientation of the polygonal cells of the mesh.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh defining the cells.
+    points : ndarray
+        The unit cartesian points of the `mesh` of shape ``(N, 3)``.
+    centers : ndarray
+        The unit cartesian cell centers of the `mesh` of shape ``(M, 3)``.
+
+    Returns
+    -------
+    tuple of ndarray
+        The point-ids of the vertices of each cell of shape ``(M, W)``, padded by
+        repeating the last vertex of the cell, whether each cell is a valid
+        polygon, and the sign of the orientation of each cell relative to its
+        outward cell center.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    # the vertices of each polygon, padded by repeating the last vertex
+    valid = np.zeros(mesh.n_cells, dtype=bool)
+    sizes = np.ones(mesh.n_cells, dtype=np.int64)
+    starts = np.zeros(mesh.n_cells, dtype=np.int64)
+    connectivity = [np.zeros(1, dtype=np.int64)]
+    n_conn = 1
+
+    for kind, first, offsets, conn in _cell_arrays(mesh):
+        if kind == "polys":
+            cells = slice(first, first + offsets.size - 1)
+            sizes[cells] = np.diff(offsets)
+            starts[cells] = offsets[:-1] + n_conn
+            valid[cells] = sizes[cells] >= 3
+            connectivity.append(conn)
+            n_conn += conn.size
+
+    conn = np.concatenate(connectivity)
+    width = np.arange(max(int(sizes.max(initial=1)), 1))
+    vertices = conn[starts[:, np.newaxis] + np.minimum(width, sizes[:, None] - 1)]
+
+    # the orientation of each polygon relative to its outward cell center
+    normal = np.zeros_like(centers)
+    for i in width:
+        a = points[vertices[:, i]]
+        b = points[vertices[:, (i + 1) % width.size]]
+        normal += np.cross(a, b)
+    orientation = np.sign(np.einsum("ij,ij->i", normal, centers))
+    valid &= orientation != 0
+
+    return vertices, valid, orientation
+
+
+def _unique(values: np.ndarray) -> np.ndarray:
+    """Determine the sorted unique integer values.
+
+    This avoids the overhead of :func:`numpy.unique` for both small and large
+    integer arrays.
+
+    Parameters
+    ----------
+    values : ndarray
+        The integer values.
+
+    Returns
+    -------
+    ndarray
+        The sorted unique values.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    values = np.sort(values)
+    mask = np.empty(values.shape, dtype=bool)
+    mask[:1] = True
+    np.not_equal(values[1:], values[:-1], out=mask[1:])
+    result: np.ndarray = values[mask]
+    return result
+
+
+def _unit(xyz: np.ndarray) -> np.ndarray:
+    """Normalise the cartesian points to the unit sphere.
+
+    Parameters
+    ----------
+    xyz : ndarray
+        The cartesian points of shape ``(N, 3)``.
+
+    Returns
+    -------
+    ndarray
+        The unit cartesian points.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    norm = np.linalg.norm(xyz, axis=1, keepdims=True)
+    result: np.ndarray = xyz / np.where(norm > 0, norm, 1)
+    return result
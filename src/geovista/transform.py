@@ -13,14 +13,28 @@ Notes
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from typing import TYPE_CHECKING
+from functools import lru_cache
+import hashlib
+import os
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, NamedTuple
+import warnings
+import zipfile
 
 import lazy_loader as lazy
 
+import geovista
+import geovista.config as gvc
+
 from .common import (
+    CELL_ARRAY_TYPES,
     GV_FIELD_ZSCALE,
     ZLEVEL_SCALE,
+    fingerprint,
     from_cartesian,
     point_cloud,
     to_cartesian,
@@ -36,19 +50,846 @@ from .crs import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy as np
     from numpy.typing import ArrayLike
+    import pyproj
     import pyvista as pv
 
 # lazy import third-party dependencies
 np = lazy.load("numpy")
+pv = lazy.load("pyvista")
 pyproj = lazy.load("pyproj")
 
 __all__ = [
+    "PROJECTION_CACHE_MAXBYTES",
+    "PROJECTION_TABLE_CACHE_SIZE",
+    "PROJECTION_TABLE_MAX_LEVEL",
+    "PROJECTION_TABLE_MAX_TILES",
+    "PROJECTION_TABLE_STEP",
+    "TRANSFORMER_CACHE_SIZE",
+    "ProjectionCache",
+    "TransformerCacheInfo",
+    "get_transformer",
     "transform_mesh",
     "transform_point",
     "transform_points",
+    "transformer_cache_clear",
+    "transformer_cache_info",
 ]
 
+TRANSFORMER_CACHE_SIZE: int = 64
+"""The maximum number of cached :class:`pyproj.Transformer` instances."""
+
+_TRANSFORMER_LOCK: Lock = Lock()
+"""Serialize transformer cache lookups, preventing duplicate concurrent misses."""
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+"""The shared thread pool of projection workers, see :func:`_get_executor`."""
+
+_EXECUTOR_LOCK: Lock = Lock()
+"""Serialize creation of the shared thread pool of projection workers."""
+
+_EXECUTOR_WORKERS: int = 0
+"""The number of threads of the shared thread pool of projection workers."""
+
+PROJECTION_CACHE_MAXBYTES: int = 2**30
+"""The default maximum size (bytes) of a :class:`ProjectionCache` tier."""
+
+_CACHE_CELL_IDS: str = "gvCacheCellIds"
+"""Name of the cell indices array tracking cells through a cached transform."""
+
+_CACHE_POINT_HASH: str = "gvCachePointHash"
+"""Name of the point hash array disambiguating points through a cached transform."""
+
+_CACHE_POINT_IDS: str = "gvCachePointIds"
+"""Name of the point indices array tracking points through a cached transform."""
+
+_CACHE_SCHEMA: int = 1
+"""The format version of the :class:`ProjectionCache` entries."""
+
+PROJECTION_TABLE_CACHE_SIZE: int = 16
+"""The maximum number of cached approximate projection tables."""
+
+PROJECTION_TABLE_MAX_LEVEL: int = 8
+"""The maximum number of refinements of an approximate projection table tile."""
+
+PROJECTION_TABLE_MAX_TILES: int = 2**20
+"""The maximum number of tiles refined per level of an approximate projection table."""
+
+PROJECTION_TABLE_STEP: float = 5.0
+"""The size (degrees) of the coarsest approximate projection table tiles."""
+
+_PROJECTION_TABLE_BLOCK: int = 2**13
+"""The number of spatial points interpolated per cache-resident block."""
+
+_PROJECTION_TABLE_DENSE_SIZE: int = 2**22
+"""The maximum number of tiles of the dense approximate projection table index."""
+
+_PROJECTION_TABLE_LOCK: Lock = Lock()
+"""Serialize approximate projection table lookups, preventing duplicate builds."""
+
+_PROJECTION_TABLE_MARGIN: float = 0.75
+"""The fraction of the error bound met at the probes, allowing for errors between."""
+
+_PROJECTION_TABLE_PROBES: int = 3
+"""The number of probes per tile edge used to estimate the interpolation error."""
+
+type ProjectedGeometry = dict[str, np.ndarray]
+"""Type alias for the flattened arrays of a cached projected mesh."""
+
+
+class ProjectionCache:  # numpydoc ignore=PR01
+    """Cache of projected mesh geometries for :func:`transform_mesh`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    def __init__(
+        self,
+        *,
+        maxbytes: int | None = None,
+        cache_dir: str | os.PathLike[str] | None = None,
+        disk_maxbytes: int | None = None,
+    ) -> None:
+        """Create an in-memory, and optionally on-disk, projected geometry cache.
+
+        Each entry holds the projected points and the sliced topology of a mesh,
+        keyed on the mesh geometry fingerprint, the source and target CRS, the
+        central meridian and the z-axis level and scale. Each tier is bounded in
+        size, with the least recently used entries being evicted first.
+
+        Meshes returned from the cache share the cached arrays, therefore they
+        should not be modified in-place.
+
+        Parameters
+        ----------
+        maxbytes : int, optional
+            The maximum size (bytes) of the in-memory tier. Defaults to
+            :data:`PROJECTION_CACHE_MAXBYTES`.
+        cache_dir : PathLike, optional
+            The directory of the on-disk tier e.g., a sub-directory of the
+            :data:`geovista.config.resources` ``cache_dir``. If ``None``, then
+            only the in-memory tier is enabled.
+        disk_maxbytes : int, optional
+            The maximum size (bytes) of the on-disk tier. Defaults to
+            :data:`PROJECTION_CACHE_MAXBYTES`.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if maxbytes is None:
+            maxbytes = PROJECTION_CACHE_MAXBYTES
+
+        if disk_maxbytes is None:
+            disk_maxbytes = PROJECTION_CACHE_MAXBYTES
+
+        self.maxbytes = int(maxbytes)
+        """The maximum size (bytes) of the in-memory tier."""
+        self.disk_maxbytes = int(disk_maxbytes)
+        """The maximum size (bytes) of the on-disk tier."""
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
+        """The directory of the on-disk tier, if enabled."""
+        self.hits = 0
+        """The number of cache lookups satisfied by a cached entry."""
+        self.misses = 0
+        """The number of cache lookups that required a projection."""
+
+        self._entries: OrderedDict[str, ProjectedGeometry] = OrderedDict()
+        self._nbytes = 0
+        self._lock = Lock()
+
+    def __contains__(self, key: str) -> bool:
+        """Determine whether the `key` is cached in the in-memory tier.
+
+        Parameters
+        ----------
+        key : str
+            The cache entry key.
+
+        Returns
+        -------
+        bool
+            Whether the entry is cached.
+
+        """
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of entries in the in-memory tier.
+
+        Returns
+        -------
+        int
+            The number of cached entries.
+
+        """
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """Serialize :class:`ProjectionCache` representation.
+
+        Returns
+        -------
+        str
+            String representation of the instance.
+
+        """
+        klass = self.__class__.__name__
+        cache_dir = f", cache_dir='{self.cache_dir}'" if self.cache_dir else ""
+        return (
+            f"{klass}(entries={len(self)}, nbytes={self.nbytes}, "
+            f"maxbytes={self.maxbytes}{cache_dir})"
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """The size (bytes) of the in-memory tier.
+
+        Returns
+        -------
+        int
+            The total number of bytes of all cached arrays in memory.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return self._nbytes
+
+    @staticmethod
+    def key(
+        mesh: pv.PolyData,
+        src_crs: pyproj.CRS,
+        tgt_crs: pyproj.CRS,
+        **kwargs: ArrayLike | bool | float | None,
+    ) -> str:
+        """Compute the cache entry key of the projected `mesh`.
+
+        Parameters
+        ----------
+        mesh : PolyData
+            The mesh to be transformed. Only its geometry contributes to the key,
+            as the point data and cell data are re-attached from the tracked
+            parent points and cells of the cached entry.
+        src_crs : CRS
+            The source Coordinate Reference System (CRS) of the `mesh`.
+        tgt_crs : CRS
+            The target Coordinate Reference System (CRS) of the transformation.
+        **kwargs : dict, optional
+            Other options of the transformation e.g., the central meridian,
+            z-axis level and scale.
+
+        Returns
+        -------
+        str
+            The hexadecimal digest key.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        # stale entries of other geovista releases or entry formats never match
+        digest.update(f"{_CACHE_SCHEMA}:{geovista.__version__}".encode())
+        digest.update(fingerprint(mesh).encode())
+        digest.update(src_crs.to_wkt().encode())
+        digest.update(tgt_crs.to_wkt().encode())
+
+        for name in sorted(kwargs):
+            value = np.ascontiguousarray(kwargs[name])
+            digest.update(f"{name}:{value.dtype.str}:{value.shape}".encode())
+            if value.dtype != object:
+                digest.update(memoryview(value).cast("B"))
+
+        return digest.hexdigest()
+
+    def clear(self, *, disk: bool | None = False) -> None:
+        """Purge all cached entries and statistics.
+
+        Parameters
+        ----------
+        disk : bool, default=False
+            Whether to also purge the on-disk tier.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = self.misses = 0
+
+            if disk and self.cache_dir is not None:
+                for fname in self.cache_dir.glob("*.npz"):
+                    fname.unlink(missing_ok=True)
+
+    def get(self, key: str) -> ProjectedGeometry | None:
+        """Get the cached entry, promoting on-disk entries into memory.
+
+        Parameters
+        ----------
+        key : str
+            The cache entry key.
+
+        Returns
+        -------
+        dict of ndarray
+            The cached entry, or ``None`` if there is no such entry.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+            elif (entry := self._load(key)) is not None:
+                self._insert(key, entry)
+
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return entry
+
+    def put(self, key: str, entry: ProjectedGeometry) -> None:
+        """Cache the entry, evicting the least recently used entries if required.
+
+        Parameters
+        ----------
+        key : str
+            The cache entry key.
+        entry : dict of ndarray
+            The projected geometry arrays to cache.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        for data in entry.values():
+            # cached arrays are never shared with the projected meshes
+            data.flags.writeable = False
+
+        with self._lock:
+            self._insert(key, entry)
+            self._save(key, entry)
+
+    def _insert(self, key: str, entry: ProjectedGeometry) -> None:
+        """Add the entry to the in-memory tier, evicting entries to fit.
+
+        Parameters
+        ----------
+        key : str
+            The cache entry key.
+        entry : dict of ndarray
+            The projected geometry arrays to cache.
+
+        """
+        nbytes = sum(data.nbytes for data in entry.values())
+
+        if key in self._entries or nbytes > self.maxbytes:
+            return
+
+        while self._entries and self._nbytes + nbytes > self.maxbytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._nbytes -= sum(data.nbytes for data in evicted.values())
+
+        self._entries[key] = entry
+        self._nbytes += nbytes
+
+    def _load(self, key: str) -> ProjectedGeometry | None:
+        """Load the entry from the on-disk tier, if available.
+
+        Parameters
+        ----------
+        key : str
+            The cache entry key.
+
+        Returns
+        -------
+        dict of ndarray
+            The cached entry, or ``None`` if there is no such valid entry.
+
+        """
+        if self.cache_dir is None:
+            return None
+
+        fname = self.cache_dir / f"{key}.npz"
+        entry = None
+
+        try:
+            with np.load(fname, allow_pickle=False) as npz:
+                entry = {name: npz[name] for name in npz.files}
+            # refresh the access time for least recently used eviction
+            os.utime(fname)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, zipfile.BadZipFile):
+            # purge the corrupt entry
+            fname.unlink(missing_ok=True)
+
+        if entry is not None:
+            for data in entry.values():
+                data.flags.writeable = False
+
+        return entry
+
+    def _save(self, key: str, entry: ProjectedGeometry) -> None:
+        """Save the entry to the on-disk tier, evicting entries to fit.
+
+        Parameters
+        ----------
+        key : str
+            The cache entry key.
+        entry : dict of ndarray
+            The projected geometry arrays to cache.
+
+        """
+        if self.cache_dir is None:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fname = self.cache_dir / f"{key}.npz"
+        tmp = fname.with_name(f"{fname.name}.{os.getpid()}.tmp")
+
+        with tmp.open("wb") as fh:
+            np.savez(fh, **entry)  # type: ignore[arg-type]
+
+        # atomic replacement, safe for concurrent processes
+        tmp.replace(fname)
+
+        fnames = sorted(
+            self.cache_dir.glob("*.npz"), key=lambda fname: fname.stat().st_mtime
+        )
+        nbytes = sum(fname.stat().st_size for fname in fnames)
+
+        while len(fnames) > 1 and nbytes > self.disk_maxbytes:
+            evict = fnames.pop(0)
+            nbytes -= evict.stat().st_size
+            evict.unlink(missing_ok=True)
+
+
+def _pack_projection(projected: pv.PolyData, mesh: pv.PolyData) -> ProjectedGeometry:
+    """Flatten the projected `mesh` geometry and topology into named arrays.
+
+    Parameters
+    ----------
+    projected : PolyData
+        The projected proxy of the `mesh`, with the tracked points and cells.
+    mesh : PolyData
+        The original mesh.
+
+    Returns
+    -------
+    dict of ndarray
+        The projected points, connectivity, point data and cell data of the
+        mesh, along with the tracked parent points and cells.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    entry = {"points": np.array(projected.points)}
+
+    for kind in CELL_ARRAY_TYPES:
+        cells = getattr(projected, f"Get{kind.capitalize()}")()
+        if cells.GetNumberOfCells():
+            entry[f"{kind}.offsets"] = np.array(
+                pv.convert_array(cells.GetOffsetsArray())
+            )
+            entry[f"{kind}.connectivity"] = np.array(
+                pv.convert_array(cells.GetConnectivityArray())
+            )
+
+    for name in projected.point_data.keys():  # noqa: SIM118
+        if name not in (_CACHE_POINT_IDS, _CACHE_POINT_HASH):
+            entry[f"point_data.{name}"] = np.array(projected.point_data[name])
+
+    for name in projected.cell_data.keys():  # noqa: SIM118
+        key = "cell_ids" if name == _CACHE_CELL_IDS else f"cell_data.{name}"
+        entry[key] = np.array(projected.cell_data[name])
+
+    if _CACHE_POINT_IDS in projected.point_data and "cell_ids" in entry:
+        entry.update(_track_points(projected, mesh, entry))
+
+    return entry
+
+
+def _track_points(
+    projected: pv.PolyData, mesh: pv.PolyData, entry: ProjectedGeometry
+) -> ProjectedGeometry:
+    """Recover the parent points of each point of the projected `mesh`.
+
+    Slicing a mesh linearly interpolates its point data at the new seam points,
+    which lie within their original cell. The parent vertices and weights of
+    each seam point are recovered from its interpolated point indices and point
+    hashes, which are consistent only for the true parent weights.
+
+    Parameters
+    ----------
+    projected : PolyData
+        The projected proxy of the `mesh`, with the tracked points and cells.
+    mesh : PolyData
+        The original mesh.
+    entry : dict of ndarray
+        The flattened projected geometry, with the tracked cells.
+
+    Returns
+    -------
+    dict of ndarray
+        The ``point_ids`` parent of each point, and the ``seam_ids``,
+        ``seam_parents`` and ``seam_weights`` of the seam points, which are
+        the weighted sum of their ``seam_parents``. No parents are returned
+        should any seam point be unresolved.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    ids = np.asarray(projected.point_data[_CACHE_POINT_IDS], dtype=np.float64)
+    hashes = np.asarray(projected.point_data[_CACHE_POINT_HASH], dtype=np.float64)
+    source = _point_hashes(mesh.n_points, hashes.shape[1])
+    parents = np.clip(np.rint(ids), 0, mesh.n_points - 1).astype(np.int64)
+    seam_ids = np.flatnonzero(
+        (parents != ids)
+        | ~np.all(np.isclose(source[parents], hashes, rtol=0, atol=1e-12), axis=1)
+    )
+    seam_parents = np.zeros((seam_ids.size, 0), dtype=np.int64)
+    seam_weights = np.zeros((seam_ids.size, 0))
+
+    if seam_ids.size:
+        # the original cell of the first projected cell of each seam point
+        kinds = [kind for kind in CELL_ARRAY_TYPES if f"{kind}.offsets" in entry]
+        offset = 0
+        cells = np.full(projected.n_points, -1, dtype=np.int64)
+
+        for kind in kinds:
+            offsets = entry[f"{kind}.offsets"]
+            cell = np.repeat(np.arange(offsets.size - 1), np.diff(offsets))
+            cells[entry[f"{kind}.connectivity"]] = cell + offset
+            offset += offsets.size - 1
+
+        if np.any((cells := cells[seam_ids]) < 0):
+            return {}
+
+        # the original polygon of each seam point, as cells are ordered by
+        # vertices, lines, polygons then strips
+        cells = entry["cell_ids"][cells] - mesh.n_verts - mesh.n_lines
+
+        if np.any(cells < 0) or np.any(cells >= mesh.GetNumberOfPolys()):
+            return {}
+
+        # the vertices of the original cells, padded with the first vertex
+        faces = pv.convert_array(mesh.GetPolys().GetConnectivityArray())
+        offsets = pv.convert_array(mesh.GetPolys().GetOffsetsArray())
+        counts = np.diff(offsets)[cells]
+        columns = np.arange(counts.max())
+        mask = columns < counts[:, np.newaxis]
+        seam_parents = faces[offsets[cells][:, np.newaxis] + columns * mask]
+
+        # solve for the weights of the vertices, which sum to one and
+        # reproduce both the interpolated (normalised) point indices and
+        # point hashes
+        scale = 1 / mesh.n_points
+        system = np.concatenate(
+            [
+                np.ones_like(seam_parents, dtype=np.float64)[:, np.newaxis],
+                seam_parents[:, np.newaxis] * scale,
+                np.moveaxis(source[seam_parents], -1, 1),
+            ],
+            axis=1,
+        )
+        system *= mask[:, np.newaxis]
+        target = np.column_stack(
+            [np.ones(seam_ids.size), ids[seam_ids] * scale, hashes[seam_ids]]
+        )
+        seam_weights = np.einsum(
+            "ijk,ik->ij", np.linalg.pinv(system), target, optimize=True
+        )
+        residual = np.einsum("ijk,ik->ij", system, seam_weights) - target
+
+        if not np.allclose(residual, 0, rtol=0, atol=1e-6) or np.any(
+            seam_weights < -1e-6
+        ):
+            return {}
+
+    return {
+        "point_ids": parents,
+        "seam_ids": seam_ids,
+        "seam_parents": seam_parents,
+        "seam_weights": seam_weights,
+    }
+
+
+def _point_hashes(n_points: int, n_components: int) -> np.ndarray:
+    """Generate the reproducible point hashes that disambiguate tracked points.
+
+    Parameters
+    ----------
+    n_points : int
+        The number of points.
+    n_components : int
+        The number of hash components of each point, which must be at least
+        the maximum number of vertices of a cell to resolve any seam point.
+
+    Returns
+    -------
+    ndarray
+        The uniformly distributed point hashes in the half-open interval [0, 1).
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    rng = np.random.default_rng(seed=n_points)
+    return rng.random((n_points, n_components))
+
+
+def _unpack_projection(
+    entry: ProjectedGeometry, mesh: pv.PolyData, tgt_crs: pyproj.CRS
+) -> pv.PolyData:
+    """Create a projected mesh from copies of the cached arrays of the `entry`.
+
+    Parameters
+    ----------
+    entry : dict of ndarray
+        The cached projected geometry.
+    mesh : PolyData
+        The original mesh, which provides the point data, cell data and
+        field data.
+    tgt_crs : CRS
+        The target Coordinate Reference System (CRS) of the projected mesh.
+
+    Returns
+    -------
+    PolyData
+        The projected mesh.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    result = pv.PolyData()
+    # the mesh owns copies of the cached arrays, hence in-place modification
+    # of the mesh never corrupts the cached entry
+    result.points = entry["points"].copy()
+
+    for kind in CELL_ARRAY_TYPES:
+        if (offsets := entry.get(f"{kind}.offsets")) is not None:
+            cells = pv.CellArray.from_arrays(
+                offsets, entry[f"{kind}.connectivity"], deep=True
+            )
+            getattr(result, f"Set{kind.capitalize()}")(cells)
+
+    for key, data in entry.items():
+        if key.startswith("point_data."):
+            result.point_data[key.split(".", 1)[1]] = data.copy()
+        elif key.startswith("cell_data."):
+            result.cell_data[key.split(".", 1)[1]] = data.copy()
+
+    # re-attach the point data of the original mesh, via the tracked points
+    if (point_ids := entry.get("point_ids")) is not None:
+        seam_ids = entry["seam_ids"]
+        seam_parents = entry["seam_parents"]
+        seam_weights = entry["seam_weights"]
+
+        for name in mesh.point_data.keys():  # noqa: SIM118
+            data = np.asarray(mesh.point_data[name])
+            values = data[point_ids]
+
+            if seam_ids.size and np.issubdtype(data.dtype, np.number):
+                weights = seam_weights.reshape(
+                    seam_weights.shape + (1,) * (data.ndim - 1)
+                )
+                interpolated = np.sum(
+                    weights * data[seam_parents].astype(np.float64), axis=1
+                )
+                if not np.issubdtype(data.dtype, np.floating):
+                    interpolated = np.rint(interpolated)
+                values[seam_ids] = interpolated.astype(data.dtype)
+
+            result.point_data[name] = values
+
+        if (tcoords := mesh.point_data.active_texture_coordinates_name) is not None:
+            result.point_data.active_texture_coordinates_name = tcoords
+
+    # re-attach the cell data of the original mesh, via the tracked cells
+    if (cell_ids := entry.get("cell_ids")) is not None:
+        for name in mesh.cell_data.keys():  # noqa: SIM118
+            result.cell_data[name] = np.asarray(mesh.cell_data[name])[cell_ids]
+
+    for name in mesh.field_data.keys():  # noqa: SIM118
+        result.field_data[name] = deepcopy(mesh.field_data[name])
+
+    info = mesh.active_scalars_info
+
+    if info.name is not None:
+        association = info.association.name.lower()
+        attributes = result.cell_data if association == "cell" else result.point_data
+        if info.name in attributes:
+            result.set_active_scalars(
+                info.name, preference="cell" if association == "cell" else "point"
+            )
+
+    to_wkt(result, tgt_crs)
+
+    return result
+
+
+class TransformerCacheInfo(NamedTuple):
+    """Diagnostic statistics of the :class:`pyproj.Transformer` cache.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    hits: int
+    """The number of cache lookups satisfied by a cached transformer."""
+
+    misses: int
+    """The number of cache lookups that created a new transformer."""
+
+    maxsize: int
+    """The maximum number of transformers held by the cache."""
+
+    currsize: int
+    """The current number of transformers held by the cache."""
+
+
+@lru_cache(maxsize=TRANSFORMER_CACHE_SIZE)
+def _cached_transformer(
+    src_crs: pyproj.CRS, tgt_crs: pyproj.CRS, *, always_xy: bool
+) -> pyproj.Transformer:
+    """Create the transformer for the CRS pair, memoized on the CRS pair.
+
+    Cache lookups are serialized by :func:`get_transformer`, and
+    :class:`pyproj.Transformer` instances are thread-safe (``pyproj>=3.1``),
+    hence cached transformers may be shared across threads.
+
+    Parameters
+    ----------
+    src_crs : CRS
+        The source Coordinate Reference System (CRS).
+    tgt_crs : CRS
+        The target Coordinate Reference System (CRS).
+    always_xy : bool
+        Whether the transformer accepts and returns ``x, y`` (longitude, latitude)
+        axis order, irrespective of the CRS axis order.
+
+    Returns
+    -------
+    Transformer
+        The transformer from the `src_crs` to the `tgt_crs`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    return pyproj.Transformer.from_crs(src_crs, tgt_crs, always_xy=always_xy)
+
+
+def get_transformer(
+    src_crs: CRSLike,
+    tgt_crs: CRSLike,
+    *,
+    always_xy: bool | None = True,
+) -> pyproj.Transformer:
+    """Get the cached transformer from the source to the target CRS.
+
+    Creating a :class:`pyproj.Transformer` requires a search for a suitable
+    PROJ pipeline, which is relatively expensive. Transformers are therefore
+    cached, keyed on the CRS pair and `always_xy`, within a bounded LRU cache
+    of :data:`TRANSFORMER_CACHE_SIZE` entries that is safe to share across
+    threads.
+
+    Parameters
+    ----------
+    src_crs : CRSLike
+        The source Coordinate Reference System (CRS). May be anything accepted
+        by :meth:`pyproj.crs.CRS.from_user_input`.
+    tgt_crs : CRSLike
+        The target Coordinate Reference System (CRS). May be anything accepted
+        by :meth:`pyproj.crs.CRS.from_user_input`.
+    always_xy : bool, default=True
+        Whether the transformer accepts and returns ``x, y`` (longitude, latitude)
+        axis order, irrespective of the CRS axis order.
+
+    Returns
+    -------
+    Transformer
+        The transformer from the `src_crs` to the `tgt_crs`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if always_xy is None:
+        always_xy = True
+
+    src_crs = pyproj.CRS.from_user_input(src_crs)
+    tgt_crs = pyproj.CRS.from_user_input(tgt_crs)
+
+    with _TRANSFORMER_LOCK:
+        return _cached_transformer(src_crs, tgt_crs, always_xy=bool(always_xy))
+
+
+def transformer_cache_clear() -> None:
+    """Purge all cached :class:`pyproj.Transformer` instances and statistics.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    _cached_transformer.cache_clear()
+
+
+def transformer_cache_info() -> TransformerCacheInfo:
+    """Report the :class:`pyproj.Transformer` cache statistics.
+
+    Returns
+    -------
+    TransformerCacheInfo
+        The cache hit and miss counters, along with the maximum and current
+        cache size.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    info = _cached_transformer.cache_info()
+    return TransformerCacheInfo(
+        hits=info.hits,
+        misses=info.misses,
+        maxsize=TRANSFORMER_CACHE_SIZE if info.maxsize is None else info.maxsize,
+        currsize=info.currsize,
+    )
+
 
 def transform_mesh(
     mesh: pv.PolyData,
@@ -62,6 +903,10 @@ def transform_mesh(
     rtol: float | None = None,
     atol: float | None = None,
     inplace: bool | None = False,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    max_error: float | None = None,
+    cache: ProjectionCache | None = None,
 ) -> pv.PolyData:
     """Transform the mesh from its source CRS to the target CRS.
 
@@ -95,6 +940,23 @@ def transform_mesh(
     inplace : bool, default=False
         Update the `mesh` in-place. Can only perform an in-place operation when
         ``slice_connectivity=False``.
+    workers : int, optional
+        The number of threads used to project the mesh points in parallel chunks.
+        Defaults to :data:`geovista.config.GEOVISTA_TRANSFORM_WORKERS`. See
+        :func:`transform_points` for more.
+    chunk_size : int, optional
+        The number of mesh points projected per chunk. Defaults to
+        :data:`geovista.config.GEOVISTA_TRANSFORM_CHUNK_SIZE`. See
+        :func:`transform_points` for more.
+    max_error : float, optional
+        Enable the fast approximate projection of the mesh points from a
+        geographic source CRS, with the maximum absolute interpolation error
+        in canonical `tgt_crs` units. See :func:`transform_points` for more.
+    cache : ProjectionCache, optional
+        Opt-in cache of projected geometries. On a cache hit the mesh is not
+        sliced or re-projected, instead a new mesh is returned that shares the
+        cached projected points and sliced topology, with the cell data of the
+        `mesh` attached. The `inplace` option is ignored when caching.
 
     Returns
     -------
@@ -135,34 +997,109 @@ def transform_mesh(
         else:
             zscale = ZLEVEL_SCALE
 
+    if transform_required and cache is not None:
+        key = cache.key(
+            mesh,
+            src_crs,
+            original_tgt_crs,
+            central_meridian=central_meridian,
+            slice_connectivity=slice_connectivity,
+            radius=radius,
+            zlevel=zlevel,
+            zscale=zscale,
+            rtol=rtol,
+            atol=atol,
+            max_error=max_error,
+        )
+
+        if (entry := cache.get(key)) is None:
+            # project a shallow proxy of the mesh, replacing its point data
+            # and cell data with arrays that track the points and cells
+            # through any slicing. the proxy shares its points with the mesh,
+            # which is safe as the projection never modifies its input points
+            proxy = mesh.copy(deep=False)
+            proxy.point_data.clear()
+            proxy.cell_data.clear()
+            proxy.point_data[_CACHE_POINT_IDS] = np.arange(
+                mesh.n_points, dtype=np.float64
+            )
+            # sufficient hash components to resolve the weights of the
+            # vertices of any sliced polygon
+            n_components = max(mesh.GetPolys().GetMaxCellSize(), 1)
+            proxy.point_data[_CACHE_POINT_HASH] = _point_hashes(
+                mesh.n_points, n_components
+            )
+            proxy.cell_data[_CACHE_CELL_IDS] = np.arange(mesh.n_cells)
+            projected = transform_mesh(
+                proxy,
+                original_tgt_crs,
+                slice_connectivity=slice_connectivity,
+                radius=radius,
+                zlevel=zlevel,
+                zscale=zscale,
+                rtol=rtol,
+                atol=atol,
+                workers=workers,
+                chunk_size=chunk_size,
+                max_error=max_error,
+            )
+            entry = _pack_projection(projected, mesh)
+
+            if _CACHE_POINT_IDS in projected.point_data and "point_ids" not in entry:
+                # unable to track the seam points, so project without caching
+                return transform_mesh(
+                    mesh.copy(deep=False),
+                    original_tgt_crs,
+                    slice_connectivity=slice_connectivity,
+                    radius=radius,
+                    zlevel=zlevel,
+                    zscale=zscale,
+                    rtol=rtol,
+                    atol=atol,
+                    workers=workers,
+                    chunk_size=chunk_size,
+                    max_error=max_error,
+                )
+
+            cache.put(key, entry)
+
+        return _unpack_projection(entry, mesh, original_tgt_crs)
+
     if transform_required:
         # slice the mesh to break connectivity, but not for a point-cloud
         if slice_connectivity:
-            if central_meridian:
-                mesh.rotate_z(-central_meridian, inplace=True)
-                tgt_crs = set_central_meridian(tgt_crs, 0)
-
             if not cloud:
-                # the sliced_mesh is guaranteed to be a new instance,
-                # even if not bisected
-                sliced_mesh = slice_mesh(mesh, rtol=rtol, atol=atol)
+                # the sliced mesh is guaranteed to be a new instance, even
+                # if not bisected, with the seam along the anti-meridian of
+                # the central meridian
+                mesh = slice_mesh(mesh, meridian=central_meridian, rtol=rtol, atol=atol)
             else:
-                sliced_mesh = mesh.copy()
-
-            if central_meridian:
-                # undo rotation of original mesh
-                mesh.rotate_z(central_meridian, inplace=True)
-
-            mesh = sliced_mesh
+                mesh = mesh.copy()
 
         # now perform the CRS transformation
         if src_crs == WGS84:
-            xyz = from_cartesian(mesh, closed_interval=True, rtol=rtol, atol=atol)
+            # offset the longitudes by the central meridian, rather than
+            # rotating the mesh, so that the seam is at the 180th meridian
+            xyz = from_cartesian(
+                mesh,
+                closed_interval=True,
+                meridian=central_meridian,
+                rtol=rtol,
+                atol=atol,
+            )
+            if central_meridian:
+                tgt_crs = set_central_meridian(tgt_crs, 0)
         else:
             xyz = mesh.points
 
         transformed = transform_points(
-            src_crs=src_crs, tgt_crs=tgt_crs, xs=xyz[:, 0], ys=xyz[:, 1]
+            src_crs=src_crs,
+            tgt_crs=tgt_crs,
+            xs=xyz[:, 0],
+            ys=xyz[:, 1],
+            workers=workers,
+            chunk_size=chunk_size,
+            max_error=max_error,
         )
 
         xs, ys = transformed[:, 0], transformed[:, 1]
@@ -202,6 +1139,850 @@ def transform_mesh(
     return mesh
 
 
+def _get_executor(workers: int) -> ThreadPoolExecutor:
+    """Get the shared thread pool of projection workers.
+
+    The pool is created lazily, and then reused across calls. As PROJ objects
+    are held per thread by :class:`pyproj.Transformer`, long-lived workers
+    avoid rebuilding the PROJ pipeline of a cached transformer on each call.
+    The pool is sized by :data:`geovista.config.GEOVISTA_TRANSFORM_WORKERS`,
+    and is only replaced should more `workers` be requested.
+
+    Parameters
+    ----------
+    workers : int
+        The minimum number of threads required.
+
+    Returns
+    -------
+    ThreadPoolExecutor
+        The shared thread pool.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    global _EXECUTOR, _EXECUTOR_WORKERS  # noqa: PLW0603
+
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None or workers > _EXECUTOR_WORKERS:
+            if _EXECUTOR is not None:
+                _EXECUTOR.shutdown(wait=False)
+
+            _EXECUTOR_WORKERS = max(workers, gvc.GEOVISTA_TRANSFORM_WORKERS)
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=_EXECUTOR_WORKERS, thread_name_prefix="geovista"
+            )
+
+        return _EXECUTOR
+
+
+def _map_chunks(
+    worker: Callable[[int], None], size: int, *, workers: int, chunk_size: int
+) -> None:
+    """Apply the `worker` to each contiguous chunk of spatial points.
+
+    The chunks are shared between at most `workers` tasks of the shared thread
+    pool, which are each responsible for a strided subset of the chunks.
+
+    Parameters
+    ----------
+    worker : callable
+        The function applied to the index of the first point of each chunk.
+    size : int
+        The total number of spatial points.
+    workers : int
+        The maximum number of concurrent tasks.
+    chunk_size : int
+        The number of spatial points per chunk.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    starts = range(0, size, chunk_size)
+    tasks = min(workers, len(starts))
+
+    def task(offset: int) -> None:
+        """Apply the `worker` to a strided subset of the chunks.
+
+        Parameters
+        ----------
+        offset : int
+            The index of the first chunk of the subset.
+
+        """
+        for start in starts[offset::tasks]:
+            worker(start)
+
+    if tasks > 1:
+        executor = _get_executor(tasks)
+        # consume the results to propagate any worker exceptions
+        _ = list(executor.map(task, range(tasks)))
+    else:
+        task(0)
+
+
+def _transform_chunks(
+    transformer: pyproj.Transformer,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    zs: np.ndarray | None,
+    *,
+    trap: bool,
+    workers: int,
+    chunk_size: int,
+) -> tuple[np.ndarray, ...]:
+    """Transform the spatial points in parallel chunks.
+
+    The spatial points are copied into preallocated result arrays, and each
+    contiguous chunk is then transformed in-place by a worker thread of the
+    shared thread pool.
+
+    Parameters
+    ----------
+    transformer : Transformer
+        The transformer from the source to the target CRS.
+    xs : ndarray
+        The 1D spatial points x-values.
+    ys : ndarray
+        The 1D spatial points y-values.
+    zs : ndarray, optional
+        The 1D spatial points z-values.
+    trap : bool
+        Raise an exception if an error occurs during CRS transformation
+        of the spatial points.
+    workers : int
+        The number of worker threads.
+    chunk_size : int
+        The number of spatial points transformed per chunk.
+
+    Returns
+    -------
+    tuple of ndarray
+        The transformed x-values and y-values, and z-values if `zs` were
+        provided.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    result = [np.array(xs, dtype=np.float64), np.array(ys, dtype=np.float64)]
+
+    if zs is not None:
+        result.append(np.array(zs, dtype=np.float64))
+
+    def worker(start: int) -> None:
+        """Transform one chunk of the result in-place.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first spatial point of the chunk.
+
+        """
+        chunk = slice(start, start + chunk_size)
+        transformer.transform(
+            result[0][chunk],
+            result[1][chunk],
+            zz=None if zs is None else result[2][chunk],
+            errcheck=trap,
+            inplace=True,
+        )
+
+    _map_chunks(worker, xs.size, workers=workers, chunk_size=chunk_size)
+
+    return tuple(result)
+
+
+class _ProjectionTable:
+    """Adaptive lookup table approximating the forward projection of lon/lat.
+
+    The table bounds are partitioned into square tiles, which are recursively
+    quartered until the bilinear interpolation of the projected tile corners
+    meets the error bound at a regular lattice of probes within each tile.
+    Blank tiles, which are entirely outside the projection domain, interpolate
+    to ``inf``. Tiles that never meet the bound e.g., spanning a projection
+    discontinuity or the edge of the projection domain, are unresolved and
+    interpolate to ``nan``.
+
+    The bilinear coefficients of each (leaf) tile are expressed in the global
+    coordinates of the table, hence a lookup is a flat gather of eight
+    coefficients per point. Leaf tiles are located by a flat gather of a dense
+    index, or by a binary search of the codes of any deeper leaf tiles.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    def __init__(
+        self,
+        transformer: pyproj.Transformer,
+        bounds: tuple[float, float, float, float],
+        max_error: float,
+    ) -> None:
+        """Build the adaptive lookup table.
+
+        Parameters
+        ----------
+        transformer : Transformer
+            The transformer from the geographic source to the target CRS.
+        bounds : tuple of float
+            The ``(lon_min, lon_max, lat_min, lat_max)`` bounds of the table,
+            aligned to :data:`PROJECTION_TABLE_STEP`.
+        max_error : float
+            The maximum interpolation error, in canonical target CRS units.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        lon_min, lon_max, lat_min, lat_max = bounds
+        step = PROJECTION_TABLE_STEP
+        nx = round((lon_max - lon_min) / step)
+        ny = round((lat_max - lat_min) / step)
+
+        self.origin = (lon_min, lat_min)
+        self.shape = (nx, ny)
+
+        probes = _PROJECTION_TABLE_PROBES
+        fractions = np.linspace(0, 1, probes)
+        fu, fv = (grid.ravel() for grid in np.meshgrid(fractions, fractions))
+        # corner order (0, 0), (1, 0), (0, 1), (1, 1) of the probe lattice
+        du, dv = np.array([0, 1, 0, 1]), np.array([0, 0, 1, 1])
+        corners = (dv * probes + du) * (probes - 1)
+        interior = np.setdiff1d(np.arange(probes**2), corners)
+        # the probe lattice of a tile provides the corners of its quarters, in
+        # the order of the quarters and then their corners
+        half = (probes - 1) // 2
+        quarters = ((dv[:, np.newaxis] + dv) * probes + du[:, np.newaxis] + du) * half
+
+        def project(
+            i: np.ndarray, j: np.ndarray, scale: int, lattice: np.ndarray
+        ) -> tuple[np.ndarray, ...]:
+            """Project the lattice probes of the tiles of a level.
+
+            Parameters
+            ----------
+            i : ndarray
+                The 1D x-index of each tile.
+            j : ndarray
+                The 1D y-index of each tile.
+            scale : int
+                The number of tiles per table tile of the level.
+            lattice : ndarray
+                The indices of the probes within the probe lattice.
+
+            Returns
+            -------
+            tuple of ndarray
+                The table tile coordinates, and the projected x-values and
+                y-values of the probes of each tile.
+
+            """
+            us = (i[:, np.newaxis] + fu[lattice]) / scale
+            vs = (j[:, np.newaxis] + fv[lattice]) / scale
+            pxs, pys = transformer.transform(
+                lon_min + us.ravel() * step, lat_min + vs.ravel() * step, errcheck=False
+            )
+            return us, vs, np.reshape(pxs, us.shape), np.reshape(pys, us.shape)
+
+        i, j = (grid.ravel() for grid in np.meshgrid(np.arange(nx), np.arange(ny)))
+        cxs, cys = project(i, j, 1, corners)[2:]
+        # the level, tile indices, coefficients and failure of the leaf tiles
+        leaves: list[tuple[int, np.ndarray, np.ndarray, np.ndarray, bool]] = []
+        blanks: list[np.ndarray] = []
+        parents = np.full(i.size, np.inf)
+        bound = _PROJECTION_TABLE_MARGIN * max_error
+
+        for level in range(PROJECTION_TABLE_MAX_LEVEL + 1):
+            scale = 2**level
+            us, vs, pxs, pys = project(i, j, scale, interior)
+            coefficients = np.vstack(
+                [
+                    _bilinear_coefficients(cxs, i, j, scale),
+                    _bilinear_coefficients(cys, i, j, scale),
+                ]
+            )
+
+            with np.errstate(invalid="ignore", over="ignore"):
+                # the error of the interpolant at the interior probes, as
+                # evaluated by a lookup
+                error = np.maximum(
+                    np.abs(_bilinear(coefficients[:4, :, np.newaxis], us, vs) - pxs),
+                    np.abs(_bilinear(coefficients[4:, :, np.newaxis], us, vs) - pys),
+                ).max(axis=1)
+
+            finite = np.isfinite(pxs) & np.isfinite(pys)
+            finite = np.hstack([finite, np.isfinite(cxs) & np.isfinite(cys)])
+            resolved = np.isfinite(error) & (error <= bound)
+            blank = ~np.any(finite, axis=1)
+            # only blank tiles surrounded by blank tiles are blank leaves, as the
+            # projection domain may encroach on a blank tile between its probes
+            blank[blank] = _surrounded(i[blank], j[blank], blanks, (nx, ny), level)
+            blanks.append(np.sort(i[blank] * (ny * scale) + j[blank]))
+            leaves.append(
+                (level, i[resolved], j[resolved], coefficients[:, resolved], False)
+            )
+            leaves.append(
+                (level, i[blank], j[blank], _fill(blank.sum(), np.inf), False)
+            )
+            # the bilinear error of a smooth tile reduces four-fold per level,
+            # hence tiles that cannot meet the bound by the maximum level are
+            # hopeless, unlike those spanning a discontinuity
+            hopeless = np.isfinite(error) & (2 * error < parents)
+            hopeless &= error > bound * 4.0 ** (PROJECTION_TABLE_MAX_LEVEL - level)
+            leaves.append(
+                (level, i[hopeless], j[hopeless], _fill(hopeless.sum(), np.nan), True)
+            )
+            remaining = np.flatnonzero(~resolved & ~blank & ~hopeless)
+            refine = 0
+
+            if level < PROJECTION_TABLE_MAX_LEVEL:
+                refine = min(remaining.size, PROJECTION_TABLE_MAX_TILES // 4)
+
+            if refine < remaining.size:
+                # within budget, refine the tiles closest to meeting the bound
+                remaining = remaining[np.argsort(error[remaining], kind="stable")]
+                stop = remaining[refine:]
+                # the unrefined tiles are unresolved, and have failed should they
+                # be within the projection domain
+                failures = np.all(finite[stop], axis=1)
+                for failed in (False, True):
+                    mask = stop[failures == failed]
+                    leaves.append(
+                        (level, i[mask], j[mask], _fill(mask.size, np.nan), failed)
+                    )
+                remaining = remaining[:refine]
+
+            if not remaining.size:
+                break
+
+            # quarter the remaining tiles, whose probe lattices provide the
+            # corners of their quarters
+            lattice = np.empty((2, remaining.size, probes**2))
+            lattice[0][:, interior], lattice[1][:, interior] = (
+                pxs[remaining],
+                pys[remaining],
+            )
+            lattice[0][:, corners], lattice[1][:, corners] = (
+                cxs[remaining],
+                cys[remaining],
+            )
+            cxs = lattice[0][:, quarters].reshape(-1, 4)
+            cys = lattice[1][:, quarters].reshape(-1, 4)
+            i = (2 * i[remaining, np.newaxis] + du).ravel()
+            j = (2 * j[remaining, np.newaxis] + dv).ravel()
+            parents = np.repeat(error[remaining], 4)
+
+        levels = np.concatenate([np.full(leaf[1].size, leaf[0]) for leaf in leaves])
+        i = np.concatenate([leaf[1] for leaf in leaves])
+        j = np.concatenate([leaf[2] for leaf in leaves])
+        # the eight coefficients of a leaf tile are a contiguous row, hence
+        # gathered from a single cache line
+        self.coefficients = np.ascontiguousarray(
+            np.hstack([leaf[3] for leaf in leaves]).T
+        )
+        self.failed = np.concatenate(
+            [np.full(leaf[1].size, leaf[4]) for leaf in leaves]
+        )
+
+        # the dense index of the leaf tiles no deeper than the dense level,
+        # padded by one tile to include the upper table bounds
+        depth = 0
+        while (
+            depth < levels.max()
+            and (nx * 2 ** (depth + 1) + 1) * (ny * 2 ** (depth + 1) + 1)
+            <= _PROJECTION_TABLE_DENSE_SIZE
+        ):
+            depth += 1
+
+        scale = 2**depth
+        index = np.full((nx * scale + 1, ny * scale + 1), -1, dtype=np.int32)
+
+        for level in range(depth + 1):
+            ids = np.flatnonzero(levels == level)
+            span = np.arange(2 ** (depth - level))
+            rows = i[ids, np.newaxis, np.newaxis] * span.size + span[:, np.newaxis]
+            cols = j[ids, np.newaxis, np.newaxis] * span.size + span
+            index[rows, cols] = ids[:, np.newaxis, np.newaxis]
+
+        index[-1] = index[-2]
+        index[:, -1] = index[:, -2]
+        self.depth = depth
+        self.index = index.ravel()
+
+        # the sorted codes of the leaf tiles of the deeper levels
+        self.codes: list[tuple[int, np.ndarray, np.ndarray]] = []
+
+        for level in range(depth + 1, levels.max() + 1):
+            ids = np.flatnonzero(levels == level)
+            codes = i[ids] * (ny << level) + j[ids]
+            order = np.argsort(codes)
+            self.codes.append((level, codes[order], ids[order]))
+
+    def locate(self, us: np.ndarray, vs: np.ndarray) -> np.ndarray:
+        """Locate the leaf tiles of the spatial points.
+
+        Parameters
+        ----------
+        us : ndarray
+            The 1D spatial points x-values, in table tile coordinates.
+        vs : ndarray
+            The 1D spatial points y-values, in table tile coordinates.
+
+        Returns
+        -------
+        ndarray
+            The leaf tile index of each spatial point.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        nx, ny = self.shape
+        scale = 2**self.depth
+        index = (us * scale).astype(np.intp)
+        index *= ny * scale + 1
+        index += (vs * scale).astype(np.intp)
+        ids: np.ndarray = self.index.take(index)
+
+        if self.codes and np.any(unresolved := ids < 0):
+            pending = np.flatnonzero(unresolved)
+
+            for level, codes, leaf_ids in self.codes:
+                scale = 2**level
+                i = np.clip((us[pending] * scale).astype(np.intp), 0, nx * scale - 1)
+                j = np.clip((vs[pending] * scale).astype(np.intp), 0, ny * scale - 1)
+                point_codes = i * (ny * scale) + j
+                index = np.minimum(np.searchsorted(codes, point_codes), codes.size - 1)
+                found = codes[index] == point_codes
+                ids[pending[found]] = leaf_ids[index[found]]
+                pending = pending[~found]
+
+                if not pending.size:
+                    break
+
+        return ids
+
+    def interpolate(
+        self, lons: np.ndarray, lats: np.ndarray, xs: np.ndarray, ys: np.ndarray
+    ) -> None:
+        """Interpolate the projected spatial points from the table.
+
+        The spatial points are interpolated in blocks that are small enough
+        for the intermediate arrays to remain in the processor cache.
+
+        Parameters
+        ----------
+        lons : ndarray
+            The 1D finite longitudes within the table bounds.
+        lats : ndarray
+            The 1D finite latitudes within the table bounds.
+        xs : ndarray
+            The 1D result projected x-values, which are ``inf`` for blank
+            tiles and ``nan`` for unresolved tiles.
+        ys : ndarray
+            The 1D result projected y-values, which are ``inf`` for blank
+            tiles and ``nan`` for unresolved tiles.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        lon_min, lat_min = self.origin
+        scale = 1 / PROJECTION_TABLE_STEP
+
+        for start in range(0, lons.size, _PROJECTION_TABLE_BLOCK):
+            block = slice(start, start + _PROJECTION_TABLE_BLOCK)
+            us = lons[block] - lon_min
+            us *= scale
+            vs = lats[block] - lat_min
+            vs *= scale
+            coefficients = self.coefficients.take(self.locate(us, vs), axis=0)
+
+            for offset, result in ((0, xs[block]), (4, ys[block])):
+                a, b, c, d = coefficients[:, offset : offset + 4].T
+                # horner evaluation of the bilinear interpolant, in-place
+                np.multiply(d, vs, out=result)
+                np.add(result, b, out=result)
+                np.multiply(result, us, out=result)
+                np.add(result, a, out=result)
+                np.add(result, c * vs, out=result)
+
+
+def _bilinear(coefficients: np.ndarray, us: np.ndarray, vs: np.ndarray) -> np.ndarray:
+    """Evaluate the bilinear interpolant, as for a lookup.
+
+    Parameters
+    ----------
+    coefficients : ndarray
+        The coefficients ``a, b, c, d`` of the interpolant
+        ``a + b*u + c*v + d*u*v``.
+    us : ndarray
+        The x-values, in table tile coordinates.
+    vs : ndarray
+        The y-values, in table tile coordinates.
+
+    Returns
+    -------
+    ndarray
+        The interpolated values.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    a, b, c, d = coefficients
+    result: np.ndarray = ((d * vs + b) * us + a) + c * vs
+    return result
+
+
+def _bilinear_coefficients(
+    corners: np.ndarray, i: np.ndarray, j: np.ndarray, scale: int
+) -> np.ndarray:
+    """Compute the global bilinear interpolation coefficients of the tiles.
+
+    Parameters
+    ----------
+    corners : ndarray
+        The ``(N, 4)`` values at the ``(0, 0)``, ``(1, 0)``, ``(0, 1)`` and
+        ``(1, 1)`` corners of each tile.
+    i : ndarray
+        The 1D x-index of each tile.
+    j : ndarray
+        The 1D y-index of each tile.
+    scale : int
+        The number of tiles per table tile of the level.
+
+    Returns
+    -------
+    ndarray
+        The ``(4, N)`` coefficients ``a, b, c, d`` of the interpolant
+        ``a + b*u + c*v + d*u*v``, in table tile coordinates.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    c00, c10, c01, c11 = corners.T
+
+    with np.errstate(invalid="ignore"):
+        # the coefficients in the local coordinates of each tile
+        b, c, d = c10 - c00, c01 - c00, c11 - c10 - c01 + c00
+
+        # substitute the local coordinates u = scale * U - i, v = scale * V - j
+        return np.vstack(
+            [
+                c00 - b * i - c * j + d * i * j,
+                scale * (b - d * j),
+                scale * (c - d * i),
+                scale**2 * d,
+            ]
+        )
+
+
+def _fill(size: int | np.integer, value: float) -> np.ndarray:
+    """Create the coefficients of tiles that interpolate to a constant `value`.
+
+    Parameters
+    ----------
+    size : int
+        The number of tiles.
+    value : float
+        The interpolated value.
+
+    Returns
+    -------
+    ndarray
+        The ``(8, N)`` bilinear coefficients of the x-values and y-values.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    coefficients = np.zeros((8, size))
+    coefficients[[0, 4]] = value
+    return coefficients
+
+
+def _surrounded(
+    i: np.ndarray,
+    j: np.ndarray,
+    blanks: list[np.ndarray],
+    shape: tuple[int, int],
+    level: int,
+) -> np.ndarray:
+    """Determine whether blank tiles are surrounded by blank tiles.
+
+    Parameters
+    ----------
+    i : ndarray
+        The 1D x-index of each blank tile of the `level`.
+    j : ndarray
+        The 1D y-index of each blank tile of the `level`.
+    blanks : list of ndarray
+        The sorted codes of the blank leaf tiles of each shallower level.
+    shape : tuple of int
+        The number of table tiles in the x-direction and y-direction.
+    level : int
+        The refinement level of the tiles.
+
+    Returns
+    -------
+    ndarray
+        Whether all neighbours of each tile within the table are blank.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    nx, ny = shape[0] << level, shape[1] << level
+    codes = np.sort(i * ny + j)
+    result = np.ones(i.size, dtype=bool)
+
+    for di, dj in (
+        (-1, -1),
+        (-1, 0),
+        (-1, 1),
+        (0, -1),
+        (0, 1),
+        (1, -1),
+        (1, 0),
+        (1, 1),
+    ):
+        ni, nj = i + di, j + dj
+        outside = (ni < 0) | (ni >= nx) | (nj < 0) | (nj >= ny)
+        blank = outside | np.isin(ni * ny + nj, codes)
+
+        # the neighbour may also be within a shallower blank leaf tile
+        for shallow, shallow_codes in enumerate(blanks):
+            shift = level - shallow
+            blank |= np.isin(
+                (ni >> shift) * (ny >> shift) + (nj >> shift), shallow_codes
+            )
+
+        result &= blank
+
+    return result
+
+
+@lru_cache(maxsize=PROJECTION_TABLE_CACHE_SIZE)
+def _cached_projection_table(
+    src_crs: pyproj.CRS,
+    tgt_crs: pyproj.CRS,
+    bounds: tuple[float, float, float, float],
+    max_error: float,
+) -> _ProjectionTable:
+    """Build the approximate projection table, memoized on its CRS pair and bounds.
+
+    Parameters
+    ----------
+    src_crs : CRS
+        The geographic source Coordinate Reference System (CRS).
+    tgt_crs : CRS
+        The target Coordinate Reference System (CRS).
+    bounds : tuple of float
+        The ``(lon_min, lon_max, lat_min, lat_max)`` bounds of the table.
+    max_error : float
+        The maximum interpolation error, in canonical target CRS units.
+
+    Returns
+    -------
+    _ProjectionTable
+        The adaptive lookup table.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    transformer = get_transformer(src_crs, tgt_crs, always_xy=True)
+    return _ProjectionTable(transformer, bounds, max_error)
+
+
+def _check_approx(src_crs: pyproj.CRS, zs: np.ndarray | None, max_error: float) -> None:
+    """Sanity check the options of an approximate transformation.
+
+    Parameters
+    ----------
+    src_crs : CRS
+        The source Coordinate Reference System (CRS).
+    zs : ndarray, optional
+        The spatial points z-values.
+    max_error : float
+        The maximum interpolation error, in canonical target CRS units.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if max_error <= 0:
+        emsg = (
+            f"Cannot transform points, 'max_error' must be positive, got {max_error}."
+        )
+        raise ValueError(emsg)
+
+    if not src_crs.is_geographic:
+        emsg = (
+            "Cannot approximately transform points, requires a geographic "
+            f"source CRS, got '{src_crs.name}'."
+        )
+        raise ValueError(emsg)
+
+    if zs is not None:
+        emsg = "Cannot approximately transform points, 'zs' is not supported."
+        raise ValueError(emsg)
+
+
+def _transform_approx(
+    transformer: pyproj.Transformer,
+    src_crs: pyproj.CRS,
+    tgt_crs: pyproj.CRS,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    *,
+    trap: bool,
+    max_error: float,
+    workers: int,
+    chunk_size: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Transform the geographic spatial points by adaptive table interpolation.
+
+    The table bounds are aligned to :data:`PROJECTION_TABLE_STEP`, so that
+    spatial points with similar extents share the same cached table. Chunks
+    of spatial points are interpolated by the shared thread pool. Spatial
+    points that are not finite, or within unresolved tiles of the table, are
+    transformed exactly, as are those within blank tiles should errors be
+    trapped.
+
+    Parameters
+    ----------
+    transformer : Transformer
+        The transformer from the source to the target CRS.
+    src_crs : CRS
+        The geographic source Coordinate Reference System (CRS).
+    tgt_crs : CRS
+        The target Coordinate Reference System (CRS).
+    xs : ndarray
+        The 1D spatial points longitudes.
+    ys : ndarray
+        The 1D spatial points latitudes.
+    trap : bool
+        Raise an exception if an error occurs during CRS transformation
+        of the spatial points.
+    max_error : float
+        The maximum interpolation error, in canonical target CRS units.
+    workers : int
+        The number of worker threads interpolating chunks of spatial points.
+    chunk_size : int
+        The number of spatial points interpolated per chunk.
+
+    Returns
+    -------
+    tuple of ndarray
+        The transformed x-values and y-values.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    txs, tys = np.empty(xs.size), np.empty(xs.size)
+    lons, lats = xs, ys
+
+    if xs.size and not np.all(
+        np.isfinite(extents := [xs.min(), xs.max(), ys.min(), ys.max()])
+    ):
+        # non-finite spatial points are transformed exactly
+        finite = np.isfinite(xs) & np.isfinite(ys)
+        lons, lats = xs[finite], ys[finite]
+        txs[~finite] = np.nan
+
+    if lons.size:
+        if lons is not xs:
+            extents = [lons.min(), lons.max(), lats.min(), lats.max()]
+
+        step = PROJECTION_TABLE_STEP
+        lon_min = np.floor(extents[0] / step) * step
+        lat_min = np.floor(extents[2] / step) * step
+        bounds = (
+            float(lon_min),
+            float(max(np.ceil(extents[1] / step) * step, lon_min + step)),
+            float(lat_min),
+            float(max(np.ceil(extents[3] / step) * step, lat_min + step)),
+        )
+
+        with _PROJECTION_TABLE_LOCK:
+            table = _cached_projection_table(src_crs, tgt_crs, bounds, float(max_error))
+
+        if lons is xs:
+            result = (txs, tys)
+        else:
+            result = (np.empty(lons.size), np.empty(lons.size))
+
+        def worker(start: int) -> None:
+            """Interpolate one chunk of the result.
+
+            Parameters
+            ----------
+            start : int
+                The index of the first spatial point of the chunk.
+
+            """
+            chunk = slice(start, start + chunk_size)
+            table.interpolate(
+                lons[chunk], lats[chunk], result[0][chunk], result[1][chunk]
+            )
+
+        _map_chunks(worker, lons.size, workers=workers, chunk_size=chunk_size)
+
+        if lons is not xs:
+            txs[finite], tys[finite] = result
+
+        # points within failed tiles of the table could not meet the bound
+        unresolved = np.isnan(result[0])
+
+        if np.any(unresolved):
+            ids = table.locate(
+                (lons[unresolved] - lon_min) / step, (lats[unresolved] - lat_min) / step
+            )
+
+            if n_failed := int(np.count_nonzero(table.failed[ids])):
+                plural = "s" if n_failed > 1 else ""
+                wmsg = (
+                    f"geovista unable to meet 'max_error={max_error}' for {n_failed:,} "
+                    f"spatial point{plural} e.g., near a projection discontinuity or "
+                    "singularity. Falling back to an exact transformation."
+                )
+                warnings.warn(wmsg, stacklevel=2)
+
+    # trapped errors are raised by the exact transformation of blank tiles
+    exact = ~np.isfinite(txs) if trap else np.isnan(txs)
+
+    if np.any(exact):
+        txs[exact], tys[exact] = transformer.transform(
+            xs[exact], ys[exact], errcheck=trap
+        )
+
+    return txs, tys
+
+
 def transform_point(
     src_crs: CRSLike,
     tgt_crs: CRSLike,
@@ -267,9 +2048,29 @@ def transform_points(
     zs: ArrayLike | None = None,
     *,
     trap: bool | None = True,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    max_error: float | None = None,
 ) -> ArrayLike:
     """Transform the spatial points from the source to the target CRS.
 
+    Large numbers of spatial points are projected in parallel, as contiguous
+    chunks of `chunk_size` points are transformed concurrently by `workers`
+    threads into a preallocated result. PROJ releases the GIL during the
+    transformation, and the result is identical to that of a serial
+    transformation.
+
+    Alternatively, a fast approximate transformation of geographic spatial
+    points is performed when `max_error` is provided. The projection is sampled
+    over an adaptive lookup table of longitude/latitude tiles, which are refined
+    until the bilinear interpolation error, estimated at a lattice of probes
+    within each tile, is no more than `max_error`. Tables are cached, keyed on
+    the CRS pair, the table bounds and `max_error`, hence repeated approximate
+    transformations are flat gathers from the table. Spatial points within tiles
+    spanning the edge of the projection domain are transformed exactly, as are
+    those within tiles that fail to meet the error bound e.g., spanning a
+    projection discontinuity, which also issues a warning.
+
     Parameters
     ----------
     src_crs : CRSLike
@@ -296,6 +2097,19 @@ def transform_points(
         Raise an exception if an error occurs during CRS transformation
         of the spatial points. Otherwise, ``inf`` will be returned for
         erroneous points.
+    workers : int, optional
+        The number of threads used to transform the spatial points in parallel
+        chunks. A serial transformation is performed for one worker, or when
+        there are no more than `chunk_size` points. Defaults to
+        :data:`geovista.config.GEOVISTA_TRANSFORM_WORKERS`.
+    chunk_size : int, optional
+        The number of spatial points transformed per chunk. Defaults to
+        :data:`geovista.config.GEOVISTA_TRANSFORM_CHUNK_SIZE`.
+    max_error : float, optional
+        Enable the fast approximate transformation, with the maximum absolute
+        interpolation error in canonical `tgt_crs` units e.g., metres. Requires
+        a geographic `src_crs`, and is not supported for `zs`. If ``None``, an
+        exact transformation is performed.
 
     Returns
     -------
@@ -316,10 +2130,29 @@ def transform_points(
     if zs is not None:
         zs = np.atleast_1d(zs)
 
+    if workers is None:
+        workers = gvc.GEOVISTA_TRANSFORM_WORKERS
+
+    if chunk_size is None:
+        chunk_size = gvc.GEOVISTA_TRANSFORM_CHUNK_SIZE
+
+    if workers < 1:
+        emsg = f"Cannot transform points, 'workers' must be positive, got {workers}."
+        raise ValueError(emsg)
+
+    if chunk_size < 1:
+        emsg = (
+            f"Cannot transform points, 'chunk_size' must be positive, got {chunk_size}."
+        )
+        raise ValueError(emsg)
+
     # sanity check the crs's
     src_crs = pyproj.CRS.from_user_input(src_crs)
     tgt_crs = pyproj.CRS.from_user_input(tgt_crs)
 
+    if max_error is not None:
+        _check_approx(src_crs, zs, max_error)
+
     # sanity check spatial arrays
     if (xndim := xs.ndim) > 2 or (yndim := ys.ndim) > 2:
         emsg = "Cannot transform points, 'xs' and 'ys' must be 1D or 2D only."
@@ -387,8 +2220,10 @@ def transform_points(
         )
 
         if tgt_crs == WGS84:
-            # ensure longitudes (degrees) are in half-closed interval [-180, 180)
-            xs = wrap(xs)
+            # ensure longitudes (degrees) are in half-closed interval [-180, 180),
+            # ignoring the non-finite longitudes of any untrapped failures
+            with np.errstate(invalid="ignore"):
+                xs = wrap(xs)
 
             # reduce any singularity points at the poles to a common longitude
             poles = np.isclose(np.abs(ys), 90)
@@ -400,14 +2235,39 @@ def transform_points(
     if src_crs == tgt_crs:
         result = combine(xs, ys, zs)
     else:
-        transformer = pyproj.Transformer.from_crs(src_crs, tgt_crs, always_xy=True)
+        transformer = get_transformer(src_crs, tgt_crs, always_xy=True)
+        transformed: tuple[np.ndarray, ...]
         if xs.size == 1:
             # unpack to avoid "conversion of an array with ndim > 0 to a scalar"
             # deprecation (numpy 1.25)
             xs, ys = xs[0], ys[0]
             if zs is not None:
                 zs = zs[0]
-        transformed = transformer.transform(xs, ys, zs, errcheck=trap)
+            transformed = transformer.transform(xs, ys, zz=zs, errcheck=bool(trap))
+        elif max_error is not None:
+            transformed = _transform_approx(
+                transformer,
+                src_crs,
+                tgt_crs,
+                xs,
+                ys,
+                trap=bool(trap),
+                max_error=max_error,
+                workers=workers,
+                chunk_size=chunk_size,
+            )
+        elif workers > 1 and xs.size > chunk_size:
+            transformed = _transform_chunks(
+                transformer,
+                xs,
+                ys,
+                zs,
+                trap=bool(trap),
+                workers=workers,
+                chunk_size=chunk_size,
+            )
+        else:
+            transformed = transformer.transform(xs, ys, zz=zs, errcheck=bool(trap))
 
         if zs is None:
             (txs, tys), tzs = transformed, None
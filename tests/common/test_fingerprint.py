@@ -0,0 +1,55 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.common.fingerprint`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pyvista as pv
+
+from geovista.common import fingerprint
+
+
+def test_deterministic():
+    """Test meshes with the same geometry share the same fingerprint."""
+    mesh = pv.Sphere()
+    result = fingerprint(mesh)
+    assert isinstance(result, str)
+    assert len(result) == 32
+    assert fingerprint(mesh.copy()) == result
+
+
+def test_points():
+    """Test the fingerprint is sensitive to the mesh points."""
+    mesh = pv.Sphere()
+    other = mesh.copy()
+    other.points[0, 0] += 1e-9
+    assert fingerprint(other) != fingerprint(mesh)
+
+
+def test_topology():
+    """Test the fingerprint is sensitive to the mesh connectivity."""
+    mesh = pv.Plane()
+    cloud = pv.PolyData(mesh.points)
+    assert fingerprint(cloud) != fingerprint(mesh)
+    assert fingerprint(mesh.triangulate()) != fingerprint(mesh)
+
+
+def test_cell_data():
+    """Test the fingerprint is insensitive to the mesh cell data."""
+    mesh = pv.Sphere()
+    expected = fingerprint(mesh)
+    mesh.cell_data["data"] = np.arange(mesh.n_cells)
+    assert fingerprint(mesh) == expected
+
+
+def test_point_data():
+    """Test the fingerprint is optionally sensitive to the mesh point data."""
+    mesh = pv.Sphere()
+    expected = fingerprint(mesh, point_data=True)
+    mesh.point_data["data"] = np.arange(mesh.n_points)
+    assert fingerprint(mesh) == fingerprint(mesh.copy())
+    assert fingerprint(mesh, point_data=True) != expected
@@ -134,3 +134,20 @@ def test_convert_edges_pole_cell_unfold():
     _, edges = mesh.contour_banded(3)
     result = from_cartesian(edges)
     assert result.shape == (edges.n_points, 3)
+
+
+def test_lines_pole_unfold():
+    """Test unfolding of polar end-points of many line segments."""
+    lonlat = np.array(
+        [[45, -90], [45, 0], [45, 90], [-120, -90], [-120, 0], [-120, 90], [30, 0]]
+    )
+    pids = np.array([[0, 1], [1, 2], [3, 4], [4, 5], [6, 2]])
+    lines = np.full((pids.shape[0], 3), 2, dtype=int)
+    lines[:, 1:] = pids
+    mesh = pv.PolyData()
+    mesh.points = to_cartesian(lonlat[:, 0], lonlat[:, 1])
+    mesh.lines = lines
+    result = from_cartesian(mesh)
+    # the north pole of the first meridian is shared with another longitude
+    expected = [45, 45, 0, -120, -120, -120, 30]
+    np.testing.assert_allclose(result[:, 0], expected, atol=1e-6)
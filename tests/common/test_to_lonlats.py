@@ -10,7 +10,7 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from geovista.common import to_lonlats
+from geovista.common import to_lonlats, wrap
 
 
 @pytest.mark.parametrize(
@@ -65,3 +65,12 @@ def test_radius(manydegrees):
     radii = np.ones(xyz.shape[0])
     lonlats = to_lonlats(xyz, radius=radii)
     np.testing.assert_array_almost_equal(lonlats, manydegrees.expected)
+
+
+@pytest.mark.parametrize("meridian", [-90.0, 30.0, 180.0])
+def test_meridian(manydegrees, meridian):
+    """Test longitudes relative to a meridian."""
+    lonlats = to_lonlats(manydegrees.xyz, meridian=meridian)
+    expected = np.asanyarray(manydegrees.expected, dtype=float)
+    expected[:, 0] = wrap(expected[:, 0] - meridian)
+    np.testing.assert_array_almost_equal(lonlats, expected)
@@ -0,0 +1,36 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.config._positive_int`."""
+
+from __future__ import annotations
+
+import pytest
+
+from geovista.config import _positive_int
+
+NAME = "GEOVISTA_TEST_POSITIVE_INT"
+
+
+def test_default(monkeypatch):
+    """Test the default value of a missing environment variable."""
+    monkeypatch.delenv(NAME, raising=False)
+    assert _positive_int(NAME, 8) == 8
+
+
+def test_value(monkeypatch):
+    """Test the value of a valid environment variable."""
+    monkeypatch.setenv(NAME, "16")
+    assert _positive_int(NAME, 8) == 16
+
+
+@pytest.mark.parametrize("value", ["", "four", "1.5", "0", "-2"])
+def test_invalid(monkeypatch, value):
+    """Test the default value of an invalid environment variable, with a warning."""
+    monkeypatch.setenv(NAME, value)
+    wmsg = f"geovista ignoring invalid environment variable {NAME}"
+    with pytest.warns(UserWarning, match=wmsg):
+        result = _positive_int(NAME, 8)
+    assert result == 8
@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import numpy as np
+import pyproj
 import pytest
 
 from geovista.common import (
@@ -19,14 +20,19 @@ from geovista.common import (
 )
 from geovista.crs import WGS84, from_wkt
 from geovista.geodesic import (
+    BBOX_ENGINE,
     BBOX_OUTSIDE,
     BBOX_TOLERANCE,
     PANEL_IDX_BY_NAME,
     PREFERENCE,
     BBox,
+    EnclosedEngine,
     EnclosedPreference,
+    _npoints,
+    npoints,
     panel,
 )
+from geovista.pantry.meshes import regular_grid
 from geovista.transform import transform_points
 
 from .conftest import ANTARCTIC_CORNER_CIDS as CIDS
@@ -259,6 +265,104 @@ def test_serialization():
     assert str(bbox) == expected
 
 
+@pytest.mark.parametrize("outside", [False, True])
+@pytest.mark.parametrize("preference", EnclosedPreference.values())
+@pytest.mark.parametrize(
+    ("xs", "ys"),
+    [
+        pytest.param([-15, 20, 25, -15], [-25, -20, 15, 10], id="gulf"),
+        pytest.param([-15, -15, 25, 20], [10, -25, -20, 15], id="reversed"),
+        pytest.param([170, -170, -160, 160], [-10, -5, 40, 30], id="antimeridian"),
+    ],
+)
+def test_enclosed_engine(xs, ys, preference, outside):
+    """Test analytic engine agrees with the manifold engine."""
+    mesh = regular_grid(resolution="r100")
+    mesh.cell_data["cids"] = np.arange(mesh.n_cells)
+    bbox = BBox(xs, ys, c=16)
+    kwargs = {"preference": preference, "outside": outside}
+    result = bbox.enclosed(mesh, engine="analytic", **kwargs)
+    expected = bbox.enclosed(mesh, engine="manifold", **kwargs)
+    assert result.n_cells > 0
+    np.testing.assert_array_equal(result.cell_data["cids"], expected.cell_data["cids"])
+
+
+@pytest.mark.parametrize("name", ["arctic", "antarctic"])
+def test_enclosed_engine_polar(name):
+    """Test analytic engine agrees with the manifold engine for polar panels."""
+    mesh = regular_grid(resolution="r100")
+    mesh.cell_data["cids"] = np.arange(mesh.n_cells)
+    bbox = panel(name, c=64)
+    result = bbox.enclosed(mesh, engine="analytic")
+    expected = bbox.enclosed(mesh, engine="manifold")
+    np.testing.assert_array_equal(result.cell_data["cids"], expected.cell_data["cids"])
+
+
+def test_enclosed_engine_concave():
+    """Test analytic engine defers to the manifold for a concave bounding-box."""
+    mesh = regular_grid(resolution="r100")
+    bbox = BBox([-20, 0, 20, 0], [0, 20, 0, 30], c=16)
+    result = bbox.enclosed(mesh, engine="analytic")
+    assert bbox._sides == ()
+    expected = bbox.enclosed(mesh, engine="manifold")
+    assert result.n_cells == expected.n_cells
+
+
+def test_enclosed_cached(mocker):
+    """Test enclosed classification is reused by the cell and point preferences."""
+    mesh = regular_grid(resolution="r30")
+    mesh.cell_data["cids"] = np.arange(mesh.n_cells)
+    bbox = panel("africa", c=16)
+    spy = mocker.spy(bbox, "_classify")
+    expected = bbox.enclosed(mesh, preference="cell")
+    for preference, outside in [("point", False), ("cell", True), ("cell", False)]:
+        result = bbox.enclosed(mesh.copy(), preference=preference, outside=outside)
+    assert spy.call_count == 1
+    np.testing.assert_array_equal(result.cell_data["cids"], expected.cell_data["cids"])
+    _ = bbox.enclosed(mesh, preference="center")
+    assert spy.call_count == 2
+
+
+def test_mesh_cached():
+    """Test bounding-box mesh is reused for each surface radius."""
+    bbox = panel("asia", c=16)
+    expected = bbox.mesh
+    _ = bbox.boundary(radius=2.0)
+    assert bbox.mesh is not expected
+    _ = bbox.boundary()
+    assert bbox.mesh is expected
+
+
+def test_engine_default():
+    """Test engine property default."""
+    bbox = panel("africa")
+    assert bbox.engine == EnclosedEngine(BBOX_ENGINE)
+
+
+@pytest.mark.parametrize(
+    ("engine", "expected"),
+    [
+        (None, EnclosedEngine(BBOX_ENGINE)),
+        ("manifold", EnclosedEngine("manifold")),
+        (EnclosedEngine("analytic"), EnclosedEngine("analytic")),
+    ],
+)
+def test_engine(engine, expected):
+    """Test engine property getter/setter."""
+    bbox = panel("pacific")
+    bbox.engine = engine
+    assert bbox.engine == expected
+
+
+def test_engine_fail():
+    """Test engine property setter exception."""
+    bbox = panel("asia")
+    engine = "wibble"
+    emsg = f"Expected an engine of .*, got '{engine}'."
+    with pytest.raises(ValueError, match=emsg):
+        bbox.engine = engine
+
+
 def test_outside_default():
     """Test outside property default."""
     bbox = panel("africa")
@@ -321,3 +425,26 @@ def test_tolerance(tolerance, expected):
     bbox = panel("arctic")
     bbox.tolerance = tolerance
     assert bbox.tolerance == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("npts", [1, 17])
+def test__npoints(npts):
+    """Test batched geodesic sampling agrees with per-line sampling."""
+    geod = pyproj.Geod(ellps="WGS84")
+    start_lons, start_lats = np.array([0, -170, 45]), np.array([0, -60, 89])
+    end_lons, end_lats = np.array([10, 170, 45]), np.array([10, 60, -89])
+    lons, lats = _npoints(
+        start_lons, start_lats, end_lons, end_lats, npts=npts, geod=geod
+    )
+    assert lons.shape == lats.shape == (start_lons.size, npts)
+    for i in range(start_lons.size):
+        expected_lons, expected_lats = npoints(
+            start_lons[i],
+            start_lats[i],
+            end_lons[i],
+            end_lats[i],
+            npts=npts,
+            geod=geod,
+        )
+        np.testing.assert_allclose(lons[i], expected_lons, atol=1e-9)
+        np.testing.assert_allclose(lats[i], expected_lats, atol=1e-9)
@@ -0,0 +1,51 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :class:`geovista.geodesic.EnclosedEngine`."""
+
+from __future__ import annotations
+
+import pytest
+
+from geovista.geodesic import EnclosedEngine
+
+EXPECTED_VALUES: tuple[str, str] = ("analytic", "manifold")
+
+
+def test_member_count():
+    """Test expected number of enumeration members."""
+    assert len(EnclosedEngine) == 2
+
+
+def test_members():
+    """Test expected enumeration members."""
+    assert tuple(member.value for member in EnclosedEngine) == EXPECTED_VALUES
+
+
+def test_values():
+    """Test expected enumeration member values."""
+    assert EnclosedEngine.values() == EXPECTED_VALUES
+
+
+@pytest.mark.parametrize(
+    ("member", "expected"),
+    [
+        ("analytic", True),
+        ("Analytic", True),
+        ("ANALYTIC", True),
+        ("manifold", True),
+        ("MANIFOLD", True),
+        ("vtk", False),
+    ],
+)
+def test_valid_members(member, expected):
+    """Test valid enumeration members."""
+    assert EnclosedEngine.valid(member) is expected
+    if expected:
+        assert EnclosedEngine(member).value == member.lower()
+    else:
+        emsg = f"{member!r} is not a valid EnclosedEngine"
+        with pytest.raises(ValueError, match=emsg):
+            _ = EnclosedEngine(member)
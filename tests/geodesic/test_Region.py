@@ -0,0 +1,205 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :class:`geovista.geodesic.Region`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import shapely
+
+from geovista.common import (
+    GV_FIELD_CRS,
+    GV_FIELD_RADIUS,
+    RADIUS,
+    ZLEVEL_SCALE,
+    from_cartesian,
+    to_cartesian,
+)
+from geovista.crs import WGS84, from_wkt
+from geovista.geodesic import Region
+from geovista.geoplotter import GeoPlotter
+from geovista.pantry.meshes import regular_grid
+from geovista.search import _polygon_distance
+from geovista.transform import transform_points
+
+# the anti-clockwise star exterior and hole of the unit-tests
+ANGLES = np.linspace(0, 2 * np.pi, 41)[:-1]
+STAR = np.c_[
+    30 + (20 + 8 * np.sin(5 * ANGLES)) * np.cos(ANGLES),
+    10 + (16 + 6 * np.sin(5 * ANGLES)) * np.sin(ANGLES),
+]
+HOLE = np.c_[30 + 5 * np.cos(ANGLES), 10 + 5 * np.sin(ANGLES)]
+SQUARE = np.array([[170, -10], [-170, -10], [-170, 10], [170, 10]])
+
+
+@pytest.fixture
+def points():
+    """Fixture providing uniformly distributed random lon/lat points."""
+    rng = np.random.default_rng(0)
+    n_points = 20000
+    lons = rng.uniform(-180, 180, size=n_points)
+    lats = np.rad2deg(np.arcsin(rng.uniform(-1, 1, size=n_points)))
+    return lons, lats
+
+
+def inside(lons, lats, ring):
+    """Determine the points within the spherical polygon ring."""
+    xyz = to_cartesian(lons, lats, radius=1.0)
+    vertices = to_cartesian(ring[:, 0], ring[:, 1], radius=1.0)
+    center = vertices.mean(axis=0)
+    center /= np.linalg.norm(center)
+    return _polygon_distance(xyz, vertices, center) == 0
+
+
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        shapely.Polygon(STAR, [HOLE]),
+        shapely.geometry.mapping(shapely.Polygon(STAR, [HOLE])),
+        shapely.to_wkb(shapely.Polygon(STAR, [HOLE])),
+        shapely.to_wkt(shapely.Polygon(STAR, [HOLE]), rounding_precision=-1),
+    ],
+    ids=["shapely", "mapping", "wkb", "wkt"],
+)
+def test_geometry(geometry):
+    """Test region creation from the supported geometry types."""
+    region = Region(geometry)
+    assert region.n_parts == 1
+    assert region.n_rings == 2
+    assert region.lons.size == region.lats.size == 2 * ANGLES.size
+    np.testing.assert_array_equal(region.holes, [False, True])
+
+
+def test_geometry_fail():
+    """Test trap of a region geometry that is not polygonal."""
+    emsg = "Expected a 'Polygon' or 'MultiPolygon' region geometry, got 'LineString'"
+    with pytest.raises(TypeError, match=emsg):
+        _ = Region(shapely.LineString(STAR))
+
+
+def test_empty_fail():
+    """Test trap of an empty region geometry."""
+    emsg = "Expected a non-empty region geometry"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Region(shapely.Polygon())
+
+
+@pytest.mark.parametrize("clockwise", [False, True])
+def test_contains(points, clockwise):
+    """Test point containment of a polygon with a hole, regardless of orientation."""
+    lons, lats = points
+    star, hole = (STAR[::-1], HOLE[::-1]) if clockwise else (STAR, HOLE)
+    region = Region(shapely.Polygon(star, [hole]))
+    expected = inside(lons, lats, STAR) & ~inside(lons, lats, HOLE)
+    assert np.count_nonzero(expected)
+    np.testing.assert_array_equal(region.contains(lons, lats), expected)
+
+
+def test_contains_multi(points):
+    """Test point containment of a multi-part polygon over the anti-meridian."""
+    lons, lats = points
+    geometry = shapely.MultiPolygon(
+        [shapely.Polygon(STAR, [HOLE]), shapely.Polygon(SQUARE)]
+    )
+    region = Region(geometry)
+    assert region.n_parts == 2
+    expected = inside(lons, lats, STAR) & ~inside(lons, lats, HOLE)
+    expected |= inside(lons, lats, SQUARE)
+    np.testing.assert_array_equal(region.contains(lons, lats), expected)
+
+
+@pytest.mark.parametrize("lat", [-60, 60])
+def test_contains_pole(points, lat):
+    """Test point containment of a polar region that winds around the pole."""
+    lons, lats = points
+    ring = np.linspace(-180, 180, 73)
+    pole = np.sign(lat) * 90
+    shell = np.r_[np.c_[ring, np.full(ring.size, lat)], [[180, pole], [-180, pole]]]
+    region = Region(shapely.Polygon(shell))
+    expected = np.sign(lat) * lats > np.abs(lat)
+    # ignore the great-circle arcs bulging poleward of the parallel
+    mask = np.abs(lats - lat) > 0.1
+    np.testing.assert_array_equal(region.contains(lons, lats)[mask], expected[mask])
+    assert region.contains([0], [pole * 0.999])[0]
+    assert not region.contains([0], [-pole * 0.999])[0]
+
+
+def test_crs(points):
+    """Test region geometry coordinates in a projected CRS."""
+    lons, lats = points
+    crs = "+proj=eqc"
+    xy = transform_points(src_crs=WGS84, tgt_crs=crs, xs=STAR[:, 0], ys=STAR[:, 1])
+    region = Region(shapely.Polygon(xy[:, :2]), crs=crs)
+    np.testing.assert_allclose(region.lons, STAR[:, 0])
+    np.testing.assert_allclose(region.lats, STAR[:, 1], atol=1e-9)
+    expected = inside(lons, lats, STAR)
+    np.testing.assert_array_equal(region.contains(lons, lats), expected)
+
+
+@pytest.mark.parametrize("outside", [False, True])
+@pytest.mark.parametrize("preference", ["center", "point", "cell"])
+def test_enclosed(preference, outside):
+    """Test enclosed cells of a polygon with a hole."""
+    mesh = regular_grid(resolution="r100")
+    mesh.cell_data["cids"] = np.arange(mesh.n_cells)
+    region = Region(shapely.Polygon(STAR, [HOLE]))
+    result = region.enclosed(mesh, preference=preference, outside=outside)
+    if preference == "center":
+        lonlat = from_cartesian(mesh.cell_centers())
+        mask = region.contains(lonlat[:, 0], lonlat[:, 1]) ^ outside
+    else:
+        lonlat = from_cartesian(mesh)
+        points = region.contains(lonlat[:, 0], lonlat[:, 1]) ^ outside
+        cells = points[mesh.regular_faces]
+        mask = cells.any(axis=1) if preference == "point" else cells.all(axis=1)
+    np.testing.assert_array_equal(result.cell_data["cids"], np.flatnonzero(mask))
+
+
+def test_enclosed_cached(mocker):
+    """Test enclosed classification is reused by the cell and point preferences."""
+    mesh = regular_grid(resolution="r30")
+    region = Region(shapely.Polygon(STAR, [HOLE]))
+    spy = mocker.spy(region, "_contains")
+    _ = region.enclosed(mesh, preference="cell")
+    _ = region.enclosed(mesh.copy(), preference="point", outside=True)
+    assert spy.call_count == 1
+
+
+def test_boundary():
+    """Test boundary polyline of each ring."""
+    geometry = shapely.MultiPolygon(
+        [shapely.Polygon(STAR, [HOLE]), shapely.Polygon(SQUARE)]
+    )
+    region = Region(geometry)
+    result = region.boundary()
+    assert result.n_cells == result.n_lines == region.n_rings
+    assert GV_FIELD_CRS in result.field_data
+    assert from_wkt(result) == WGS84
+    expected = RADIUS + RADIUS * ZLEVEL_SCALE
+    assert np.isclose(result.field_data[GV_FIELD_RADIUS], expected)
+    np.testing.assert_allclose(np.linalg.norm(result.points, axis=1), expected)
+    # each ring is closed
+    for idx in range(result.n_cells):
+        ids = result.get_cell(idx).point_ids
+        assert ids[0] == ids[-1]
+
+
+def test_manifold():
+    """Test region as the manifold of a plotter."""
+    region = Region(shapely.Polygon(STAR, [HOLE]))
+    p = GeoPlotter(manifold=region)
+    mesh = regular_grid(resolution="r30")
+    actor = p.add_mesh(mesh)
+    assert p.manifold is region
+    assert 0 < actor.mapper.dataset.n_cells < mesh.n_cells
+
+
+def test_repr():
+    """Test region representation."""
+    region = Region(shapely.Polygon(STAR, [HOLE]))
+    expected = f"geovista.Region<crs={WGS84}, n_parts=1, n_rings=2, n_vertices=80>"
+    assert repr(region) == expected
@@ -0,0 +1,123 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.geodesic.lines`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pyproj
+import pytest
+
+from geovista.common import (
+    GV_FIELD_CRS,
+    GV_FIELD_RADIUS,
+    RADIUS,
+    ZLEVEL_SCALE,
+    distance,
+    from_cartesian,
+)
+from geovista.crs import WGS84, from_wkt
+from geovista.geodesic import GEODESIC_NPTS, line, lines
+
+# the ragged tracks of the unit-tests
+LONS = [0, 10, 20, -170, 170, 45, 50, 55, 60]
+LATS = [0, 5, 0, 60, 60, -30, -35, -40, -45]
+OFFSETS = [0, 3, 5, 9]
+
+
+@pytest.fixture
+def tracks():
+    """Fixture providing random ragged tracks."""
+    rng = np.random.default_rng(0)
+    offsets = np.concatenate([[0], np.cumsum(rng.integers(2, 6, size=20))])
+    lons = rng.uniform(-180, 180, size=offsets[-1])
+    lats = rng.uniform(-80, 80, size=offsets[-1])
+    return lons, lats, offsets
+
+
+def test_lons_lats__size_unequal_fail():
+    """Test trap of lons and lats containing different number of points each."""
+    emsg = "Require the same number"
+    with pytest.raises(ValueError, match=emsg):
+        _ = lines(range(10), range(20), [0, 10])
+
+
+@pytest.mark.parametrize("offsets", [[0], [1, 9], [0, 8], [0, 3, 10]])
+def test_offsets_fail(offsets):
+    """Test trap of offsets not spanning the lons and lats."""
+    emsg = "Require track offsets starting at 0"
+    with pytest.raises(ValueError, match=emsg):
+        _ = lines(LONS, LATS, offsets)
+
+
+def test_track_minimal_fail():
+    """Test trap of a track not containing enough points."""
+    emsg = "Require each track to contain at least 2"
+    with pytest.raises(ValueError, match=emsg):
+        _ = lines(LONS, LATS, [0, 3, 4, 9])
+
+
+@pytest.mark.parametrize("npts", [None, 2, 16])
+def test_npts(npts):
+    """Test tracks of segments at increasing resolution."""
+    result = lines(LONS, LATS, OFFSETS, npts=npts)
+    if npts is None:
+        npts = GEODESIC_NPTS
+    n_segments = len(LONS) - len(OFFSETS) + 1
+    assert result.n_cells == result.n_lines == len(OFFSETS) - 1
+    assert result.n_points == n_segments * npts + len(OFFSETS) - 1
+
+
+@pytest.mark.parametrize("close", [False, True])
+def test_line(tracks, close):
+    """Test each track is equivalent to the geodesic line of its points."""
+    lons, lats, offsets = tracks
+    result = lines(lons, lats, offsets, npts=8, close=close)
+    for idx in range(offsets.size - 1):
+        track = slice(offsets[idx], offsets[idx + 1])
+        expected = line(lons[track], lats[track], npts=8).points
+        if close:
+            expected = np.vstack([expected, expected[:1]])
+        actual = result.points[result.get_cell(idx).point_ids]
+        np.testing.assert_allclose(actual, expected, atol=1e-9)
+
+
+def test_spacing(tracks):
+    """Test adaptive densification of segments by their geodesic length."""
+    lons, lats, offsets = tracks
+    spacing = 250e3
+    result = lines(lons, lats, offsets, spacing=spacing)
+    geod = pyproj.Geod(ellps="WGS84")
+    points = from_cartesian(result)
+    for idx in range(offsets.size - 1):
+        lonlat = points[result.get_cell(idx).point_ids]
+        _, _, distances = geod.inv(
+            lonlat[:-1, 0], lonlat[:-1, 1], lonlat[1:, 0], lonlat[1:, 1]
+        )
+        assert np.all(distances <= spacing * (1 + 1e-6))
+        # the original points are retained
+        track = slice(offsets[idx], offsets[idx + 1])
+        expected = [lons[track][-1], lats[track][-1]]
+        np.testing.assert_allclose(lonlat[-1, :2], expected, atol=1e-6)
+
+
+@pytest.mark.parametrize("zlevel", range(-2, 3))
+def test_zlevel(zlevel):
+    """Test lines z-control with zlevel."""
+    result = lines(LONS, LATS, OFFSETS, zlevel=zlevel)
+    actual = distance(result)
+    expected = RADIUS + RADIUS * zlevel * ZLEVEL_SCALE
+    assert np.isclose(actual, expected)
+
+
+def test_field_data():
+    """Test expected metadata populated within field-data."""
+    result = lines(LONS, LATS, OFFSETS)
+    assert GV_FIELD_CRS in result.field_data
+    assert GV_FIELD_RADIUS in result.field_data
+    assert from_wkt(result) == WGS84
+    expected = RADIUS + RADIUS * ZLEVEL_SCALE
+    assert np.isclose(result.field_data[GV_FIELD_RADIUS], expected)
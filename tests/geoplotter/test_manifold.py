@@ -11,6 +11,7 @@ import pytest
 
 from geovista.geodesic import panel
 from geovista.geoplotter import GeoPlotter
+from geovista.pantry.meshes import regular_grid
 
 
 def test_no_manifold():
@@ -44,3 +45,13 @@ def test_manifold():
     assert p.manifold is None
     p.manifold = bbox
     assert p.manifold is bbox
+
+
+def test_manifold_cached():
+    """Test manifold classification is reused for meshes with the same geometry."""
+    bbox = panel("africa", c=16)
+    p = GeoPlotter(manifold=bbox)
+    mesh = regular_grid(resolution="r30")
+    p.add_mesh(mesh)
+    p.add_mesh(mesh.copy())
+    assert len(bbox._classified) == 1
@@ -0,0 +1,104 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :meth:`geovista.geoplotter.GeoPlotter.pick_points`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from geovista.common import from_cartesian
+from geovista.crs import WGS84
+from geovista.geoplotter import GeoPlotter
+from geovista.pantry.meshes import regular_grid
+from geovista.transform import transform_points
+
+CRS = "+proj=robin +lon_0=30"
+
+
+@pytest.fixture
+def mesh():
+    """Fixture providing a regular grid with point and cell data."""
+    result = regular_grid(resolution="r30")
+    result.cell_data["cells"] = np.arange(result.n_cells, dtype=float)
+    result.point_data["points"] = np.full(result.n_points, 7.0)
+    result.set_active_scalars("cells", preference="cell")
+    return result
+
+
+@pytest.fixture
+def centers(mesh):
+    """Fixture providing the cell-ids and lon/lat cell centers away from the seam."""
+    lonlat = from_cartesian(mesh.cell_centers())
+    mask = (np.abs(lonlat[:, 1]) < 60) & (np.abs(lonlat[:, 0] + 150) > 10)
+    return np.flatnonzero(mask), lonlat[mask]
+
+
+def test_geographic_fail(mesh):
+    """Test trap of picking on a geographic plotter."""
+    p = GeoPlotter()
+    actor = p.add_mesh(mesh)
+    emsg = "Cannot pick points, requires a projected plotter"
+    with pytest.raises(ValueError, match=emsg):
+        _ = p.pick_points(actor, [0], [0])
+
+
+def test_shape_fail(mesh):
+    """Test trap of mismatched spatial points."""
+    p = GeoPlotter(crs=CRS)
+    actor = p.add_mesh(mesh)
+    emsg = "Cannot pick points, require 'xs' and 'ys' to have the same shape"
+    with pytest.raises(ValueError, match=emsg):
+        _ = p.pick_points(actor, [0, 1], [0])
+
+
+def test_cell_data(mesh, centers):
+    """Test picking the original cell-ids and cell data at projected points."""
+    cids, lonlat = centers
+    p = GeoPlotter(crs=CRS)
+    actor = p.add_mesh(mesh)
+    xy = transform_points(WGS84, CRS, lonlat[:, 0], lonlat[:, 1])
+    result = p.pick_points(actor, xy[:, 0], xy[:, 1])
+    np.testing.assert_array_equal(result.cell_ids, cids)
+    np.testing.assert_array_equal(result.values, cids)
+    np.testing.assert_allclose(result.lons, lonlat[:, 0], atol=1e-6)
+    np.testing.assert_allclose(result.lats, lonlat[:, 1], atol=1e-6)
+
+
+def test_point_data(mesh, centers):
+    """Test picking interpolated point data at projected points."""
+    _, lonlat = centers
+    p = GeoPlotter(crs=CRS)
+    actor = p.add_mesh(mesh)
+    xy = transform_points(WGS84, CRS, lonlat[:, 0], lonlat[:, 1])
+    result = p.pick_points(actor, xy[:, 0], xy[:, 1], scalars="points")
+    np.testing.assert_allclose(result.values, 7.0)
+
+
+def test_outside(mesh):
+    """Test spatial points outside of the mesh and projection."""
+    p = GeoPlotter(crs=CRS)
+    actor = p.add_mesh(mesh)
+    result = p.pick_points(actor, [1e9, 0], [1e9, 0])
+    assert result.cell_ids[0] == -1
+    assert result.cell_ids[1] >= 0
+    assert np.isnan(result.values[0])
+    assert np.isnan(result.lons[0])
+    assert np.isnan(result.lats[0])
+
+
+def test_locator_cached(mesh, centers):
+    """Test the mesh cell locator is reused by subsequent picks."""
+    _, lonlat = centers
+    p = GeoPlotter(crs=CRS)
+    actor = p.add_mesh(mesh)
+    xy = transform_points(WGS84, CRS, lonlat[:, 0], lonlat[:, 1])
+    expected = p.pick_points(actor, xy[:, 0], xy[:, 1])
+    ((_, _, locator),) = p._pick_locators.values()
+    result = p.pick_points(actor, xy[:, 0], xy[:, 1])
+    ((_, _, other),) = p._pick_locators.values()
+    assert other is locator
+    np.testing.assert_array_equal(result.cell_ids, expected.cell_ids)
@@ -0,0 +1,254 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :class:`geovista.regrid.Regridder`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from geovista.common import from_cartesian
+from geovista.config import resources
+from geovista.crs import WGS84
+from geovista.pantry.meshes import regular_grid
+from geovista.regrid import (
+    REGRID_CACHE_DIR,
+    REGRID_K,
+    REGRID_SCHEME,
+    Regridder,
+    RegridScheme,
+    _spherical_area,
+)
+from geovista.search import _cartesian, _polygons
+from geovista.transform import transform_mesh
+
+SCHEMES = RegridScheme.values()
+
+
+@pytest.fixture
+def src():
+    """Fixture providing a coarse source mesh."""
+    return regular_grid(resolution="r30")
+
+
+@pytest.fixture
+def tgt():
+    """Fixture providing a fine target mesh."""
+    return regular_grid(resolution="r45")
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    """Fixture providing an isolated geovista cache directory."""
+    monkeypatch.setitem(resources, "cache_dir", tmp_path)
+    return tmp_path / REGRID_CACHE_DIR
+
+
+def cell_areas(mesh):
+    """Calculate the spherical area of each cell of the mesh."""
+    points = _cartesian(mesh, WGS84, "point")
+    points /= np.linalg.norm(points, axis=1, keepdims=True)
+    centers = _cartesian(mesh, WGS84, "center")
+    centers /= np.linalg.norm(centers, axis=1, keepdims=True)
+    vertices, _, _ = _polygons(mesh, points, centers)
+    return _spherical_area(points[vertices])
+
+
+def test_defaults(src, tgt):
+    """Test expected defaults are honoured for a regridder."""
+    regridder = Regridder(src, tgt)
+    assert regridder.scheme == REGRID_SCHEME
+    assert regridder.n_src == src.n_points
+    assert regridder.n_tgt == tgt.n_points
+
+
+def test_serialization(src, tgt):
+    """Test string and representation serialization."""
+    regridder = Regridder(src, tgt, scheme="area")
+    expected = (
+        f"Regridder(N SOURCE: {src.n_cells}, N TARGET: {tgt.n_cells}, scheme='area')"
+    )
+    assert repr(regridder) == expected
+    assert str(regridder) == expected
+
+
+@pytest.mark.parametrize("scheme", SCHEMES)
+def test_identity(src, scheme):
+    """Test regridding onto the same mesh preserves the data."""
+    regridder = Regridder(
+        src, src, scheme=scheme, src_preference="center", tgt_preference="center"
+    )
+    data = np.arange(src.n_cells, dtype=float)
+    np.testing.assert_allclose(regridder.regrid(data), data)
+
+
+@pytest.mark.parametrize("scheme", SCHEMES)
+def test_weights(src, tgt, scheme):
+    """Test the weights of each target are normalised."""
+    regridder = Regridder(
+        src, tgt, scheme=scheme, src_preference="center", tgt_preference="center"
+    )
+    offsets, indices, weights = regridder.weights
+    assert offsets.shape == (tgt.n_cells + 1,)
+    assert indices.shape == weights.shape == (offsets[-1],)
+    assert np.all(weights > 0)
+    rows = np.repeat(np.arange(tgt.n_cells), np.diff(offsets))
+    np.testing.assert_allclose(np.bincount(rows, weights=weights), 1)
+
+
+def test_nearest(src, tgt):
+    """Test the nearest scheme regrids the nearest source cell center."""
+    regridder = Regridder(
+        src, tgt, scheme="nearest", src_preference="center", tgt_preference="center"
+    )
+    expected = [
+        np.argmin(np.linalg.norm(src.cell_centers().points - xyz, axis=1))
+        for xyz in tgt.cell_centers().points
+    ]
+    result = regridder.regrid(np.arange(src.n_cells))
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_idw(src, tgt):
+    """Test the inverse-distance scheme neighbours."""
+    regridder = Regridder(src, tgt, scheme="idw")
+    offsets, _, weights = regridder.weights
+    np.testing.assert_array_equal(np.diff(offsets), REGRID_K)
+    assert weights.max() <= 1
+    coincident = Regridder(
+        src,
+        src,
+        scheme="idw",
+        src_preference="center",
+        tgt_preference="center",
+        k=3,
+        power=1,
+    )
+    np.testing.assert_array_equal(np.diff(coincident.weights.offsets), 3)
+    data = np.arange(src.n_cells, dtype=float)
+    np.testing.assert_allclose(coincident.regrid(data), data)
+
+
+@pytest.mark.parametrize(("source", "target"), [("r30", "r45"), ("r45", "r10")])
+def test_area_conservative(source, target):
+    """Test the area scheme conserves the area integral of the data."""
+    src = regular_grid(resolution=source)
+    tgt = regular_grid(resolution=target)
+    data = np.random.default_rng(0).random(src.n_cells)
+    result = Regridder(src, tgt, scheme="area").regrid(data)
+    expected = np.sum(data * cell_areas(src))
+    np.testing.assert_allclose(np.sum(result * cell_areas(tgt)), expected)
+
+
+def test_area_partial(tgt):
+    """Test the targets not overlapping a regional source mesh."""
+    src = regular_grid(resolution="r30")
+    src = src.remove_cells(np.arange(src.n_cells // 2))
+    result = Regridder(src, tgt, scheme="area").regrid(np.ones(src.n_cells))
+    covered = ~np.isnan(result)
+    assert 0 < np.sum(covered) < tgt.n_cells
+    np.testing.assert_allclose(result[covered], 1)
+
+
+def test_crs(src, tgt):
+    """Test regridding onto a projected target mesh."""
+    lonlat = from_cartesian(tgt.cell_centers())
+    tgt = tgt.remove_cells(np.flatnonzero(np.abs(lonlat[:, 0]) > 150))
+    data = np.random.default_rng(0).random(src.n_cells)
+    expected = Regridder(src, tgt, scheme="area").regrid(data)
+    mesh = transform_mesh(tgt, "+proj=eqc")
+    result = Regridder(src, mesh, scheme="area").regrid(data)
+    np.testing.assert_allclose(result, expected)
+
+
+def test_stack(src, tgt, monkeypatch):
+    """Test regridding a stack of data in batches."""
+    monkeypatch.setattr("geovista.regrid._REGRID_BATCH_SIZE", 1)
+    regridder = Regridder(src, tgt, scheme="idw")
+    data = np.random.default_rng(0).random((3, src.n_points))
+    result = regridder.regrid(data)
+    assert result.shape == (3, tgt.n_points)
+
+    for expected, values in zip(result, data, strict=True):
+        np.testing.assert_array_equal(regridder.regrid(values), expected)
+
+
+def test_nan(src, tgt):
+    """Test missing source data is excluded from the targets."""
+    regridder = Regridder(src, tgt, scheme="idw")
+    data = np.ones(src.n_points)
+    data[::2] = np.nan
+    result = regridder.regrid(data)
+    offsets, indices, _ = regridder.weights
+    rows = np.repeat(np.arange(tgt.n_points), np.diff(offsets))
+    missing = np.bincount(rows, weights=~np.isnan(data[indices])) == 0
+    assert np.all(np.isnan(result[missing]))
+    np.testing.assert_allclose(result[~missing], 1)
+
+
+@pytest.mark.usefixtures("cache_dir")
+@pytest.mark.parametrize("scheme", SCHEMES)
+def test_persist(src, tgt, scheme, cache_dir):
+    """Test persisted regrid weights are reloaded."""
+    expected = Regridder(src, tgt, scheme=scheme).weights
+    _ = Regridder(src, tgt, scheme=scheme, persist=True)
+    assert len(list(cache_dir.glob("*.npz"))) == 1
+    result = Regridder(src, tgt, scheme=scheme, persist=True).weights
+
+    for actual, desired in zip(result, expected, strict=True):
+        np.testing.assert_array_equal(actual, desired)
+
+
+def test_persist_key(src, tgt, cache_dir):
+    """Test persisted regrid weights are keyed on the regrid options."""
+    _ = Regridder(src, tgt, scheme="idw", persist=True)
+    _ = Regridder(src, tgt, scheme="idw", k=2, persist=True)
+    _ = Regridder(tgt, src, scheme="idw", persist=True)
+    assert len(list(cache_dir.glob("*.npz"))) == 3
+
+
+def test_persist_corrupt(src, tgt, cache_dir):
+    """Test corrupt persisted regrid weights are purged and rebuilt."""
+    expected = Regridder(src, tgt, persist=True).weights
+    (fname,) = cache_dir.glob("*.npz")
+    fname.write_bytes(b"corrupt")
+    result = Regridder(src, tgt, persist=True).weights
+    np.testing.assert_array_equal(result.indices, expected.indices)
+    assert fname.exists()
+
+
+def test_scheme_fail(src, tgt):
+    """Test trap of invalid regrid scheme."""
+    emsg = "Expected a regrid scheme of"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Regridder(src, tgt, scheme="invalid")
+
+
+def test_preference_fail(src, tgt):
+    """Test trap of invalid preferences."""
+    emsg = "Expected a preference of"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Regridder(src, tgt, src_preference="invalid")
+    emsg = "Expected a 'center' preference for the 'area' regrid scheme"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Regridder(src, tgt, scheme="area", tgt_preference="point")
+
+
+def test_k_fail(src, tgt):
+    """Test trap of invalid number of inverse-distance neighbours."""
+    emsg = "Expected a positive number of neighbours"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Regridder(src, tgt, scheme="idw", k=0)
+
+
+def test_shape_fail(src, tgt):
+    """Test trap of source data with the wrong shape."""
+    regridder = Regridder(src, tgt)
+    emsg = (
+        rf"Expected source data of shape \({src.n_points},\) or \(T, {src.n_points}\)"
+    )
+    with pytest.raises(ValueError, match=emsg):
+        _ = regridder.regrid(np.ones(src.n_cells))
@@ -0,0 +1,117 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :class:`geovista.search.CellAdjacency`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import pyvista as pv
+
+from geovista.search import CellAdjacency
+
+
+@pytest.fixture
+def plane():
+    """Fixture providing a 5x5 quad mesh with row-major cell-ids."""
+    return pv.Plane(i_resolution=5, j_resolution=5)
+
+
+def test_serialization(lam_uk):
+    """Test string and representation serialization."""
+    adjacency = CellAdjacency(lam_uk)
+    expected = f"CellAdjacency(N CELLS: {lam_uk.n_cells}, N POINTS: {lam_uk.n_points})"
+    assert repr(adjacency) == expected
+    assert str(adjacency) == expected
+    assert adjacency.n_cells == lam_uk.n_cells
+    assert adjacency.n_points == lam_uk.n_points
+
+
+def test_cell_points(lam_uk, center):
+    """Test the points of a cell."""
+    adjacency = CellAdjacency(lam_uk)
+    np.testing.assert_array_equal(adjacency.cell_points(center.cid), center.pids)
+
+
+def test_point_cells(lam_uk, vertex):
+    """Test the cells sharing a point."""
+    adjacency = CellAdjacency(lam_uk)
+    np.testing.assert_array_equal(adjacency.point_cells(vertex.pid), vertex.cids)
+
+
+@pytest.mark.parametrize("build", [False, True])
+def test_neighbours(lam_uk, neighbours, build):
+    """Test the vertex neighbours of a cell, with and without the built index."""
+    adjacency = CellAdjacency(lam_uk)
+    if build:
+        _ = adjacency.adjacency()
+    result = adjacency.neighbours(neighbours.cid)
+    np.testing.assert_array_equal(result, neighbours.expected)
+
+
+def test_adjacency(lam_uk):
+    """Test the CSR cell-to-cell adjacency matches the neighbours of each cell."""
+    adjacency = CellAdjacency(lam_uk)
+    offsets, indices = adjacency.adjacency()
+    assert offsets.shape == (lam_uk.n_cells + 1,)
+    assert offsets[-1] == indices.size
+    for cid in range(0, lam_uk.n_cells, lam_uk.n_cells // 20):
+        expected = adjacency.point_cells(adjacency.cell_points(cid))
+        expected = expected[expected != cid]
+        np.testing.assert_array_equal(
+            indices[offsets[cid] : offsets[cid + 1]], expected
+        )
+
+
+def test_batch(plane):
+    """Test the neighbours of several cells excludes the cells."""
+    adjacency = CellAdjacency(plane)
+    result = adjacency.neighbours([6, 7])
+    np.testing.assert_array_equal(result, [0, 1, 2, 3, 5, 8, 10, 11, 12, 13])
+
+
+@pytest.mark.parametrize(
+    ("edge", "expected"),
+    [(False, [6, 7, 8, 11, 13, 16, 17, 18]), (True, [7, 11, 13, 17])],
+)
+def test_edge(plane, edge, expected):
+    """Test the vertex and edge neighbours of a cell."""
+    adjacency = CellAdjacency(plane)
+    np.testing.assert_array_equal(adjacency.neighbours(12, edge=edge), expected)
+    offsets, indices = adjacency.adjacency(edge=edge)
+    np.testing.assert_array_equal(indices[offsets[12] : offsets[13]], expected)
+
+
+@pytest.mark.parametrize(
+    ("rings", "edge", "expected"),
+    [
+        (2, False, np.setdiff1d(np.arange(25), 12)),
+        (2, True, [2, 6, 7, 8, 10, 11, 13, 14, 16, 17, 18, 22]),
+        (3, True, np.setdiff1d(np.arange(25), [0, 4, 12, 20, 24])),
+    ],
+)
+def test_rings(plane, rings, edge, expected):
+    """Test k-ring neighbourhoods of a cell."""
+    adjacency = CellAdjacency(plane)
+    result = adjacency.neighbours(12, rings=rings, edge=edge)
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_lines():
+    """Test consecutive line segments share a vertex but not an edge."""
+    mesh = pv.MultipleLines(points=np.arange(15.0).reshape(-1, 3)).extract_all_edges()
+    adjacency = CellAdjacency(mesh)
+    _, indices = adjacency.adjacency(edge=True)
+    assert indices.size == 0
+    np.testing.assert_array_equal(adjacency.neighbours(1), [0, 2])
+
+
+def test_mixed(plane):
+    """Test the cell-ids of polygons preceded by vertex cells."""
+    mesh = pv.PolyData(plane.points, faces=plane.faces, verts=[1, 0, 1, 5])
+    adjacency = CellAdjacency(mesh)
+    np.testing.assert_array_equal(adjacency.neighbours(14, edge=True), [9, 13, 15, 19])
+    np.testing.assert_array_equal(adjacency.neighbours(0), [2])
@@ -0,0 +1,144 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :class:`geovista.search.CellIndex`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from geovista.common import from_cartesian
+from geovista.pantry.meshes import regular_grid
+from geovista.search import EARTH_RADIUS, CellIndex
+from geovista.transform import transform_mesh
+
+
+@pytest.fixture
+def mesh():
+    """Fixture providing a global regular grid."""
+    return regular_grid(resolution="r100")
+
+
+@pytest.fixture
+def lonlat(mesh):
+    """Fixture providing the lon/lat vertices of each cell of the mesh."""
+    return from_cartesian(mesh)[mesh.regular_faces][..., :2]
+
+
+def great_circle(lon, lat, lonlat):
+    """Calculate the great-circle angle (radians) from the point to each lon/lat."""
+    lon, lat = np.radians(lon), np.radians(lat)
+    lons, lats = np.radians(lonlat[..., 0]), np.radians(lonlat[..., 1])
+    cos = np.sin(lat) * np.sin(lats) + np.cos(lat) * np.cos(lats) * np.cos(lons - lon)
+    return np.arccos(np.clip(cos, -1, 1))
+
+
+def test_serialization(mesh):
+    """Test string and representation serialization."""
+    index = CellIndex(mesh, resolution=4)
+    expected = f"CellIndex(N CELLS: {mesh.n_cells}, resolution=4)"
+    assert repr(index) == expected
+    assert str(index) == expected
+
+
+def test_resolution(mesh):
+    """Test the default resolution of the buckets."""
+    index = CellIndex(mesh)
+    assert index.n_cells == mesh.n_cells
+    assert 6 * index.resolution**2 * 16 >= mesh.n_cells
+
+
+@pytest.mark.parametrize("resolution", [None, 1, 32])
+@pytest.mark.parametrize(
+    ("lon", "lat", "distance"),
+    [(0, 0, 500), (-179, 10, 1500), (45, 89, 800), (120, -60, 0)],
+)
+def test_query_cap(mesh, lonlat, resolution, lon, lat, distance):
+    """Test the candidate cells include each cell with a vertex in the cap."""
+    index = CellIndex(mesh, resolution=resolution)
+    result = index.query_cap(lon, lat, distance)
+    near = great_circle(lon, lat, lonlat) <= distance / EARTH_RADIUS
+    expected = np.flatnonzero(np.any(near, axis=1))
+    assert np.all(np.isin(expected, result))
+    assert np.all(np.diff(result) > 0)
+    # the candidate bounding caps are near the spherical cap
+    centers = from_cartesian(mesh.cell_centers())
+    angle = great_circle(lon, lat, centers[result])
+    assert np.all(angle <= distance / EARTH_RADIUS + np.radians(3))
+
+
+def test_query_cap_units(mesh):
+    """Test the spherical cap radius units."""
+    index = CellIndex(mesh)
+    expected = index.query_cap(10, 20, 1000)
+    result = index.query_cap(10, 20, 1000 / EARTH_RADIUS, units="rad")
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    ("west", "east", "south", "north"),
+    [(-10, 10, 40, 60), (170, -170, -20, 20), (0, 360, 80, 90), (-60, -50, -90, -85)],
+)
+def test_query_box(mesh, lonlat, west, east, south, north):
+    """Test the candidate cells include each cell with a vertex in the box."""
+    index = CellIndex(mesh)
+    result = index.query_box(west, east, south, north)
+    span = 360 if east - west >= 360 else (east - west) % 360
+    inside = ((lonlat[..., 0] - west) % 360 <= span) & (
+        (lonlat[..., 1] >= south) & (lonlat[..., 1] <= north)
+    )
+    expected = np.flatnonzero(np.any(inside, axis=1))
+    assert expected.size
+    assert np.all(np.isin(expected, result))
+    assert result.size < mesh.n_cells
+
+
+def test_query_polygon(mesh):
+    """Test the candidate cells of a spherical polygon."""
+    index = CellIndex(mesh)
+    result = index.query_polygon([-10, 10, 10, -10], [40, 40, 60, 60])
+    # the great-circle edges bulge poleward of the box parallels
+    assert np.all(np.isin(index.query_box(-9, 9, 41, 59), result))
+    assert np.all(np.isin(result, index.query_box(-15, 15, 35, 65)))
+
+
+def test_crs(mesh):
+    """Test the candidate cells of a projected mesh."""
+    lonlat = from_cartesian(mesh.cell_centers())
+    mesh = mesh.remove_cells(np.flatnonzero(np.abs(lonlat[:, 0]) > 150))
+    expected = CellIndex(mesh).query_cap(0, 0, 1000)
+    result = CellIndex(transform_mesh(mesh, "+proj=eqc")).query_cap(0, 0, 1000)
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_query_box_fail(mesh):
+    """Test trap of invalid bounding-box latitudes."""
+    index = CellIndex(mesh)
+    emsg = "Expected a southern latitude no greater than the northern latitude"
+    with pytest.raises(ValueError, match=emsg):
+        _ = index.query_box(0, 10, 20, 10)
+
+
+def test_query_cap_fail(mesh):
+    """Test trap of invalid spherical cap radius."""
+    index = CellIndex(mesh)
+    emsg = "Expected a non-negative distance"
+    with pytest.raises(ValueError, match=emsg):
+        _ = index.query_cap(0, 0, -1)
+    emsg = "Expected distance units of"
+    with pytest.raises(ValueError, match=emsg):
+        _ = index.query_cap(0, 0, 1, units="invalid")
+
+
+def test_query_polygon_fail(mesh):
+    """Test trap of invalid spherical polygons."""
+    index = CellIndex(mesh)
+    emsg = "Expected the same number of at least 3 polygon longitudes"
+    with pytest.raises(ValueError, match=emsg):
+        _ = index.query_polygon([0, 1], [0, 1])
+    emsg = "Expected a polygon within a hemisphere"
+    with pytest.raises(ValueError, match=emsg):
+        _ = index.query_polygon([0, 120, -120], [0, 0, 0])
@@ -0,0 +1,80 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :class:`geovista.search.CellLocator`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from geovista.common import from_cartesian, to_lonlat
+from geovista.crs import WGS84
+from geovista.search import LOCATOR_K, CellLocator
+from geovista.transform import transform_mesh, transform_points
+
+
+def test_serialization(lam_uk):
+    """Test string and representation serialization."""
+    locator = CellLocator(lam_uk)
+    expected = f"CellLocator(N CELLS: {lam_uk.n_cells}, k={LOCATOR_K})"
+    assert repr(locator) == expected
+    assert str(locator) == expected
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_cell_centers(lam_uk, monkeypatch, workers):
+    """Test each cell center is located within its cell."""
+    monkeypatch.setattr("geovista.search._LOCATOR_CHUNK_SIZE", 100)
+    lonlat = from_cartesian(lam_uk.cell_centers())
+    locator = CellLocator(lam_uk)
+    result = locator.locate(lonlat[:, 0], lonlat[:, 1], workers=workers)
+    np.testing.assert_array_equal(result, np.arange(lam_uk.n_cells))
+
+
+def test_poi(lam_uk, poi):
+    """Test the cell containing the point-of-interest (POI)."""
+    locator = CellLocator(lam_uk)
+    assert locator.locate(poi.lon, poi.lat) == [poi.cid]
+
+
+def test_vertex(lam_uk, vertex):
+    """Test a vertex shared by several cells is located in the lowest cell-id."""
+    locator = CellLocator(lam_uk)
+    lonlat = to_lonlat(lam_uk.points[vertex.pid])
+    assert locator.locate(*lonlat) == [min(vertex.cids)]
+
+
+@pytest.mark.parametrize(("pids", "expected"), [((1, 2), 0), ((1, 4), 1)])
+def test_edge(lam_uk, pids, expected):
+    """Test a point on an edge shared by two cells is located in the lowest cell-id."""
+    locator = CellLocator(lam_uk)
+    lonlat = to_lonlat(lam_uk.points[list(pids)].mean(axis=0))
+    assert locator.locate(*lonlat) == [expected]
+
+
+def test_outside(lam_uk):
+    """Test points-of-interest outside of the mesh or not finite."""
+    locator = CellLocator(lam_uk)
+    result = locator.locate([-120, np.nan, 0], [-45, 54, np.inf])
+    np.testing.assert_array_equal(result, [-1, -1, -1])
+
+
+def test_crs(lam_uk):
+    """Test locating projected points-of-interest within a projected mesh."""
+    crs = "+proj=eqc"
+    mesh = transform_mesh(lam_uk, crs)
+    lonlat = from_cartesian(lam_uk.cell_centers())
+    xy = transform_points(WGS84, crs, lonlat[:, 0], lonlat[:, 1])
+    result = CellLocator(mesh).locate(xy[:, 0], xy[:, 1])
+    np.testing.assert_array_equal(result, np.arange(lam_uk.n_cells))
+
+
+def test_shape_fail(lam_uk):
+    """Test trap of mismatched points-of-interest."""
+    locator = CellLocator(lam_uk)
+    emsg = "Expected the same number of x and y points-of-interest"
+    with pytest.raises(ValueError, match=emsg):
+        _ = locator.locate([0, 1], [0])
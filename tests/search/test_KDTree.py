@@ -13,10 +13,14 @@ import pytest
 import pyvista as pv
 
 from geovista.common import GV_FIELD_CRS, from_cartesian
+from geovista.config import resources
 from geovista.crs import WGS84, to_wkt
 from geovista.search import (
+    EARTH_RADIUS,
+    KDTREE_CACHE_DIR,
     KDTREE_LEAF_SIZE,
     KDTREE_PREFERENCE,
+    DistanceUnits,
     KDTree,
     SearchPreference,
 )
@@ -135,3 +139,150 @@ def test_cell_quad_points(lam_uk, center):
     lon, lat = lonlat[cid][0], lonlat[cid][1]
     _, idx = kdtree.query(lon, lat, k=4)
     np.testing.assert_array_equal(np.unique(idx), np.sort(center.pids))
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    """Fixture providing an isolated geovista cache directory."""
+    monkeypatch.setitem(resources, "cache_dir", tmp_path)
+    return tmp_path / KDTREE_CACHE_DIR
+
+
+@pytest.mark.parametrize("preference", PREFERENCES)
+def test_persist(lam_uk, cache_dir, preference):
+    """Test persisted kd-tree data points are memory-mapped on reload."""
+    expected = KDTree(lam_uk, preference=preference)
+    kdtree = KDTree(lam_uk, preference=preference, persist=True)
+    assert len(list(cache_dir.glob("*.npy"))) == 2
+    result = KDTree(lam_uk, preference=preference, persist=True)
+    assert isinstance(result._indices, np.memmap)
+    assert result.n_points == expected.n_points
+    np.testing.assert_array_equal(kdtree.points, expected.points)
+    np.testing.assert_array_equal(result.points, expected.points)
+
+
+@pytest.mark.usefixtures("cache_dir")
+def test_persist_query(lam_uk, poi):
+    """Test persisted kd-tree queries the original mesh cell-ids."""
+    _ = KDTree(lam_uk, preference="center", persist=True)
+    kdtree = KDTree(lam_uk, preference="center", persist=True)
+    _, idx = kdtree.query(poi.lon, poi.lat)
+    assert idx == poi.cid
+
+
+@pytest.mark.usefixtures("cache_dir")
+def test_persist_missing(lam_uk):
+    """Test persisted kd-tree query preserves the missing neighbour index."""
+    kdtree = KDTree(lam_uk, persist=True)
+    _, idx = kdtree.query(0.123, 0.456, k=2, distance_upper_bound=1e-9)
+    np.testing.assert_array_equal(idx, kdtree.n_points)
+
+
+def test_persist_key(lam_uk, cache_dir):
+    """Test persisted kd-tree entries are keyed on preference and leaf size."""
+    _ = KDTree(lam_uk, persist=True)
+    _ = KDTree(lam_uk, preference="center", persist=True)
+    _ = KDTree(lam_uk, leaf_size=32, persist=True)
+    assert len(list(cache_dir.glob("*.points.npy"))) == 3
+
+
+def test_persist_corrupt(lam_uk, cache_dir):
+    """Test corrupt persisted kd-tree entry is purged and rebuilt."""
+    expected = KDTree(lam_uk, persist=True).points
+    (fname,) = cache_dir.glob("*.points.npy")
+    fname.write_bytes(b"corrupt")
+    result = KDTree(lam_uk, persist=True)
+    assert result._indices is not None
+    np.testing.assert_array_equal(result.points, expected)
+    assert KDTree._load(fname.name.split(".")[0]) is not None
+
+
+def great_circle(lon, lat, lonlat):
+    """Calculate the great-circle angle (radians) from the point to each lon/lat."""
+    lon, lat = np.radians(lon), np.radians(lat)
+    lons, lats = np.radians(lonlat[:, 0]), np.radians(lonlat[:, 1])
+    cos = np.sin(lat) * np.sin(lats) + np.cos(lat) * np.cos(lats) * np.cos(lons - lon)
+    return np.arccos(np.clip(cos, -1, 1))
+
+
+@pytest.mark.parametrize("persist", [False, True])
+@pytest.mark.parametrize(
+    ("distance", "units"), [(50, "km"), (50_000, "m"), (0.3, "deg"), (0.01, "rad")]
+)
+@pytest.mark.usefixtures("cache_dir")
+def test_query_radius(lam_uk, persist, distance, units):
+    """Test radius query against a brute-force great-circle search."""
+    kdtree = KDTree(lam_uk, preference="center", persist=persist)
+    lonlat = from_cartesian(lam_uk.cell_centers())
+    pois = lonlat[:: lam_uk.n_cells // 50]
+    result = kdtree.query_radius(
+        pois[:, 0], pois[:, 1], distance, units=units, return_distance=True
+    )
+    scale = {"km": EARTH_RADIUS, "m": EARTH_RADIUS * 1e3, "deg": np.degrees(1)}
+    scale = scale.get(units, 1.0)
+    assert result.offsets.shape == (pois.shape[0] + 1,)
+    assert result.offsets[-1] == result.indices.size == result.distances.size
+    for i, (lon, lat) in enumerate(pois[:, :2]):
+        angles = great_circle(lon, lat, lonlat) * scale
+        expected = np.flatnonzero(angles <= distance)
+        actual = slice(result.offsets[i], result.offsets[i + 1])
+        np.testing.assert_array_equal(np.sort(result.indices[actual]), expected)
+        order = np.argsort(result.indices[actual])
+        np.testing.assert_allclose(
+            result.distances[actual][order], angles[expected], atol=1e-6 * scale
+        )
+
+
+def test_query_radius_sort(lam_uk):
+    """Test radius query neighbours are sorted by increasing distance."""
+    kdtree = KDTree(lam_uk, preference="center")
+    result = kdtree.query_radius(
+        [-2, 0], [54, 52], 300, sort=True, return_distance=True
+    )
+    assert np.diff(result.offsets).min() > 0
+    for i in range(2):
+        distances = result.distances[result.offsets[i] : result.offsets[i + 1]]
+        assert np.all(np.diff(distances) >= 0)
+
+
+def test_query_radius_grid(lam_uk, monkeypatch):
+    """Test radius query of saturated kd-tree queries is unchanged."""
+    kdtree = KDTree(lam_uk, preference="center")
+    expected = kdtree.query_radius([-2, 0], [54, 52], 300)
+    monkeypatch.setattr("geovista.search.KDTREE_RADIUS_K", 2)
+    result = kdtree.query_radius([-2, 0], [54, 52], 300)
+    assert kdtree._grid is not None
+    np.testing.assert_array_equal(result.offsets, expected.offsets)
+    for i in range(2):
+        actual = slice(result.offsets[i], result.offsets[i + 1])
+        np.testing.assert_array_equal(
+            np.sort(result.indices[actual]), np.sort(expected.indices[actual])
+        )
+    assert result.distances is None
+
+
+def test_query_radius_empty(lam_uk):
+    """Test radius query without neighbours or points-of-interest."""
+    kdtree = KDTree(lam_uk)
+    result = kdtree.query_radius(0.123, 0.456, 0)
+    np.testing.assert_array_equal(result.offsets, [0, 0])
+    assert result.indices.size == 0
+    result = kdtree.query_radius([], [], 100)
+    np.testing.assert_array_equal(result.offsets, [0])
+
+
+def test_query_radius_units_fail(lam_uk):
+    """Test trap of invalid radius query units."""
+    kdtree = KDTree(lam_uk)
+    options = " or ".join([f"{item!r}" for item in DistanceUnits.values()])
+    emsg = f"Expected distance units of {options}"
+    with pytest.raises(ValueError, match=emsg):
+        _ = kdtree.query_radius(0, 0, 1, units="miles")
+
+
+def test_query_radius_distance_fail(lam_uk):
+    """Test trap of negative radius query distance."""
+    kdtree = KDTree(lam_uk)
+    emsg = "Expected a non-negative distance"
+    with pytest.raises(ValueError, match=emsg):
+        _ = kdtree.query_radius(0, 0, -1)
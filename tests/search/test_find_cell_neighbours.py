@@ -7,7 +7,7 @@
 
 from __future__ import annotations
 
-from geovista.search import find_cell_neighbours
+from geovista.search import CellAdjacency, find_cell_neighbours
 
 
 def test(lam_uk, neighbours):
@@ -15,3 +15,11 @@ def test(lam_uk, neighbours):
     cids = find_cell_neighbours(lam_uk, neighbours.cid)
     assert cids == neighbours.expected
     assert neighbours.cid not in cids
+
+
+def test_adjacency(lam_uk, neighbours):
+    """Test finding neighbouring cells with a reusable adjacency index."""
+    adjacency = CellAdjacency(lam_uk)
+    cids = find_cell_neighbours(lam_uk, neighbours.cid, adjacency=adjacency)
+    assert cids == neighbours.expected
+    assert find_cell_neighbours(lam_uk, [neighbours.cid], adjacency=adjacency) == cids
@@ -0,0 +1,198 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :class:`geovista.transform.ProjectionCache`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import pyvista as pv
+
+import geovista
+from geovista.common import GV_CELL_IDS
+from geovista.pantry.meshes import regular_grid
+from geovista.transform import ProjectionCache, transform_mesh
+
+TGT_CRS = "+proj=robin +lon_0=30"
+
+
+@pytest.fixture
+def mesh():
+    """Fixture providing a regular grid with point and cell data."""
+    result = regular_grid(resolution="r30")
+    # ensure cells are bisected by the seam
+    result.rotate_z(3, inplace=True)
+    result.point_data["points"] = np.arange(result.n_points, dtype=float)
+    result.point_data["ints"] = np.arange(result.n_points) * 7
+    result.cell_data["cells"] = np.arange(result.n_cells, dtype=float)
+    return result
+
+
+def test_miss_hit(mesh):
+    """Test a cache hit returns a new mesh."""
+    cache = ProjectionCache()
+    first = transform_mesh(mesh, TGT_CRS, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert len(cache) == 1
+    second = transform_mesh(mesh, TGT_CRS, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first is not second
+    np.testing.assert_array_equal(first.points, second.points)
+
+
+def test_hit_modified(mesh):
+    """Test in-place modification of a projected mesh preserves the cache entry."""
+    cache = ProjectionCache()
+    first = transform_mesh(mesh, TGT_CRS, cache=cache)
+    expected = first.points.copy()
+    expected_faces = first.faces.copy()
+    assert not np.shares_memory(
+        first.points, cache.get(next(iter(cache._entries)))["points"]
+    )
+    first.points[:, 0] += 1e6
+    connectivity = pv.convert_array(first.GetPolys().GetConnectivityArray())
+    connectivity[:3] = 0
+    first["points"][:] = -1
+    second = transform_mesh(mesh, TGT_CRS, cache=cache)
+    np.testing.assert_array_equal(second.points, expected)
+    assert not np.shares_memory(first.points, second.points)
+    np.testing.assert_array_equal(second.faces, expected_faces)
+    reference = transform_mesh(mesh.copy(), TGT_CRS)
+    np.testing.assert_allclose(second["points"], reference["points"], atol=1e-6)
+
+
+@pytest.mark.parametrize("tgt_crs", [TGT_CRS, "+proj=eqc"])
+def test_identical(mesh, tgt_crs):
+    """Test cached projections are identical to non-cached projections."""
+    expected = transform_mesh(mesh.copy(), tgt_crs)
+    cache = ProjectionCache()
+    for _ in range(2):
+        result = transform_mesh(mesh, tgt_crs, cache=cache)
+        np.testing.assert_array_equal(result.points, expected.points)
+        np.testing.assert_array_equal(result.faces, expected.faces)
+        assert sorted(result.point_data.keys()) == sorted(expected.point_data.keys())
+        assert sorted(result.cell_data.keys()) == sorted(expected.cell_data.keys())
+        np.testing.assert_allclose(result["points"], expected["points"], atol=1e-9)
+        np.testing.assert_array_equal(result["ints"], expected["ints"])
+        np.testing.assert_array_equal(result["cells"], expected["cells"])
+        assert result.active_scalars_name == expected.active_scalars_name
+
+
+def test_input_unchanged(mesh):
+    """Test the input mesh points are not modified."""
+    expected = mesh.points.copy()
+    _ = transform_mesh(mesh, TGT_CRS, cache=ProjectionCache())
+    np.testing.assert_array_equal(mesh.points, expected)
+
+
+def test_cell_data_reattached(mesh):
+    """Test meshes differing only in cell data share the same entry."""
+    cache = ProjectionCache()
+    expected = transform_mesh(mesh, TGT_CRS, cache=cache)
+    mesh.cell_data["cells"] = mesh["cells"] * 2
+    result = transform_mesh(mesh, TGT_CRS, cache=cache)
+    assert cache.hits == 1
+    np.testing.assert_array_equal(result["cells"], expected["cells"] * 2)
+    np.testing.assert_array_equal(result[GV_CELL_IDS], expected[GV_CELL_IDS])
+
+
+def test_point_data_reattached(mesh):
+    """Test meshes differing only in point data share the same entry."""
+    cache = ProjectionCache()
+    _ = transform_mesh(mesh, TGT_CRS, cache=cache)
+    mesh.point_data["points"] = np.sin(mesh["points"])
+    mesh.point_data["vectors"] = np.vstack([mesh["points"]] * 3).T
+    expected = transform_mesh(mesh.copy(), TGT_CRS)
+    result = transform_mesh(mesh, TGT_CRS, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    # vtk interpolates seam points within a cell to single precision
+    np.testing.assert_allclose(result["points"], expected["points"], atol=1e-6)
+    np.testing.assert_allclose(result["vectors"], expected["vectors"], atol=1e-6)
+
+
+def test_version_key(mesh, monkeypatch):
+    """Test the cache key includes the geovista version."""
+    cache = ProjectionCache()
+    _ = transform_mesh(mesh, TGT_CRS, cache=cache)
+    monkeypatch.setattr(geovista, "__version__", "0.0.0")
+    _ = transform_mesh(mesh, TGT_CRS, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"zlevel": 1}, {"zscale": 1e-2}, {"tgt_crs": "+proj=robin"}]
+)
+def test_key(mesh, kwargs):
+    """Test the cache key includes the target CRS and z-axis options."""
+    cache = ProjectionCache()
+    _ = transform_mesh(mesh, TGT_CRS, cache=cache)
+    tgt_crs = kwargs.pop("tgt_crs", TGT_CRS)
+    _ = transform_mesh(mesh, tgt_crs, cache=cache, **kwargs)
+    assert cache.misses == 2
+
+
+def test_eviction(mesh):
+    """Test the least recently used entries are evicted to fit the size bound."""
+    cache = ProjectionCache()
+    _ = transform_mesh(mesh, TGT_CRS, cache=cache)
+    nbytes = cache.nbytes
+    cache = ProjectionCache(maxbytes=int(nbytes * 2.5))
+    for zlevel in range(3):
+        _ = transform_mesh(mesh, TGT_CRS, cache=cache, zlevel=zlevel)
+    assert len(cache) == 2
+    assert cache.nbytes <= cache.maxbytes
+    _ = transform_mesh(mesh, TGT_CRS, cache=cache, zlevel=0)
+    assert cache.misses == 4
+
+
+def test_too_large(mesh):
+    """Test an entry larger than the size bound is not cached in memory."""
+    cache = ProjectionCache(maxbytes=1)
+    _ = transform_mesh(mesh, TGT_CRS, cache=cache)
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_disk(mesh, tmp_path):
+    """Test entries are promoted from the on-disk tier."""
+    expected = transform_mesh(mesh, TGT_CRS, cache=ProjectionCache(cache_dir=tmp_path))
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+    cache = ProjectionCache(cache_dir=tmp_path)
+    result = transform_mesh(mesh, TGT_CRS, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert len(cache) == 1
+    np.testing.assert_array_equal(result.points, expected.points)
+    np.testing.assert_array_equal(result["cells"], expected["cells"])
+
+
+def test_disk_corrupt(mesh, tmp_path):
+    """Test a corrupt on-disk entry is purged and rebuilt."""
+    _ = transform_mesh(mesh, TGT_CRS, cache=ProjectionCache(cache_dir=tmp_path))
+    (fname,) = tmp_path.glob("*.npz")
+    fname.write_bytes(b"corrupt")
+    cache = ProjectionCache(cache_dir=tmp_path)
+    _ = transform_mesh(mesh, TGT_CRS, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert fname.stat().st_size > len(b"corrupt")
+
+
+def test_disk_eviction(mesh, tmp_path):
+    """Test the on-disk tier is bounded in size."""
+    cache = ProjectionCache(cache_dir=tmp_path, disk_maxbytes=1)
+    for zlevel in range(3):
+        _ = transform_mesh(mesh, TGT_CRS, cache=cache, zlevel=zlevel)
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+
+def test_clear(mesh, tmp_path):
+    """Test purging the cache."""
+    cache = ProjectionCache(cache_dir=tmp_path)
+    _ = transform_mesh(mesh, TGT_CRS, cache=cache)
+    cache.clear()
+    assert len(cache) == cache.nbytes == cache.hits == cache.misses == 0
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+    cache.clear(disk=True)
+    assert len(list(tmp_path.glob("*.npz"))) == 0
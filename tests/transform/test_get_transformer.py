@@ -0,0 +1,101 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.transform.get_transformer`."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pyproj import CRS, Transformer
+import pytest
+
+from geovista.crs import WGS84
+from geovista.transform import (
+    TRANSFORMER_CACHE_SIZE,
+    get_transformer,
+    transform_points,
+    transformer_cache_clear,
+    transformer_cache_info,
+)
+
+ROBINSON = CRS.from_user_input("+proj=robin")
+
+
+@pytest.fixture(autouse=True)
+def clear():
+    """Fixture to purge the transformer cache around each test."""
+    transformer_cache_clear()
+    yield
+    transformer_cache_clear()
+
+
+def test_cache_hit():
+    """Test the same transformer instance is returned for the same CRS pair."""
+    transformer = get_transformer(WGS84, ROBINSON)
+    assert isinstance(transformer, Transformer)
+    info = transformer_cache_info()
+    assert info.hits == 0
+    assert info.misses == 1
+    assert info.currsize == 1
+    assert info.maxsize == TRANSFORMER_CACHE_SIZE
+    assert get_transformer(WGS84, ROBINSON) is transformer
+    info = transformer_cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_cache_crs_like():
+    """Test equivalent CRS-like inputs share the same cached transformer."""
+    transformer = get_transformer(WGS84, ROBINSON)
+    assert get_transformer(WGS84.to_wkt(), ROBINSON.to_wkt()) is transformer
+    assert transformer_cache_info().hits == 1
+
+
+def test_cache_key_always_xy():
+    """Test the transformer cache is keyed on the axis order."""
+    xy = get_transformer(WGS84, ROBINSON)
+    yx = get_transformer(WGS84, ROBINSON, always_xy=False)
+    assert xy is not yx
+    info = transformer_cache_info()
+    assert info.hits == 0
+    assert info.misses == 2
+    assert info.currsize == 2
+
+
+def test_cache_key_crs_pair():
+    """Test the transformer cache is keyed on the ordered CRS pair."""
+    forward = get_transformer(WGS84, ROBINSON)
+    inverse = get_transformer(ROBINSON, WGS84)
+    assert forward is not inverse
+    assert transformer_cache_info().misses == 2
+
+
+def test_cache_clear():
+    """Test purging the transformer cache resets the statistics."""
+    _ = get_transformer(WGS84, ROBINSON)
+    _ = get_transformer(WGS84, ROBINSON)
+    transformer_cache_clear()
+    info = transformer_cache_info()
+    assert info.hits == info.misses == info.currsize == 0
+
+
+def test_transform_points_hit():
+    """Test repeated point transformations reuse the cached transformer."""
+    for _ in range(3):
+        _ = transform_points(src_crs=WGS84, tgt_crs=ROBINSON, xs=[0, 10], ys=[0, 10])
+    info = transformer_cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
+def test_threads():
+    """Test the cached transformer is shared across threads."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(get_transformer, WGS84, ROBINSON) for _ in range(16)]
+        transformers = {id(future.result()) for future in futures}
+    assert len(transformers) == 1
+    info = transformer_cache_info()
+    assert info.hits + info.misses == 16
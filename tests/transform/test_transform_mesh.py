@@ -0,0 +1,80 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.transform.transform_mesh`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from geovista.pantry.meshes import regular_grid
+from geovista.transform import ProjectionCache, transform_mesh
+
+TGT_CRS = "+proj=robin +lon_0=30"
+
+
+@pytest.fixture
+def mesh():
+    """Fixture providing a regular grid with cell data."""
+    result = regular_grid(resolution="r30")
+    # ensure cells are bisected by the seam
+    result.rotate_z(3, inplace=True)
+    result.cell_data["cells"] = np.arange(result.n_cells, dtype=float)
+    return result
+
+
+def test_mesh_unmodified(mesh):
+    """Test the central meridian is handled without modifying the mesh."""
+    expected = mesh.copy(deep=True)
+    _ = transform_mesh(mesh, TGT_CRS)
+    np.testing.assert_array_equal(mesh.points, expected.points)
+    assert mesh.point_data.keys() == expected.point_data.keys()
+    assert mesh.cell_data.keys() == expected.cell_data.keys()
+
+
+def test_central_meridian(mesh):
+    """Test the projection relative to the central meridian is repeatable."""
+    result = transform_mesh(mesh, TGT_CRS)
+    other = transform_mesh(mesh, TGT_CRS)
+    np.testing.assert_array_equal(result.points, other.points)
+    np.testing.assert_array_equal(result.faces, other.faces)
+    # equivalent to projecting a rotated mesh with no central meridian
+    rotated = mesh.rotate_z(-30, inplace=False)
+    expected = transform_mesh(rotated, "+proj=robin")
+    assert result.n_cells == expected.n_cells
+    # the order and triangulation of the sliced cells is not guaranteed
+    area = result.compute_cell_sizes()["Area"].sum()
+    expected_area = expected.compute_cell_sizes()["Area"].sum()
+    np.testing.assert_allclose(area, expected_area, rtol=1e-5)
+    np.testing.assert_array_equal(np.sort(result["cells"]), np.sort(expected["cells"]))
+
+
+@pytest.mark.parametrize("max_error", [1e2, 1e4])
+def test_max_error(mesh, max_error):
+    """Test approximate projection of the mesh is within the maximum error."""
+    expected = transform_mesh(mesh, TGT_CRS)
+    result = transform_mesh(mesh, TGT_CRS, max_error=max_error)
+    np.testing.assert_array_equal(result.faces, expected.faces)
+    np.testing.assert_array_equal(result["cells"], expected["cells"])
+    error = np.abs(result.points - expected.points)
+    assert error.max() <= max_error
+    assert error.max() > 0
+
+
+def test_max_error_cache(mesh):
+    """Test approximate projection of the mesh with a projected geometry cache."""
+    cache = ProjectionCache()
+    expected = transform_mesh(mesh, TGT_CRS, max_error=1e4)
+    result = transform_mesh(mesh, TGT_CRS, max_error=1e4, cache=cache)
+    np.testing.assert_array_equal(result.points, expected.points)
+    # the maximum error contributes to the cache key
+    exact = transform_mesh(mesh, TGT_CRS, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert not np.array_equal(exact.points, result.points)
+    result = transform_mesh(mesh, TGT_CRS, max_error=1e4, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 2)
+    np.testing.assert_array_equal(result.points, expected.points)
+    np.testing.assert_array_equal(result["cells"], expected["cells"])
@@ -7,14 +7,18 @@
 
 from __future__ import annotations
 
+import threading
+from time import perf_counter
+
 import numpy as np
 from pyproj import Transformer
-from pyproj.exceptions import CRSError
+from pyproj.exceptions import CRSError, ProjError
 import pytest
 
 from geovista.common import wrap
 from geovista.crs import WGS84
-from geovista.transform import transform_points
+import geovista.transform as gvt
+from geovista.transform import transform_points, transformer_cache_clear
 
 
 @pytest.mark.parametrize(
@@ -119,6 +123,7 @@ def test_transform(mocker, zoffset, reshape, roundtrip):
     else:
         shape = (size,)
     shape = (*shape, 3)
+    transformer_cache_clear()
     spy_from_crs = mocker.spy(Transformer, "from_crs")
     spy_transform = mocker.spy(Transformer, "transform")
     if roundtrip:
@@ -144,3 +149,251 @@ def test_transform(mocker, zoffset, reshape, roundtrip):
     assert spy_from_crs.call_count == call_count
     assert spy_transform.call_count == call_count
     assert result.shape == shape
+
+
+@pytest.mark.parametrize("bad", [0, -1])
+def test_workers_fail(bad):
+    """Test trap of non-positive number of workers."""
+    data = np.empty(1)
+    emsg = "Cannot transform points, 'workers' must be positive"
+    with pytest.raises(ValueError, match=emsg):
+        _ = transform_points(
+            src_crs=WGS84, tgt_crs=WGS84, xs=data, ys=data, workers=bad
+        )
+
+
+@pytest.mark.parametrize("bad", [0, -1])
+def test_chunk_size_fail(bad):
+    """Test trap of non-positive chunk size."""
+    data = np.empty(1)
+    emsg = "Cannot transform points, 'chunk_size' must be positive"
+    with pytest.raises(ValueError, match=emsg):
+        _ = transform_points(
+            src_crs=WGS84, tgt_crs=WGS84, xs=data, ys=data, chunk_size=bad
+        )
+
+
+@pytest.mark.parametrize("zoffset", [None, 100])
+@pytest.mark.parametrize("reshape", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_transform_chunks(mocker, zoffset, reshape, chunk_size):
+    """Test parallel chunked transformation is identical to serial."""
+    rng = np.random.default_rng(seed=0)
+    xs = rng.uniform(low=-180, high=180, size=(size := 60))
+    ys = rng.uniform(low=-90, high=90, size=size)
+    zs = rng.uniform(low=0, high=zoffset, size=size) if zoffset else None
+    if reshape:
+        shape = (6, 10)
+        xs, ys = xs.reshape(shape), ys.reshape(shape)
+        if zs is not None:
+            zs = zs.reshape(shape)
+    original = xs.copy()
+    tgt_crs = "+proj=robin"
+    expected = transform_points(
+        src_crs=WGS84, tgt_crs=tgt_crs, xs=xs, ys=ys, zs=zs, workers=1
+    )
+    spy = mocker.spy(Transformer, "transform")
+    result = transform_points(
+        src_crs=WGS84,
+        tgt_crs=tgt_crs,
+        xs=xs,
+        ys=ys,
+        zs=zs,
+        workers=4,
+        chunk_size=chunk_size,
+    )
+    np.testing.assert_array_equal(result, expected)
+    np.testing.assert_array_equal(xs, original)
+    assert spy.call_count == int(np.ceil(size / chunk_size))
+
+
+def test_transform_chunks_serial(mocker):
+    """Test serial transformation when points fit within one chunk."""
+    spy = mocker.spy(Transformer, "transform")
+    data = np.arange(10, dtype=float)
+    _ = transform_points(
+        src_crs=WGS84, tgt_crs="+proj=eqc", xs=data, ys=data, workers=4, chunk_size=10
+    )
+    assert spy.call_count == 1
+
+
+def test_transform_chunks_trap():
+    """Test parallel chunked transformation propagates worker errors."""
+    xs = np.array([0, 0, 0, 0], dtype=float)
+    ys = np.array([0, 10, 100, 20], dtype=float)
+    emsg = "transform error"
+    with pytest.raises(ProjError, match=emsg):
+        _ = transform_points(
+            src_crs=WGS84, tgt_crs="+proj=eqc", xs=xs, ys=ys, workers=2, chunk_size=1
+        )
+    result = transform_points(
+        src_crs=WGS84,
+        tgt_crs="+proj=eqc",
+        xs=xs,
+        ys=ys,
+        trap=False,
+        workers=2,
+        chunk_size=1,
+    )
+    assert np.isinf(result[2, :2]).all()
+
+
+def test_transform_chunks_executor(monkeypatch):
+    """Test parallel chunked transformation reuses the shared worker threads."""
+    data = np.arange(64, dtype=float)
+    kwargs = {"src_crs": WGS84, "tgt_crs": "+proj=robin", "xs": data, "ys": data}
+    _ = transform_points(**kwargs, workers=2, chunk_size=8)
+    executor = gvt._EXECUTOR
+    assert executor is not None
+
+    threads = set()
+    transform = Transformer.transform
+
+    def spy(self: Transformer, *args: object, **kwargs: object) -> object:
+        threads.add(threading.get_ident())
+        return transform(self, *args, **kwargs)
+
+    monkeypatch.setattr(Transformer, "transform", spy)
+    for _ in range(3):
+        _ = transform_points(**kwargs, workers=2, chunk_size=8)
+    assert gvt._EXECUTOR is executor
+    assert 0 < len(threads) <= gvt._EXECUTOR_WORKERS
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.parametrize("bad", [0, -1.0])
+def test_max_error_fail(bad):
+    """Test trap of non-positive maximum approximation error."""
+    data = np.arange(2, dtype=float)
+    emsg = "Cannot transform points, 'max_error' must be positive"
+    with pytest.raises(ValueError, match=emsg):
+        _ = transform_points(
+            src_crs=WGS84, tgt_crs="+proj=robin", xs=data, ys=data, max_error=bad
+        )
+
+
+def test_max_error_src_crs_fail():
+    """Test trap of approximate transformation from a projected CRS."""
+    data = np.arange(2, dtype=float)
+    emsg = "Cannot approximately transform points, requires a geographic source CRS"
+    with pytest.raises(ValueError, match=emsg):
+        _ = transform_points(
+            src_crs="+proj=robin", tgt_crs=WGS84, xs=data, ys=data, max_error=1
+        )
+
+
+def test_max_error_zs_fail():
+    """Test trap of approximate transformation with z-values."""
+    data = np.arange(2, dtype=float)
+    emsg = "Cannot approximately transform points, 'zs' is not supported"
+    with pytest.raises(ValueError, match=emsg):
+        _ = transform_points(
+            src_crs=WGS84,
+            tgt_crs="+proj=robin",
+            xs=data,
+            ys=data,
+            zs=data,
+            max_error=1,
+        )
+
+
+@pytest.mark.parametrize(
+    "tgt_crs", ["+proj=robin", "+proj=ortho +lat_0=45", "+proj=eqearth"]
+)
+@pytest.mark.parametrize("max_error", [1e2, 1e4])
+@pytest.mark.parametrize("reshape", [False, True])
+def test_max_error(tgt_crs, max_error, reshape):
+    """Test approximate transformation is within the maximum error."""
+    rng = np.random.default_rng(seed=0)
+    xs = rng.uniform(low=-180, high=180, size=(size := 10_000))
+    ys = rng.uniform(low=-90, high=90, size=size)
+    if reshape:
+        shape = (100, 100)
+        xs, ys = xs.reshape(shape), ys.reshape(shape)
+    expected = transform_points(
+        src_crs=WGS84, tgt_crs=tgt_crs, xs=xs, ys=ys, trap=False
+    )
+    result = transform_points(
+        src_crs=WGS84,
+        tgt_crs=tgt_crs,
+        xs=xs,
+        ys=ys,
+        trap=False,
+        max_error=max_error,
+        workers=2,
+        chunk_size=1_000,
+    )
+    assert result.shape == expected.shape
+    finite = np.isfinite(expected)
+    np.testing.assert_array_equal(np.isfinite(result), finite)
+    assert np.abs(result[finite] - expected[finite]).max() <= max_error
+
+
+def test_max_error_warn():
+    """Test warning of spatial points unable to meet the maximum error."""
+    rng = np.random.default_rng(seed=0)
+    xs = rng.uniform(low=-180, high=180, size=(size := 10_000))
+    ys = rng.uniform(low=-90, high=90, size=size)
+    # the discontinuity at longitude -143 is within a table tile
+    tgt_crs = "+proj=robin +lon_0=37"
+    expected = transform_points(src_crs=WGS84, tgt_crs=tgt_crs, xs=xs, ys=ys)
+    wmsg = "geovista unable to meet 'max_error=100.0' for"
+    with pytest.warns(UserWarning, match=wmsg):
+        result = transform_points(
+            src_crs=WGS84, tgt_crs=tgt_crs, xs=xs, ys=ys, max_error=100.0
+        )
+    assert np.abs(result - expected).max() <= 100.0
+
+
+def test_max_error_trap():
+    """Test approximate transformation traps errors of exact transformation."""
+    xs = np.array([0, 0, 0, 0], dtype=float)
+    ys = np.array([0, 10, 100, 20], dtype=float)
+    emsg = "transform error"
+    with pytest.raises(ProjError, match=emsg):
+        _ = transform_points(
+            src_crs=WGS84, tgt_crs="+proj=eqc", xs=xs, ys=ys, max_error=1
+        )
+    xs[1] = np.nan
+    result = transform_points(
+        src_crs=WGS84, tgt_crs="+proj=eqc", xs=xs, ys=ys, trap=False, max_error=1
+    )
+    assert np.isinf(result[2, :2]).all()
+    assert not np.isfinite(result[1, :2]).any()
+    np.testing.assert_allclose(result[[0, 3], 1], [0, 2_226_389.8158654715])
+
+
+def test_max_error_gather(mocker):
+    """Test approximate transformation from a cached table is a pure gather."""
+    xs, ys = (
+        grid.ravel()
+        for grid in np.meshgrid(np.linspace(-180, 180, 361), np.linspace(-90, 90, 181))
+    )
+    kwargs = {"src_crs": WGS84, "tgt_crs": "+proj=robin", "xs": xs, "ys": ys}
+    expected = transform_points(**kwargs, max_error=1e3)
+    spy = mocker.spy(Transformer, "transform")
+    result = transform_points(**kwargs, max_error=1e3)
+    assert spy.call_count == 0
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_max_error_speedup():
+    """Test approximate transformation from a cached table beats exact PROJ."""
+    xs, ys = (
+        grid.ravel()
+        for grid in np.meshgrid(
+            np.linspace(-180, 180, 2_000), np.linspace(-90, 90, 1_000)
+        )
+    )
+    kwargs = {"src_crs": WGS84, "tgt_crs": "+proj=robin", "xs": xs, "ys": ys}
+    _ = transform_points(**kwargs, max_error=1e3)
+
+    def best(**options: object) -> float:
+        timings = []
+        for _ in range(3):
+            start = perf_counter()
+            _ = transform_points(**kwargs, workers=1, **options)
+            timings.append(perf_counter() - start)
+        return min(timings)
+
+    assert best(max_error=1e3) < best()